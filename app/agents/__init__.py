@@ -2,10 +2,20 @@
 Agent Framework
 
 Provides base agent infrastructure and specific agent implementations.
+
+Exports are loaded lazily (PEP 562) to keep import time low.
 """
 
-from .base import BaseAgent, AgentFeature
-from .tracing import AgentTracer, trace_feature, get_tracer
+import importlib
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    "BaseAgent": ".base",
+    "AgentFeature": ".base",
+    "AgentTracer": ".tracing",
+    "trace_feature": ".tracing",
+    "get_tracer": ".tracing",
+}
 
 __all__ = [
     "BaseAgent",
@@ -14,3 +24,16 @@ __all__ = [
     "trace_feature",
     "get_tracer",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -4,10 +4,18 @@ Base Agent Framework
 Provides the foundational agent class with feature composition support.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Protocol, runtime_checkable
+from types import MappingProxyType
+from typing import Any, Mapping, Protocol, runtime_checkable
 
-from app.providers import LLMProvider, Message, get_provider
+from app.providers import (
+    LLMProvider,
+    Message,
+    ProviderPool,
+    RateLimitedProvider,
+    get_provider,
+)
 
 
 @runtime_checkable
@@ -35,7 +43,7 @@ class AgentFeature(Protocol):
     async def execute(
         self,
         provider: LLMProvider,
-        system_prompt: str,
+        system_message: Message,
         **kwargs,
     ) -> Any:
         """
@@ -43,7 +51,7 @@ class AgentFeature(Protocol):
 
         Args:
             provider: LLM provider to use.
-            system_prompt: Agent's system/persona prompt.
+            system_message: Agent's shared system message (persona prompt).
             **kwargs: Feature-specific arguments.
 
         Returns:
@@ -75,6 +83,8 @@ class BaseAgent(ABC):
                 self.register_feature(MyFeature())
     """
 
+    __slots__ = ("_provider", "_features", "_system_message")
+
     def __init__(
         self,
         provider: LLMProvider | None = None,
@@ -83,12 +93,22 @@ class BaseAgent(ABC):
         """
         Initialize the agent.
 
+        The provider is wrapped with the shared per-provider rate limiter
+        and retry policy, so every completion issued by the agent or its
+        features is throttled. A ProviderPool is used as-is (its members
+        are already wrapped).
+
         Args:
-            provider: Optional LLM provider instance.
+            provider: Optional LLM provider instance or ProviderPool.
             provider_name: Optional provider name (uses default if not specified).
         """
-        self._provider = provider or get_provider(provider_name)
+        provider = provider or get_provider(provider_name)
+        if not isinstance(provider, (RateLimitedProvider, ProviderPool)):
+            provider = RateLimitedProvider(provider)
+        self._provider = provider
         self._features: dict[str, AgentFeature] = {}
+        # persona_prompt is constant per agent, so the system message is built once
+        self._system_message = Message(role="system", content=self.persona_prompt)
 
     @property
     @abstractmethod
@@ -107,9 +127,18 @@ class BaseAgent(ABC):
         return self._provider
 
     @property
-    def features(self) -> dict[str, AgentFeature]:
-        """Get all registered features."""
-        return self._features.copy()
+    def system_message(self) -> Message:
+        """Get the shared system message carrying the persona prompt."""
+        return self._system_message
+
+    @property
+    def features(self) -> Mapping[str, AgentFeature]:
+        """
+        Get a read-only view of registered features.
+
+        Use register_feature() / unregister_feature() to modify.
+        """
+        return MappingProxyType(self._features)
 
     def register_feature(self, feature: AgentFeature) -> None:
         """
@@ -162,7 +191,7 @@ class BaseAgent(ABC):
         feature = self._features[feature_name]
         return await feature.execute(
             provider=self._provider,
-            system_prompt=self.persona_prompt,
+            system_message=self._system_message,
             **kwargs,
         )
 
@@ -171,24 +200,36 @@ class BaseAgent(ABC):
         **kwargs,
     ) -> dict[str, Any]:
         """
-        Execute all registered features.
+        Execute all registered features concurrently.
 
         Args:
             **kwargs: Arguments passed to all features.
 
         Returns:
-            Dict mapping feature names to their results.
+            Dict mapping feature names to their results
+            ({"error": ...} for features that raised).
         """
-        results = {}
-        for name, feature in self._features.items():
-            try:
-                results[name] = await feature.execute(
+        names = list(self._features)
+        outcomes = await asyncio.gather(
+            *(
+                feature.execute(
                     provider=self._provider,
-                    system_prompt=self.persona_prompt,
+                    system_message=self._system_message,
                     **kwargs,
                 )
-            except Exception as e:
-                results[name] = {"error": str(e)}
+                for feature in self._features.values()
+            ),
+            return_exceptions=True,
+        )
+
+        results = {}
+        for name, outcome in zip(names, outcomes):
+            if isinstance(outcome, Exception):
+                results[name] = {"error": str(outcome)}
+            elif isinstance(outcome, BaseException):
+                raise outcome  # e.g. CancelledError
+            else:
+                results[name] = outcome
         return results
 
     async def complete(
@@ -209,7 +250,7 @@ class BaseAgent(ABC):
             Agent's response as string.
         """
         messages = [
-            Message(role="system", content=self.persona_prompt),
+            self._system_message,
             Message(role="user", content=user_message),
         ]
         response = await self._provider.complete(
@@ -2,22 +2,30 @@
 Forseti 461 Agent
 
 The impartial guardian of truth and the contribution charter for Audierne2026.
+
+Exports are loaded lazily (PEP 562) so importing the models does not pull in
+the agent and LLM provider stack.
 """
 
-from .agent import ForsetiAgent
-from .models import (
-    ValidationResult,
-    ClassificationResult,
-    WordingResult,
-    FullValidationResult,
-    ContributionInput,
-    BatchItem,
-    BatchResult,
-    CATEGORIES,
-    CHARTER_VIOLATIONS,
-    CHARTER_ENCOURAGED,
-)
-from .prompts import PERSONA_PROMPT, CATEGORY_DESCRIPTIONS
+import importlib
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    "ForsetiAgent": ".agent",
+    "ValidationResult": ".models",
+    "ClassificationResult": ".models",
+    "WordingResult": ".models",
+    "FullValidationResult": ".models",
+    "ContributionInput": ".models",
+    "BatchItem": ".models",
+    "BatchResult": ".models",
+    "CATEGORIES": ".models",
+    "CATEGORIES_SET": "app.prompts.constants",
+    "CHARTER_VIOLATIONS": ".models",
+    "CHARTER_ENCOURAGED": ".models",
+    "PERSONA_PROMPT": ".prompts",
+    "CATEGORY_DESCRIPTIONS": ".prompts",
+}
 
 __all__ = [
     "ForsetiAgent",
@@ -29,8 +37,22 @@ __all__ = [
     "BatchItem",
     "BatchResult",
     "CATEGORIES",
+    "CATEGORIES_SET",
     "CATEGORY_DESCRIPTIONS",
     "CHARTER_VIOLATIONS",
     "CHARTER_ENCOURAGED",
     "PERSONA_PROMPT",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -7,11 +7,19 @@ The impartial guardian of truth and the contribution charter.
 import argparse
 import asyncio
 import json
+import os
+from dataclasses import replace
+from pathlib import Path
+from typing import AsyncIterator, Callable
+
+import orjson
 
 from app.providers import LLMProvider
 from app.agents.base import BaseAgent
 from app.agents.tracing import AgentTracer, get_tracer
 
+from .cache import normalize_text
+from .coalescer import ValidationCoalescer
 from .models import (
     FullValidationResult,
     ValidationResult,
@@ -19,16 +27,28 @@ from .models import (
     WordingResult,
     BatchItem,
     BatchResult,
+    BatchResponse,
+    BATCH_RESULT_ADAPTER,
     CATEGORIES,
 )
-from .prompts import PERSONA_PROMPT, BATCH_VALIDATION_PROMPT
+from .prompts import PERSONA_PROMPT, render_batch_validation
+from .streaming import ReasoningExtractor
 from .features import (
     CharterValidationFeature,
     CategoryClassificationFeature,
+    CombinedValidationFeature,
     WordingCorrectionFeature,
+    RECOVERABLE_ERRORS,
 )
 
 
+# Sub-batch limits for validate_batch (items per LLM call, estimated input tokens)
+BATCH_CHUNK_SIZE = 10
+BATCH_TOKEN_BUDGET = 6000
+BATCH_ITEM_TOKEN_OVERHEAD = 20
+BATCH_MAX_CONCURRENCY = int(os.getenv("FORSETI_BATCH_CONCURRENCY", "4"))
+
+
 class ForsetiAgent(BaseAgent):
     """
     Forseti 461 - Charter validation agent for Audierne2026.
@@ -36,6 +56,7 @@ class ForsetiAgent(BaseAgent):
     Features:
     - Charter validation: Check contributions against charter rules
     - Category classification: Assign contributions to categories
+    - Combined validation: Both of the above in a single LLM call
     - Wording correction: Suggest improvements (optional)
 
     Example:
@@ -43,6 +64,8 @@ class ForsetiAgent(BaseAgent):
         result = await agent.validate(title="...", body="...")
     """
 
+    __slots__ = ("_tracer", "_coalescer")
+
     def __init__(
         self,
         provider: LLMProvider | None = None,
@@ -54,7 +77,8 @@ class ForsetiAgent(BaseAgent):
         Initialize Forseti agent.
 
         Args:
-            provider: Optional LLM provider instance.
+            provider: Optional LLM provider instance, or a ProviderPool to
+                spread calls (including validate_batch sub-batches) across endpoints.
             provider_name: Optional provider name ("gemini", "claude", etc.).
             enable_wording: If True, enable wording correction feature.
             tracer: Optional custom tracer (uses global tracer if None).
@@ -64,6 +88,7 @@ class ForsetiAgent(BaseAgent):
         # Register core features
         self.register_feature(CharterValidationFeature())
         self.register_feature(CategoryClassificationFeature())
+        self.register_feature(CombinedValidationFeature())
 
         # Optional features
         if enable_wording:
@@ -72,6 +97,9 @@ class ForsetiAgent(BaseAgent):
         # Tracer
         self._tracer = tracer or get_tracer()
 
+        # Micro-batcher for validate(coalesce=True), created on first use
+        self._coalescer: ValidationCoalescer | None = None
+
     @property
     def persona_prompt(self) -> str:
         return PERSONA_PROMPT
@@ -81,6 +109,8 @@ class ForsetiAgent(BaseAgent):
         title: str,
         body: str,
         category: str | None = None,
+        coalesce: bool = False,
+        on_partial: Callable[[str], None] | None = None,
     ) -> FullValidationResult:
         """
         Validate a contribution (charter + classification).
@@ -89,6 +119,10 @@ class ForsetiAgent(BaseAgent):
             title: Contribution title.
             body: Contribution body.
             category: Optional existing category.
+            coalesce: If True, merge with concurrent validate() calls into a
+                single batch LLM call (adds up to the coalescing window of latency).
+            on_partial: Optional callback receiving the raw response text
+                generated so far (streams the LLM call; ignored when coalescing).
 
         Returns:
             FullValidationResult with validation and classification.
@@ -99,37 +133,36 @@ class ForsetiAgent(BaseAgent):
             input={"title": title, "body": body, "category": category},
             tags=["forseti", "validation"],
         ) as trace:
-            # Step 1: Charter validation
-            with self._tracer.span(
-                name="charter_validation",
-                input={"title": title, "body": body},
-                span_type="llm",
-            ) as charter_span:
-                validation: ValidationResult = await self.execute_feature(
-                    "charter_validation",
-                    title=title,
-                    body=body,
-                )
-                charter_span.update(
-                    output=validation.model_dump(),
-                    metadata={"confidence": validation.confidence},
-                )
+            if coalesce:
+                result = await self._validate_coalesced(title, body, category)
+                if trace:
+                    trace.update(output=result.to_dict(), metadata={"coalesced": True})
+                return result
 
-            # Step 2: Category classification
+            # Charter validation + classification fused into one LLM call
             with self._tracer.span(
-                name="category_classification",
+                name="combined_validation",
                 input={"title": title, "body": body, "current_category": category},
                 span_type="llm",
-            ) as category_span:
-                classification: ClassificationResult = await self.execute_feature(
-                    "category_classification",
+            ) as combined_span:
+                validation: ValidationResult
+                classification: ClassificationResult
+                validation, classification = await self.execute_feature(
+                    "combined_validation",
                     title=title,
                     body=body,
                     current_category=category,
+                    on_partial=on_partial,
                 )
-                category_span.update(
-                    output=classification.model_dump(),
-                    metadata={"confidence": classification.confidence},
+                combined_span.update(
+                    output={
+                        "charter": validation.to_dict(),
+                        "category": classification.to_dict(),
+                    },
+                    metadata={
+                        "charter_confidence": validation.confidence,
+                        "category_confidence": classification.confidence,
+                    },
                 )
 
             # Build result
@@ -149,7 +182,7 @@ class ForsetiAgent(BaseAgent):
             # Update trace with final output
             if trace:
                 trace.update(
-                    output=result.model_dump(),
+                    output=result.to_dict(),
                     metadata={
                         "is_valid": result.is_valid,
                         "category": result.category,
@@ -159,6 +192,82 @@ class ForsetiAgent(BaseAgent):
 
         return result
 
+    async def validate_stream(
+        self,
+        title: str,
+        body: str,
+        category: str | None = None,
+    ) -> AsyncIterator[str | FullValidationResult]:
+        """
+        Validate a contribution, yielding reasoning text as it is generated.
+
+        Yields str chunks of the charter and category reasoning while the LLM
+        responds, then the FullValidationResult as the last item. Cached
+        results and providers without streaming yield the result only.
+
+        Args:
+            title: Contribution title.
+            body: Contribution body.
+            category: Optional existing category.
+
+        Yields:
+            Reasoning text chunks, then the FullValidationResult.
+        """
+        chunks: asyncio.Queue[str] = asyncio.Queue()
+        extractor = ReasoningExtractor()
+
+        def on_partial(text: str) -> None:
+            delta = extractor.feed(text)
+            if delta:
+                chunks.put_nowait(delta)
+
+        # Validation runs as its own task so its trace context stays intact
+        # while this generator is suspended between chunks
+        task = asyncio.ensure_future(
+            self.validate(title, body, category, on_partial=on_partial)
+        )
+        try:
+            while not task.done():
+                getter = asyncio.ensure_future(chunks.get())
+                await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+                if getter.done():
+                    yield getter.result()
+                else:
+                    getter.cancel()
+            while not chunks.empty():
+                yield chunks.get_nowait()
+            yield task.result()
+        finally:
+            task.cancel()
+
+    async def _validate_coalesced(
+        self,
+        title: str,
+        body: str,
+        category: str | None,
+    ) -> FullValidationResult:
+        """Validate through the shared micro-batcher."""
+        if self._coalescer is None:
+            self._coalescer = ValidationCoalescer(self)
+
+        with self._tracer.span(
+            name="coalesced_validation",
+            input={"title": title, "body": body, "current_category": category},
+            span_type="llm",
+        ) as span:
+            batch_result = await self._coalescer.submit(title, body, category)
+            span.update(output=batch_result.to_dict())
+
+        return FullValidationResult(
+            is_valid=batch_result.is_valid,
+            category=batch_result.category,
+            original_category=category,
+            violations=batch_result.violations,
+            encouraged_aspects=batch_result.encouraged_aspects,
+            reasoning=batch_result.reasoning,
+            confidence=batch_result.confidence,
+        )
+
     async def validate_charter(
         self,
         title: str,
@@ -231,66 +340,233 @@ class ForsetiAgent(BaseAgent):
     async def validate_batch(
         self,
         items: list[BatchItem],
+        output_jsonl: Path | None = None,
     ) -> list[BatchResult]:
         """
-        Validate multiple contributions in a single call.
+        Validate multiple contributions.
+
+        Near-duplicate items are folded onto a recent representative so
+        the LLM only sees distinct contributions. Distinct items are split
+        into sub-batches bounded by BATCH_CHUNK_SIZE and BATCH_TOKEN_BUDGET,
+        which run concurrently (at most BATCH_MAX_CONCURRENCY at a time,
+        env FORSETI_BATCH_CONCURRENCY). Results are expanded back to every
+        input item, in input order; items whose sub-batch failed or that the
+        LLM skipped get fail-open defaults instead of being dropped.
+
+        With output_jsonl, every successful sub-batch is appended to the file
+        as it completes, and items already present there are not re-sent,
+        so a crashed run can be resumed without paying for finished items.
 
         Args:
             items: List of BatchItem to validate.
+            output_jsonl: Optional checkpoint file (one BatchResult per line).
 
         Returns:
             List of BatchResult, one per input item.
         """
-        items_json = json.dumps(
-            [item.model_dump() for item in items],
-            ensure_ascii=False,
+        by_id = _load_checkpoint(output_jsonl) if output_jsonl else {}
+        pending = [item for item in items if item.id not in by_id]
+
+        representatives, aliases = self._dedupe_batch(pending)
+        alias_ids: dict[str, list[str]] = {}
+        for item_id, rep_id in aliases.items():
+            alias_ids.setdefault(rep_id, []).append(item_id)
+
+        semaphore = asyncio.Semaphore(BATCH_MAX_CONCURRENCY)
+
+        async def _process_chunk(chunk: list[BatchItem]) -> list[BatchResult]:
+            async with semaphore:
+                try:
+                    results = await self._validate_chunk(chunk)
+                except RECOVERABLE_ERRORS as e:
+                    # Safe defaults on error (never checkpointed, so retried on resume)
+                    return _fallback_results(chunk, e)
+
+            # Items the LLM skipped get safe defaults too (also retried on resume)
+            returned = {result.id for result in results}
+            missing = [item for item in chunk if item.id not in returned]
+
+            if output_jsonl:
+                expanded = [
+                    replace(result, id=item_id)
+                    for result in results
+                    for item_id in alias_ids.get(result.id, ())
+                ]
+                await asyncio.to_thread(_append_checkpoint, output_jsonl, results + expanded)
+            if missing:
+                results = results + _fallback_results(missing, "no result returned")
+            return results
+
+        chunk_results = await asyncio.gather(
+            *(_process_chunk(chunk) for chunk in self._chunk_batch(representatives))
+        )
+        for chunk in chunk_results:
+            for result in chunk:
+                by_id.setdefault(result.id, result)
+
+        results = []
+        for item in items:
+            result = by_id.get(item.id) or by_id.get(aliases.get(item.id, item.id))
+            if result is None:
+                continue
+            if result.id != item.id:
+                result = replace(result, id=item.id)
+            results.append(result)
+        return results
+
+    async def _validate_chunk(
+        self,
+        items: list[BatchItem],
+    ) -> list[BatchResult]:
+        """
+        Validate one sub-batch in a single LLM call.
+
+        Args:
+            items: Distinct items of the sub-batch.
+
+        Returns:
+            List of BatchResult as returned by the LLM.
+
+        Raises:
+            Exception: Provider or parsing errors (handled by validate_batch).
+        """
+        from app.providers import Message
+
+        prompt = render_batch_validation(items)
+
+        messages = [
+            self._system_message,
+            Message(role="user", content=prompt),
+        ]
+
+        response = await self._provider.complete(
+            messages=messages,
+            temperature=0.3,
+            json_mode=True,
         )
 
-        prompt = BATCH_VALIDATION_PROMPT.format(items_json=items_json)
+        # Parse and validate straight from JSON bytes (no intermediate dicts)
+        return BatchResponse.model_validate_json(response.content).results
 
-        try:
-            from app.providers import Message
+    @staticmethod
+    def _chunk_batch(items: list[BatchItem]) -> list[list[BatchItem]]:
+        """
+        Split items into sub-batches bounded by count and estimated tokens.
 
-            messages = [
-                Message(role="system", content=self.persona_prompt),
-                Message(role="user", content=prompt),
-            ]
+        Tokens are estimated at ~4 characters per token; a single item
+        larger than the budget still gets its own sub-batch.
 
-            response = await self._provider.complete(
-                messages=messages,
-                temperature=0.3,
-                json_mode=True,
-            )
+        Args:
+            items: Items to split, in order.
 
-            data = json.loads(response.content)
-            results = data.get("results", [])
-
-            return [
-                BatchResult(
-                    id=r.get("id", ""),
-                    is_valid=r.get("is_valid", True),
-                    violations=r.get("violations", []),
-                    encouraged_aspects=r.get("encouraged_aspects", []),
-                    category=r.get("category", CATEGORIES[0]),
-                    reasoning=r.get("reasoning", ""),
-                    confidence=float(r.get("confidence", 0.5)),
-                )
-                for r in results
-            ]
-        except Exception as e:
-            # Return safe defaults on error
-            return [
-                BatchResult(
-                    id=item.id,
-                    is_valid=True,
-                    violations=[],
-                    encouraged_aspects=[],
-                    category=item.category or CATEGORIES[0],
-                    reasoning=f"Batch error: {e}",
-                    confidence=0.5,
-                )
-                for item in items
-            ]
+        Returns:
+            List of non-empty sub-batches preserving input order.
+        """
+        chunks: list[list[BatchItem]] = []
+        current: list[BatchItem] = []
+        current_tokens = 0
+
+        for item in items:
+            tokens = (len(item.title) + len(item.body)) // 4 + BATCH_ITEM_TOKEN_OVERHEAD
+            if current and (
+                len(current) >= BATCH_CHUNK_SIZE
+                or current_tokens + tokens > BATCH_TOKEN_BUDGET
+            ):
+                chunks.append(current)
+                current, current_tokens = [], 0
+            current.append(item)
+            current_tokens += tokens
+
+        if current:
+            chunks.append(current)
+        return chunks
+
+    @staticmethod
+    def _dedupe_batch(
+        items: list[BatchItem],
+    ) -> tuple[list[BatchItem], dict[str, str]]:
+        """
+        Fold resubmitted items onto the first item with the same text.
+
+        Only items whose title and body are identical up to case and
+        whitespace are folded: near-duplicates can differ by a negation or an
+        added insult, so they are validated on their own.
+
+        Args:
+            items: Batch items in input order.
+
+        Returns:
+            Tuple of (representatives to send, {item id: representative id}).
+        """
+        seen: dict[str, str] = {}  # normalized text -> representative id
+        representatives: list[BatchItem] = []
+        aliases: dict[str, str] = {}
+
+        for item in items:
+            text = normalize_text(f"{item.title}\n\n{item.body}")
+            match = seen.get(text)
+            if match is not None:
+                aliases[item.id] = match
+                continue
+            representatives.append(item)
+            seen[text] = item.id
+
+        return representatives, aliases
+
+
+# =============================================================================
+# Batch helpers
+# =============================================================================
+
+
+def _fallback_results(items: list[BatchItem], error: Exception | str) -> list[BatchResult]:
+    """Build fail-open results for items whose sub-batch failed."""
+    return [
+        BatchResult(
+            id=item.id,
+            is_valid=True,
+            category=item.category or CATEGORIES[0],
+            reasoning=f"Batch error: {error}",
+            confidence=0.5,
+        )
+        for item in items
+    ]
+
+
+def _load_checkpoint(path: Path) -> dict[str, BatchResult]:
+    """
+    Read already-validated results from a JSONL checkpoint.
+
+    A truncated last line (crash during write) is ignored.
+
+    Args:
+        path: Checkpoint file (may not exist yet).
+
+    Returns:
+        Dict mapping item id to its BatchResult.
+    """
+    done: dict[str, BatchResult] = {}
+    if not path.exists():
+        return done
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                result = BATCH_RESULT_ADAPTER.validate_json(line)
+            except ValueError:  # includes pydantic ValidationError
+                continue
+            done[result.id] = result
+    return done
+
+
+def _append_checkpoint(path: Path, results: list[BatchResult]) -> None:
+    """Append results to a JSONL checkpoint and fsync."""
+    with open(path, "ab") as f:
+        for result in results:
+            f.write(orjson.dumps(result) + b"\n")
+        f.flush()
+        os.fsync(f.fileno())
 
 
 # =============================================================================
@@ -0,0 +1,196 @@
+"""
+Forseti Response Cache
+
+In-memory caches for LLM results:
+- ResponseCache: exact LRU cache keyed by a SHA-256 content hash of the request
+- SemanticCache: recent confident results by normalized text
+
+Configuration:
+    FORSETI_CACHE_SIZE: Maximum number of cached responses (0 disables, default 512)
+    FORSETI_SEMANTIC_CACHE_SIZE: Recent results kept per feature (0 disables, default 256)
+"""
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from typing import Any
+
+
+class ResponseCache:
+    """
+    Bounded LRU cache mapping content hashes to raw LLM responses.
+
+    Usage:
+        cache = get_response_cache()
+        key = ResponseCache.make_key(
+            name, prompt_version, provider.name, provider.model,
+            system_prompt, user_prompt,
+        )
+        content = cache.get(key)
+        if content is None:
+            content = await call_llm()
+            cache.set(key, content)
+    """
+
+    def __init__(self, max_size: int = 512):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries (0 disables caching).
+        """
+        self.max_size = max_size
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """
+        Build a stable SHA-256 key from the given parts.
+
+        Args:
+            *parts: JSON-serializable key components.
+
+        Returns:
+            Hex digest identifying the request.
+        """
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response for key, or None."""
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store a response, evicting the least recently used entry if full."""
+        if self.max_size <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase text and collapse whitespace (equal results mean the same text)."""
+    return " ".join(text.lower().split())
+
+
+class SemanticCache:
+    """
+    LRU cache of recent confident results per namespace, keyed by the
+    normalized text.
+
+    Only the same text (case and whitespace aside) hits: a small edit can
+    negate a sentence or add an insult, so near-duplicates are revalidated.
+
+    Usage:
+        cache = get_semantic_cache()
+        namespace = f"charter_validation:{provider.name}:{provider.model}"
+        cached = cache.lookup(namespace, text)
+        if cached is None:
+            result = await validate(...)
+            cache.store(namespace, text, result.to_dict(), result.confidence)
+    """
+
+    def __init__(self, max_size: int = 256, min_confidence: float = 0.8):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Number of recent entries kept per namespace (0 disables).
+            min_confidence: Minimum result confidence required to store.
+        """
+        self.max_size = max_size
+        self.min_confidence = min_confidence
+        self._entries: dict[str, OrderedDict[str, dict]] = {}
+
+    def lookup(self, namespace: str, text: str) -> dict | None:
+        """
+        Find a cached payload for the same normalized text.
+
+        Args:
+            namespace: Feature (and provider/model) the payload belongs to.
+            text: Contribution text (title + body).
+
+        Returns:
+            Copy of the cached payload, or None.
+        """
+        entries = self._entries.get(namespace)
+        if not entries:
+            return None
+        key = normalize_text(text)
+        payload = entries.get(key)
+        if payload is None:
+            return None
+        entries.move_to_end(key)
+        return dict(payload)
+
+    def store(
+        self,
+        namespace: str,
+        text: str,
+        payload: dict,
+        confidence: float,
+    ) -> None:
+        """
+        Remember a result if it is confident enough.
+
+        Args:
+            namespace: Feature (and provider/model) the payload belongs to.
+            text: Contribution text (title + body).
+            payload: Result dict (e.g. to_dict()).
+            confidence: Result confidence.
+        """
+        if self.max_size <= 0 or confidence < self.min_confidence:
+            return
+        entries = self._entries.setdefault(namespace, OrderedDict())
+        key = normalize_text(text)
+        entries[key] = payload
+        entries.move_to_end(key)
+        while len(entries) > self.max_size:
+            entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+
+# Global cache instances (lazy initialized)
+_cache: ResponseCache | None = None
+_semantic_cache: SemanticCache | None = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Get or create the global response cache."""
+    global _cache
+    if _cache is None:
+        _cache = ResponseCache(max_size=int(os.getenv("FORSETI_CACHE_SIZE", "512")))
+    return _cache
+
+
+def get_semantic_cache() -> SemanticCache:
+    """Get or create the global semantic cache."""
+    global _semantic_cache
+    if _semantic_cache is None:
+        _semantic_cache = SemanticCache(
+            max_size=int(os.getenv("FORSETI_SEMANTIC_CACHE_SIZE", "256"))
+        )
+    return _semantic_cache
@@ -0,0 +1,128 @@
+"""
+Forseti Request Coalescer
+
+Micro-batches concurrent single validations into one validate_batch call.
+
+Requests arriving within a short window (or until the batch is full) are
+flushed together, trading a small latency floor for fewer LLM calls.
+
+Configuration:
+    FORSETI_COALESCE_WINDOW_MS: Flush window in milliseconds (default 20)
+    FORSETI_COALESCE_MAX_BATCH: Flush immediately at this many requests (default 10)
+"""
+
+import asyncio
+import itertools
+import os
+from typing import TYPE_CHECKING
+
+from .models import BatchItem, BatchResult
+
+if TYPE_CHECKING:
+    from .agent import ForsetiAgent
+
+
+BATCH_WINDOW_MS = int(os.getenv("FORSETI_COALESCE_WINDOW_MS", "20"))
+MAX_BATCH = int(os.getenv("FORSETI_COALESCE_MAX_BATCH", "10"))
+
+
+class ValidationCoalescer:
+    """
+    Collects single validation requests and resolves them from one batch call.
+
+    Bound to the event loop it is first used on (e.g. the API server loop).
+
+    Usage:
+        coalescer = ValidationCoalescer(agent)
+        result = await coalescer.submit(title="...", body="...")
+    """
+
+    def __init__(
+        self,
+        agent: "ForsetiAgent",
+        window_ms: int = BATCH_WINDOW_MS,
+        max_batch: int = MAX_BATCH,
+    ):
+        """
+        Initialize the coalescer.
+
+        Args:
+            agent: Agent whose validate_batch serves the flushed requests.
+            window_ms: How long to wait for more requests before flushing.
+            max_batch: Pending count that triggers an immediate flush.
+        """
+        self._agent = agent
+        self._window = window_ms / 1000
+        self._max_batch = max_batch
+        self._pending: list[tuple[BatchItem, asyncio.Future]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._ids = itertools.count()
+
+    async def submit(
+        self,
+        title: str,
+        body: str,
+        category: str | None = None,
+    ) -> BatchResult:
+        """
+        Queue a contribution and wait for its batched result.
+
+        Args:
+            title: Contribution title.
+            body: Contribution body.
+            category: Optional existing category.
+
+        Returns:
+            BatchResult for this contribution.
+
+        Raises:
+            RuntimeError: If the batch returned no result for the request.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        item = BatchItem(id=str(next(self._ids)), title=title, body=body, category=category)
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._window, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Hand the pending requests to a background batch call."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        task = asyncio.get_running_loop().create_task(self._run(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, pending: list[tuple[BatchItem, asyncio.Future]]) -> None:
+        """Validate a flushed batch and resolve each request's future."""
+        try:
+            results = await self._agent.validate_batch([item for item, _ in pending])
+        except asyncio.CancelledError:
+            for _, future in pending:
+                future.cancel()
+            raise
+        except Exception as e:  # Forwarded to every waiting caller
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        by_id = {result.id: result for result in results}
+        for item, future in pending:
+            if future.done():  # Caller cancelled
+                continue
+            result = by_id.get(item.id)
+            if result is None:
+                future.set_exception(RuntimeError(f"No batch result for item {item.id}"))
+            else:
+                future.set_result(result)
@@ -4,14 +4,21 @@ Forseti Agent Features
 Composable features for charter validation, classification, and wording correction.
 """
 
-from .base import FeatureBase
+from .base import FeatureBase, RECOVERABLE_ERRORS
 from .charter_validation import CharterValidationFeature
 from .category_classification import CategoryClassificationFeature
 from .wording_correction import WordingCorrectionFeature
+from .combined_validation import CombinedValidationFeature
+from .program_cache import ProgramCache, ProgramRule, get_program_cache
 
 __all__ = [
     "FeatureBase",
+    "RECOVERABLE_ERRORS",
     "CharterValidationFeature",
     "CategoryClassificationFeature",
     "WordingCorrectionFeature",
+    "CombinedValidationFeature",
+    "ProgramCache",
+    "ProgramRule",
+    "get_program_cache",
 ]
@@ -4,11 +4,21 @@ Base Feature Class
 Provides common functionality for all Forseti features.
 """
 
-import json
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Callable
 
-from app.providers import LLMProvider, Message
+import orjson
+
+from app.prompts.template import compile_template
+from app.providers import LLMProvider, Message, ProviderError
+
+from ..cache import ResponseCache, get_response_cache
+
+
+# Failures a feature turns into a fail-open result. Anything else (including
+# asyncio.CancelledError) propagates. orjson.JSONDecodeError and pydantic
+# ValidationError are ValueError subclasses.
+RECOVERABLE_ERRORS = (ValueError, TypeError, AttributeError, TimeoutError, ProviderError)
 
 
 class FeatureBase(ABC):
@@ -16,11 +26,26 @@ class FeatureBase(ABC):
     Abstract base class for Forseti features.
 
     Provides common functionality:
-    - JSON response handling
+    - JSON response handling (features validate results with TypeAdapters)
     - Message construction
     - Error handling
+    - Response caching (bump prompt_version to invalidate after prompt edits)
+
+    Deterministic features run at temperature 0 and their responses are
+    replayed from the exact-match cache. Set cache_responses = False on
+    experimental features to always hit the provider.
     """
 
+    __slots__ = ("_format_prompt",)
+
+    prompt_version: str = "1"
+    deterministic: bool = True
+    cache_responses: bool = True
+
+    def __init__(self):
+        # Compile the template once; format_prompt is then a single "".join
+        self._format_prompt = compile_template(self.prompt).render
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -37,7 +62,7 @@ class FeatureBase(ABC):
     async def execute(
         self,
         provider: LLMProvider,
-        system_prompt: str,
+        system_message: Message,
         **kwargs,
     ) -> Any:
         """Execute the feature."""
@@ -53,60 +78,147 @@ class FeatureBase(ABC):
         Returns:
             Formatted prompt string.
         """
-        return self.prompt.format(**kwargs)
+        return self._format_prompt(kwargs)
 
     async def _get_json_response(
         self,
         provider: LLMProvider,
-        system_prompt: str,
+        system_message: Message,
         user_prompt: str,
         temperature: float = 0.3,
     ) -> dict:
         """
         Get a JSON response from the provider.
 
+        Deterministic features force temperature 0; only temperature-0
+        responses are cached, so identical requests (including user retries)
+        replay the same answer.
+
         Args:
             provider: LLM provider to use.
-            system_prompt: System prompt (persona).
+            system_message: Agent's shared system message (persona prompt).
             user_prompt: User prompt (formatted feature prompt).
-            temperature: Sampling temperature (lower for more deterministic).
+            temperature: Sampling temperature (ignored for deterministic features).
 
         Returns:
             Parsed JSON dict.
 
         Raises:
-            json.JSONDecodeError: If response is not valid JSON.
+            orjson.JSONDecodeError: If response is not valid JSON
+                (subclass of json.JSONDecodeError).
         """
         messages = [
-            Message(role="system", content=system_prompt),
+            system_message,
             Message(role="user", content=user_prompt),
         ]
 
+        if self.deterministic:
+            temperature = 0.0
+        use_cache = self.cache_responses and temperature == 0.0
+
+        if use_cache:
+            key = self._cache_key(provider, system_message, user_prompt)
+            content = get_response_cache().get(key)
+            if content is not None:
+                return orjson.loads(content)
+
         response = await provider.complete(
             messages=messages,
             temperature=temperature,
             json_mode=True,
         )
 
-        return json.loads(response.content)
+        # Parse before caching so malformed responses are retried next time
+        data = orjson.loads(response.content)
+        if use_cache:
+            get_response_cache().set(key, response.content)
+        return data
 
-    def _safe_parse(
+    async def _stream_json_response(
         self,
-        data: dict,
-        defaults: dict,
-    ) -> dict:
+        provider: LLMProvider,
+        system_message: Message,
+        user_prompt: str,
+        early_result: Callable[[str], dict | None],
+        temperature: float = 0.3,
+    ) -> tuple[dict, bool]:
         """
-        Safely extract values from response with defaults.
+        Stream a JSON response, stopping as soon as the outcome is known.
+
+        early_result is called with the text received so far; when it returns
+        a dict the stream is closed and that partial result is returned.
+        Complete responses are cached like _get_json_response. Providers
+        without streaming (supports_streaming False) use _get_json_response.
 
         Args:
-            data: Parsed JSON response.
-            defaults: Default values for missing keys.
+            provider: LLM provider to use.
+            system_message: Agent's shared system message (persona prompt).
+            user_prompt: User prompt (formatted feature prompt).
+            early_result: Partial-output check returning a result dict or None.
+            temperature: Sampling temperature (ignored for deterministic features).
 
         Returns:
-            Dict with all expected keys.
+            Tuple of (parsed or partial dict, True if generation was aborted).
+
+        Raises:
+            orjson.JSONDecodeError: If the complete response is not valid JSON.
         """
-        result = defaults.copy()
-        for key in defaults:
-            if key in data:
-                result[key] = data[key]
-        return result
+        if not provider.supports_streaming:
+            data = await self._get_json_response(
+                provider=provider,
+                system_message=system_message,
+                user_prompt=user_prompt,
+                temperature=temperature,
+            )
+            return data, False
+
+        if self.deterministic:
+            temperature = 0.0
+        use_cache = self.cache_responses and temperature == 0.0
+
+        if use_cache:
+            key = self._cache_key(provider, system_message, user_prompt)
+            content = get_response_cache().get(key)
+            if content is not None:
+                return orjson.loads(content), False
+
+        messages = [
+            system_message,
+            Message(role="user", content=user_prompt),
+        ]
+        buffer = ""
+        stream = provider.stream(messages=messages, temperature=temperature, json_mode=True)
+        try:
+            async for chunk in stream:
+                buffer += chunk
+                partial = early_result(buffer)
+                if partial is not None:
+                    return partial, True
+        finally:
+            await stream.aclose()
+
+        content = provider.clean_json_response(buffer)
+        data = orjson.loads(content)
+        if use_cache:
+            get_response_cache().set(key, content)
+        return data, False
+
+    def _semantic_namespace(self, provider: LLMProvider) -> str:
+        """Semantic cache namespace: verdicts are only reused for the same model."""
+        return f"{self.name}:{provider.name}:{provider.model}"
+
+    def _cache_key(
+        self,
+        provider: LLMProvider,
+        system_message: Message,
+        user_prompt: str,
+    ) -> str:
+        """Exact-match response cache key for a request."""
+        return ResponseCache.make_key(
+            self.name,
+            self.prompt_version,
+            provider.name,
+            provider.model,
+            system_message.content,
+            user_prompt,
+        )
@@ -4,11 +4,16 @@ Category Classification Feature
 Classifies citizen contributions into one of 7 predefined categories.
 """
 
-from app.providers import LLMProvider
+from app.prompts.constants import CATEGORIES_SET
+from app.providers import LLMProvider, Message
 
-from ..models import ClassificationResult, CATEGORIES
-from ..prompts import CATEGORY_CLASSIFICATION_PROMPT
-from .base import FeatureBase
+from ..models import (
+    ClassificationResult,
+    CLASSIFICATION_RESULT_ADAPTER,
+    CATEGORIES,
+)
+from ..prompts import CATEGORY_CLASSIFICATION_PROMPT, render_category_classification
+from .base import FeatureBase, RECOVERABLE_ERRORS
 
 
 class CategoryClassificationFeature(FeatureBase):
@@ -25,6 +30,8 @@ class CategoryClassificationFeature(FeatureBase):
     - alimentation-bien-etre-soins: food, health
     """
 
+    __slots__ = ()
+
     @property
     def name(self) -> str:
         return "category_classification"
@@ -36,7 +43,7 @@ class CategoryClassificationFeature(FeatureBase):
     async def execute(
         self,
         provider: LLMProvider,
-        system_prompt: str,
+        system_message: Message,
         title: str,
         body: str,
         current_category: str | None = None,
@@ -47,7 +54,7 @@ class CategoryClassificationFeature(FeatureBase):
 
         Args:
             provider: LLM provider.
-            system_prompt: Agent persona prompt.
+            system_message: Agent's shared system message (persona prompt).
             title: Contribution title.
             body: Contribution body.
             current_category: Optional existing category for reference.
@@ -55,37 +62,23 @@ class CategoryClassificationFeature(FeatureBase):
         Returns:
             ClassificationResult with assigned category.
         """
-        current_category_line = (
-            f"CURRENT CATEGORY: {current_category}"
-            if current_category
-            else ""
-        )
-
-        user_prompt = self.format_prompt(
-            title=title,
-            body=body,
-            current_category_line=current_category_line,
-        )
+        user_prompt = render_category_classification(title, body, current_category)
 
         try:
             data = await self._get_json_response(
                 provider=provider,
-                system_prompt=system_prompt,
+                system_message=system_message,
                 user_prompt=user_prompt,
                 temperature=0.3,
             )
 
             category = data.get("category", CATEGORIES[0])
             # Validate category is in allowed list
-            if category not in CATEGORIES:
+            if category not in CATEGORIES_SET:
                 category = CATEGORIES[0]
 
-            return ClassificationResult(
-                category=category,
-                reasoning=data.get("reasoning", ""),
-                confidence=float(data.get("confidence", 0.5)),
-            )
-        except Exception as e:
+            return CLASSIFICATION_RESULT_ADAPTER.validate_python({**data, "category": category})
+        except RECOVERABLE_ERRORS as e:
             return ClassificationResult(
                 category=current_category or CATEGORIES[0],
                 reasoning=f"Classification error: {e}",
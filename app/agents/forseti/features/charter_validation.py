@@ -4,11 +4,49 @@ Charter Validation Feature
 Validates citizen contributions against the charter rules.
 """
 
-from app.providers import LLMProvider
+import re
 
-from ..models import ValidationResult
+import orjson
+
+from app.providers import LLMProvider, Message
+
+from ..cache import get_semantic_cache
+from ..models import ValidationResult, VALIDATION_RESULT_ADAPTER, CHARTER_VIOLATIONS
 from ..prompts import CHARTER_VALIDATION_PROMPT
-from .base import FeatureBase
+from .base import FeatureBase, RECOVERABLE_ERRORS
+from .program_cache import get_program_cache
+
+# Confidence reported when generation stops at a recognized violation
+EARLY_ABORT_CONFIDENCE = 0.85
+
+_KNOWN_VIOLATIONS = frozenset(v.lower() for v in CHARTER_VIOLATIONS)
+_IS_INVALID_RE = re.compile(r'"is_valid"\s*:\s*false')
+_VIOLATIONS_RE = re.compile(r'"violations"\s*:\s*(\[[^\]]*\])')
+
+
+def _early_violation(partial: str) -> dict | None:
+    """
+    Detect a decided rejection in partial charter JSON.
+
+    Args:
+        partial: Response text received so far.
+
+    Returns:
+        Partial result dict once "is_valid" is false and the violations list
+        is complete and names a charter violation, else None.
+    """
+    if not _IS_INVALID_RE.search(partial):
+        return None
+    match = _VIOLATIONS_RE.search(partial)
+    if match is None:
+        return None
+    try:
+        violations = orjson.loads(match.group(1))
+    except ValueError:
+        return None
+    if not any(str(v).lower() in _KNOWN_VIOLATIONS for v in violations):
+        return None
+    return {"is_valid": False, "violations": violations}
 
 
 class CharterValidationFeature(FeatureBase):
@@ -27,8 +65,16 @@ class CharterValidationFeature(FeatureBase):
     - Questions and clarifications
     - Shared expertise
     - Improvement suggestions
+
+    With early_abort enabled the response is streamed and generation stops
+    once a recognized violation is decided; the remaining fields are filled
+    with defaults.
     """
 
+    __slots__ = ()
+
+    early_abort: bool = True
+
     @property
     def name(self) -> str:
         return "charter_validation"
@@ -40,7 +86,7 @@ class CharterValidationFeature(FeatureBase):
     async def execute(
         self,
         provider: LLMProvider,
-        system_prompt: str,
+        system_message: Message,
         title: str,
         body: str,
         **kwargs,
@@ -50,31 +96,60 @@ class CharterValidationFeature(FeatureBase):
 
         Args:
             provider: LLM provider.
-            system_prompt: Agent persona prompt.
+            system_message: Agent's shared system message (persona prompt).
             title: Contribution title.
             body: Contribution body.
 
         Returns:
             ValidationResult with validation details.
         """
+        # Clear-cut cases are settled by cached rule programs
+        ruled = get_program_cache().run(title, body)
+        if ruled is not None:
+            return ruled
+
+        # A resubmitted contribution (same text up to case and whitespace)
+        # reuses a recent confident decision; near-duplicates are revalidated
+        text = f"{title}\n\n{body}"
+        namespace = self._semantic_namespace(provider)
+        semantic_cache = get_semantic_cache()
+        cached = semantic_cache.lookup(namespace, text)
+        if cached is not None:
+            return ValidationResult(**cached)
+
         user_prompt = self.format_prompt(title=title, body=body)
 
         try:
-            data = await self._get_json_response(
-                provider=provider,
-                system_prompt=system_prompt,
-                user_prompt=user_prompt,
-                temperature=0.3,
-            )
+            if self.early_abort:
+                data, aborted = await self._stream_json_response(
+                    provider=provider,
+                    system_message=system_message,
+                    user_prompt=user_prompt,
+                    early_result=_early_violation,
+                    temperature=0.3,
+                )
+            else:
+                data = await self._get_json_response(
+                    provider=provider,
+                    system_message=system_message,
+                    user_prompt=user_prompt,
+                    temperature=0.3,
+                )
+                aborted = False
 
-            return ValidationResult(
-                is_valid=data.get("is_valid", True),
-                violations=data.get("violations", []),
-                encouraged_aspects=data.get("encouraged_aspects", []),
-                reasoning=data.get("reasoning", ""),
-                confidence=float(data.get("confidence", 0.5)),
-            )
-        except Exception as e:
+            if aborted:
+                return ValidationResult(
+                    is_valid=False,
+                    violations=data["violations"],
+                    encouraged_aspects=[],
+                    reasoning="Charter violation detected (generation stopped early)",
+                    confidence=EARLY_ABORT_CONFIDENCE,
+                )
+
+            result = VALIDATION_RESULT_ADAPTER.validate_python({"is_valid": True, **data})
+            semantic_cache.store(namespace, text, result.to_dict(), result.confidence)
+            return result
+        except RECOVERABLE_ERRORS as e:
             return ValidationResult(
                 is_valid=True,  # Fail open
                 violations=[],
@@ -0,0 +1,136 @@
+"""
+Combined Validation Feature
+
+Validates a contribution against the charter and classifies it in a single LLM call.
+"""
+
+from typing import Callable
+
+from app.prompts.constants import CATEGORIES_SET
+from app.providers import LLMProvider, Message
+
+from ..cache import get_semantic_cache
+from ..models import (
+    ValidationResult,
+    ClassificationResult,
+    VALIDATION_RESULT_ADAPTER,
+    CLASSIFICATION_RESULT_ADAPTER,
+    CATEGORIES,
+)
+from ..prompts import COMBINED_VALIDATION_PROMPT, render_combined_validation
+from .base import FeatureBase, RECOVERABLE_ERRORS
+
+
+class CombinedValidationFeature(FeatureBase):
+    """
+    Feature fusing charter validation and category classification.
+
+    Both checks read the same title/body and persona, so a single
+    structured-JSON completion replaces the two separate calls made by
+    CharterValidationFeature and CategoryClassificationFeature.
+    """
+
+    __slots__ = ()
+
+    @property
+    def name(self) -> str:
+        return "combined_validation"
+
+    @property
+    def prompt(self) -> str:
+        return COMBINED_VALIDATION_PROMPT
+
+    async def execute(
+        self,
+        provider: LLMProvider,
+        system_message: Message,
+        title: str,
+        body: str,
+        current_category: str | None = None,
+        on_partial: Callable[[str], None] | None = None,
+        **kwargs,
+    ) -> tuple[ValidationResult, ClassificationResult]:
+        """
+        Validate and classify a contribution.
+
+        Args:
+            provider: LLM provider.
+            system_message: Agent's shared system message (persona prompt).
+            title: Contribution title.
+            body: Contribution body.
+            current_category: Optional existing category for reference.
+            on_partial: Optional progress callback; when given the response is
+                streamed and the callback receives the text generated so far
+                after each chunk. Not called for cached results.
+
+        Returns:
+            Tuple of (ValidationResult, ClassificationResult).
+        """
+        # A resubmitted contribution (same text up to case and whitespace,
+        # same current category) reuses a recent confident decision
+        text = f"{current_category or ''}\n{title}\n\n{body}"
+        namespace = self._semantic_namespace(provider)
+        semantic_cache = get_semantic_cache()
+        cached = semantic_cache.lookup(namespace, text)
+        if cached is not None:
+            return (
+                ValidationResult(**cached["charter"]),
+                ClassificationResult(**cached["category"]),
+            )
+
+        user_prompt = render_combined_validation(title, body, current_category)
+
+        try:
+            if on_partial is None:
+                data = await self._get_json_response(
+                    provider=provider,
+                    system_message=system_message,
+                    user_prompt=user_prompt,
+                    temperature=0.3,
+                )
+            else:
+                def progress(text: str) -> None:
+                    on_partial(text)  # Never stops the stream early
+
+                data, _ = await self._stream_json_response(
+                    provider=provider,
+                    system_message=system_message,
+                    user_prompt=user_prompt,
+                    early_result=progress,
+                    temperature=0.3,
+                )
+
+            charter = data.get("charter", {})
+            classification = data.get("category", {})
+
+            category = classification.get("category", CATEGORIES[0])
+            # Validate category is in allowed list
+            if category not in CATEGORIES_SET:
+                category = CATEGORIES[0]
+
+            validation = VALIDATION_RESULT_ADAPTER.validate_python({"is_valid": True, **charter})
+            classified = CLASSIFICATION_RESULT_ADAPTER.validate_python(
+                {**classification, "category": category}
+            )
+            semantic_cache.store(
+                namespace,
+                text,
+                {"charter": validation.to_dict(), "category": classified.to_dict()},
+                min(validation.confidence, classified.confidence),
+            )
+            return validation, classified
+        except RECOVERABLE_ERRORS as e:
+            return (
+                ValidationResult(
+                    is_valid=True,  # Fail open
+                    violations=[],
+                    encouraged_aspects=[],
+                    reasoning=f"Validation error: {e}",
+                    confidence=0.5,
+                ),
+                ClassificationResult(
+                    category=current_category or CATEGORIES[0],
+                    reasoning=f"Classification error: {e}",
+                    confidence=0.5,
+                ),
+            )
@@ -0,0 +1,137 @@
+"""
+Program Cache
+
+Compiled rule programs that settle clear-cut charter cases without an LLM call.
+
+Each rule is a compiled regex over the contribution text mapped to a fixed
+ValidationResult. Rules are only admitted to the cache when they agree with
+labelled exemplars at or above a precision threshold (gamma); anything not
+matched by an admitted rule falls back to the LLM.
+
+Only CharterValidationFeature consults the cache; the combined validation
+used by ForsetiAgent.validate() always asks the LLM.
+"""
+
+import re
+from dataclasses import dataclass
+
+from ..models import ValidationResult
+
+
+@dataclass(frozen=True)
+class ProgramRule:
+    """A compiled rule producing a fixed charter decision."""
+
+    name: str
+    pattern: re.Pattern
+    is_valid: bool
+    violation: str
+    confidence: float = 0.95
+
+    def matches(self, text: str) -> bool:
+        """Check whether the rule fires on text."""
+        return self.pattern.search(text) is not None
+
+    def run(self) -> ValidationResult:
+        """Build the decision for a matching contribution."""
+        return ValidationResult(
+            is_valid=self.is_valid,
+            violations=[] if self.is_valid else [self.violation],
+            encouraged_aspects=[],
+            reasoning=f"Rule '{self.name}' matched: {self.violation}",
+            confidence=self.confidence,
+        )
+
+
+class ProgramCache:
+    """
+    Registry of admitted rule programs.
+
+    Usage:
+        cache = get_program_cache()
+        admitted = cache.admit(rule, exemplars=[("title", "body", False), ...])
+        result = cache.run(title, body)  # None -> use the LLM
+    """
+
+    def __init__(self, min_precision: float = 0.9):
+        """
+        Initialize the cache.
+
+        Args:
+            min_precision: Agreement with exemplars required to admit a rule (gamma).
+        """
+        self.min_precision = min_precision
+        self._rules: dict[str, ProgramRule] = {}
+
+    def register(self, rule: ProgramRule) -> None:
+        """Add a trusted rule without exemplar validation."""
+        self._rules[rule.name] = rule
+
+    def admit(
+        self,
+        rule: ProgramRule,
+        exemplars: list[tuple[str, str, bool]],
+    ) -> bool:
+        """
+        Validate a rule on labelled exemplars and cache it if precise enough.
+
+        Args:
+            rule: Candidate rule.
+            exemplars: (title, body, expected_is_valid) tuples.
+
+        Returns:
+            True if the rule was admitted.
+        """
+        fired = [
+            expected
+            for title, body, expected in exemplars
+            if rule.matches(f"{title}\n\n{body}")
+        ]
+        if not fired:
+            return False
+        precision = sum(expected == rule.is_valid for expected in fired) / len(fired)
+        if precision < self.min_precision:
+            return False
+        self.register(rule)
+        return True
+
+    def run(self, title: str, body: str) -> ValidationResult | None:
+        """
+        Apply the first matching rule.
+
+        Args:
+            title: Contribution title.
+            body: Contribution body.
+
+        Returns:
+            ValidationResult from the rule, or None if no rule matched.
+        """
+        text = f"{title}\n\n{body}"
+        for rule in self._rules.values():
+            if rule.matches(text):
+                return rule.run()
+        return None
+
+    def clear(self) -> None:
+        """Remove all rules."""
+        self._rules.clear()
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+
+# Global cache instance (lazy initialized)
+_program_cache: ProgramCache | None = None
+
+
+def get_program_cache() -> ProgramCache:
+    """
+    Get or create the global program cache.
+
+    It starts empty: no keyword rule has yet proven precise on real
+    contributions, so every case goes to the LLM until a rule is admitted.
+    """
+    global _program_cache
+    if _program_cache is None:
+        _program_cache = ProgramCache()
+    return _program_cache
@@ -4,11 +4,11 @@ Wording Correction Feature
 Suggests improvements to contribution wording for clarity and constructiveness.
 """
 
-from app.providers import LLMProvider
+from app.providers import LLMProvider, Message
 
-from ..models import WordingResult
+from ..models import WordingResult, WORDING_RESULT_ADAPTER
 from ..prompts import WORDING_CORRECTION_PROMPT
-from .base import FeatureBase
+from .base import FeatureBase, RECOVERABLE_ERRORS
 
 
 class WordingCorrectionFeature(FeatureBase):
@@ -23,6 +23,11 @@ class WordingCorrectionFeature(FeatureBase):
     - Preserving original intent
     """
 
+    __slots__ = ()
+
+    # Suggestions benefit from some variety
+    deterministic = False
+
     @property
     def name(self) -> str:
         return "wording_correction"
@@ -34,7 +39,7 @@ class WordingCorrectionFeature(FeatureBase):
     async def execute(
         self,
         provider: LLMProvider,
-        system_prompt: str,
+        system_message: Message,
         title: str,
         body: str,
         **kwargs,
@@ -44,7 +49,7 @@ class WordingCorrectionFeature(FeatureBase):
 
         Args:
             provider: LLM provider.
-            system_prompt: Agent persona prompt.
+            system_message: Agent's shared system message (persona prompt).
             title: Contribution title.
             body: Contribution body.
 
@@ -58,21 +63,17 @@ class WordingCorrectionFeature(FeatureBase):
         try:
             data = await self._get_json_response(
                 provider=provider,
-                system_prompt=system_prompt,
+                system_message=system_message,
                 user_prompt=user_prompt,
                 temperature=0.5,  # Slightly higher for creative corrections
             )
 
-            return WordingResult(
-                original=original,
-                corrected=data.get("corrected", original),
-                changes=data.get("changes", []),
-                reasoning=data.get("reasoning", ""),
+            return WORDING_RESULT_ADAPTER.validate_python(
+                {"corrected": original, **data, "original": original}
             )
-        except Exception as e:
+        except RECOVERABLE_ERRORS as e:
             return WordingResult(
                 original=original,
                 corrected=original,  # No changes on error
-                changes=[],
                 reasoning=f"Correction error: {e}",
             )
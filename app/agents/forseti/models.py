@@ -1,131 +1,188 @@
 """
 Forseti Agent Models
 
-Pydantic models for validation and classification results.
+Boundary models (ContributionInput, BatchItem, BatchResponse) are Pydantic
+and validate external input. Results are plain slotted dataclasses; LLM
+output is validated into them through the TypeAdapters below.
 """
 
-from pydantic import BaseModel, Field
+import json
+import sys
+from dataclasses import MISSING, asdict, dataclass, fields
+from functools import lru_cache
+from typing import Annotated
+
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, TypeAdapter
 
 # Import from central constants (single source of truth)
 from app.prompts.constants import CATEGORIES
 
 # What the charter prohibits
-CHARTER_VIOLATIONS = [
+CHARTER_VIOLATIONS: tuple[str, ...] = tuple(sys.intern(s) for s in (
     "Personal attacks or discriminatory remarks",
     "Spam or advertising",
     "Proposals unrelated to Audierne-Esquibien",
     "False information",
-]
+))
 
 # What the charter encourages
-CHARTER_ENCOURAGED = [
+CHARTER_ENCOURAGED: tuple[str, ...] = tuple(sys.intern(s) for s in (
     "Concrete and argued proposals",
     "Constructive criticism",
     "Questions and requests for clarification",
     "Sharing of experiences and expertise",
     "Suggestions for improvement",
-]
+))
+
+# Canonical label objects: results naming a known label share the interned string
+_CANONICAL_LABELS = {s: s for s in (*CHARTER_VIOLATIONS, *CHARTER_ENCOURAGED)}
+
+
+def canonical_labels(labels) -> tuple[str, ...]:
+    """Tuple of labels with known charter labels mapped to their interned object."""
+    get = _CANONICAL_LABELS.get
+    return tuple(get(label, label) for label in labels)
+
+
+# Boundary models are immutable and drop unknown keys
+# (extra="ignore" rather than "forbid": API clients and LLM output may carry extra keys)
+_BOUNDARY_CONFIG = ConfigDict(
+    frozen=True,
+    extra="ignore",
+    strict=False,
+    validate_assignment=False,
+    revalidate_instances="never",
+)
+
+# Confidence bounds, enforced when LLM output is validated through an adapter
+Confidence = Annotated[float, Field(ge=0.0, le=1.0)]
+
+
+def clamp_confidence(value: float) -> float:
+    """Clamp a confidence score into [0.0, 1.0]."""
+    return 0.0 if value < 0.0 else 1.0 if value > 1.0 else value
 
 
-class ValidationResult(BaseModel):
+@dataclass(slots=True)
+class ValidationResult:
     """Result of charter validation for a contribution."""
 
-    is_valid: bool = Field(
-        description="Whether the contribution complies with the charter"
-    )
-    violations: list[str] = Field(
-        default_factory=list,
-        description="List of charter violations found",
-    )
-    encouraged_aspects: list[str] = Field(
-        default_factory=list,
-        description="Positive aspects that align with charter values",
-    )
-    reasoning: str = Field(
-        default="",
-        description="Explanation of the validation decision",
-    )
-    confidence: float = Field(
-        default=0.5,
-        ge=0.0,
-        le=1.0,
-        description="Confidence score for the validation (0.0-1.0)",
-    )
+    # Whether the contribution complies with the charter
+    is_valid: bool
+    # Charter violations found
+    violations: tuple[str, ...] = ()
+    # Positive aspects that align with charter values
+    encouraged_aspects: tuple[str, ...] = ()
+    # Explanation of the validation decision
+    reasoning: str = ""
+    # Confidence score for the validation (0.0-1.0)
+    confidence: Confidence = 0.5
 
+    def __post_init__(self) -> None:
+        # Accept any iterable (e.g. JSON lists) and share canonical label strings
+        self.violations = canonical_labels(self.violations)
+        self.encouraged_aspects = canonical_labels(self.encouraged_aspects)
 
-class ClassificationResult(BaseModel):
-    """Result of category classification for a contribution."""
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return asdict(self)
 
-    category: str = Field(
-        description="Assigned category from the predefined list"
-    )
-    reasoning: str = Field(
-        default="",
-        description="Explanation of the classification decision",
-    )
-    confidence: float = Field(
-        default=0.5,
-        ge=0.0,
-        le=1.0,
-        description="Confidence score for the classification (0.0-1.0)",
-    )
 
+@dataclass(slots=True)
+class ClassificationResult:
+    """Result of category classification for a contribution."""
 
-class WordingResult(BaseModel):
-    """Result of wording correction/improvement."""
+    # Assigned category from the predefined list
+    category: str
+    # Explanation of the classification decision
+    reasoning: str = ""
+    # Confidence score for the classification (0.0-1.0)
+    confidence: Confidence = 0.5
 
-    original: str = Field(description="Original text")
-    corrected: str = Field(description="Corrected/improved text")
-    changes: list[str] = Field(
-        default_factory=list,
-        description="List of changes made",
-    )
-    reasoning: str = Field(
-        default="",
-        description="Explanation of corrections",
-    )
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return asdict(self)
 
 
-class FullValidationResult(BaseModel):
-    """Combined result of validation and classification."""
+@dataclass(slots=True)
+class WordingResult:
+    """Result of wording correction/improvement."""
 
-    is_valid: bool = Field(
-        description="Whether the contribution complies with the charter"
-    )
-    category: str = Field(
-        description="Assigned category"
-    )
-    original_category: str | None = Field(
-        default=None,
-        description="Original category if provided",
-    )
-    violations: list[str] = Field(
-        default_factory=list,
-        description="Charter violations found",
-    )
-    encouraged_aspects: list[str] = Field(
-        default_factory=list,
-        description="Positive aspects",
-    )
-    reasoning: str = Field(
-        default="",
-        description="Combined reasoning",
-    )
-    confidence: float = Field(
-        default=0.5,
-        ge=0.0,
-        le=1.0,
-        description="Overall confidence",
-    )
+    # Original text
+    original: str
+    # Corrected/improved text
+    corrected: str
+    # Changes made
+    changes: tuple[str, ...] = ()
+    # Explanation of corrections
+    reasoning: str = ""
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return self.model_dump()
+        return asdict(self)
+
+
+@dataclass(slots=True, frozen=True)
+class FullValidationResult:
+    """Combined result of validation and classification (immutable, shareable)."""
+
+    # Whether the contribution complies with the charter
+    is_valid: bool
+    # Assigned category
+    category: str
+    # Original category if provided
+    original_category: str | None = None
+    # Charter violations found
+    violations: tuple[str, ...] = ()
+    # Positive aspects
+    encouraged_aspects: tuple[str, ...] = ()
+    # Combined reasoning
+    reasoning: str = ""
+    # Overall confidence (0.0-1.0; built from already-bounded results)
+    confidence: float = 0.5
+
+    def __post_init__(self) -> None:
+        # Accept any iterable (e.g. JSON lists) and share canonical label strings
+        object.__setattr__(self, "violations", canonical_labels(self.violations))
+        object.__setattr__(
+            self, "encouraged_aspects", canonical_labels(self.encouraged_aspects)
+        )
+
+    def to_dict(self, exclude_defaults: bool = False) -> dict:
+        """
+        Convert to dictionary for JSON serialization.
+
+        Args:
+            exclude_defaults: If True, omit fields still at their default
+                (empty lists, None, 0.5 confidence) for smaller payloads.
+
+        Returns:
+            Dict of field values.
+        """
+        data = asdict(self)
+        if exclude_defaults:
+            defaults = _FULL_RESULT_DEFAULTS
+            data = {k: v for k, v in data.items() if k not in defaults or v != defaults[k]}
+        return data
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes (orjson handles dataclasses natively)."""
+        return orjson.dumps(self)
+
+
+_FULL_RESULT_DEFAULTS = {
+    f.name: f.default if f.default is not MISSING else f.default_factory()
+    for f in fields(FullValidationResult)
+    if f.default is not MISSING or f.default_factory is not MISSING
+}
 
 
 class ContributionInput(BaseModel):
     """Input model for a citizen contribution."""
 
+    model_config = _BOUNDARY_CONFIG
+
     title: str = Field(description="Contribution title")
     body: str = Field(description="Contribution body/content")
     category: str | None = Field(
@@ -133,28 +190,104 @@ class ContributionInput(BaseModel):
         description="Optional existing category",
     )
 
+    _text: str = PrivateAttr(default="")
+
+    def model_post_init(self, __context) -> None:
+        # Built once at construction (the model is frozen, so it never goes stale);
+        # set eagerly because private attributes take part in equality
+        self._text = f"{self.title}\n\n{self.body}"
+
     @property
     def text(self) -> str:
         """Combined text for analysis."""
-        return f"{self.title}\n\n{self.body}"
+        return self._text
+
+    @classmethod
+    def of(
+        cls,
+        title: str,
+        body: str,
+        category: str | None = None,
+    ) -> "ContributionInput":
+        """
+        Get a (shared, immutable) instance for these values.
+
+        Repeated identical contributions reuse the same input object (and its
+        precomputed text); validation itself still runs for each call.
+
+        Args:
+            title: Contribution title.
+            body: Contribution body.
+            category: Optional existing category.
+
+        Returns:
+            Cached ContributionInput.
+        """
+        return _make_contribution(title, body, category)
+
+
+@lru_cache(maxsize=1024)
+def _make_contribution(
+    title: str,
+    body: str,
+    category: str | None,
+) -> ContributionInput:
+    return ContributionInput(title=title, body=body, category=category)
 
 
 class BatchItem(BaseModel):
     """Single item in a batch validation request."""
 
+    model_config = _BOUNDARY_CONFIG
+
     id: str = Field(description="Unique identifier")
     title: str = Field(description="Item title")
     body: str = Field(description="Item body")
     category: str | None = Field(default=None)
 
 
-class BatchResult(BaseModel):
+@dataclass(slots=True)
+class BatchResult:
     """Result for a single item in batch processing."""
 
-    id: str = Field(description="Item identifier")
-    is_valid: bool = Field(default=True)
-    violations: list[str] = Field(default_factory=list)
-    encouraged_aspects: list[str] = Field(default_factory=list)
-    category: str = Field(default="economie")
-    reasoning: str = Field(default="")
-    confidence: float = Field(default=0.5)
+    id: str
+    is_valid: bool = True
+    violations: tuple[str, ...] = ()
+    encouraged_aspects: tuple[str, ...] = ()
+    category: str = "economie"
+    reasoning: str = ""
+    confidence: float = 0.5
+
+    def __post_init__(self) -> None:
+        # Accept any iterable (e.g. JSON lists) and share canonical label strings
+        self.violations = canonical_labels(self.violations)
+        self.encouraged_aspects = canonical_labels(self.encouraged_aspects)
+        # LLM batch output is not range-checked; clamp instead of rejecting the item
+        self.confidence = clamp_confidence(self.confidence)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return asdict(self)
+
+
+class BatchResponse(BaseModel):
+    """LLM response envelope for batch validation (parsed in one pass)."""
+
+    model_config = _BOUNDARY_CONFIG
+
+    results: list[BatchResult] = Field(default_factory=list)
+
+
+# Validators for untrusted LLM output
+VALIDATION_RESULT_ADAPTER = TypeAdapter(ValidationResult)
+CLASSIFICATION_RESULT_ADAPTER = TypeAdapter(ClassificationResult)
+WORDING_RESULT_ADAPTER = TypeAdapter(WordingResult)
+BATCH_RESULT_ADAPTER = TypeAdapter(BatchResult)
+
+# Compact JSON schemas, computed once (for API docs and tooling). Prompts keep
+# their shorter hand-written output examples; tests check they list the same fields.
+BATCH_RESULT_SCHEMA_JSON = json.dumps(
+    BATCH_RESULT_ADAPTER.json_schema(mode="serialization"),
+    separators=(",", ":"),
+)
+BATCH_RESULT_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(BatchResult))
@@ -4,7 +4,8 @@ Forseti Agent Prompts
 System prompt (persona) and feature prompt templates for Forseti 461.
 
 NOTE: This module re-exports prompts from the central app/prompts/ module.
-The canonical source is app/prompts/local/forseti.py.
+The canonical source is app/prompts/local/forseti.py; nothing is redefined
+here, so each prompt is assembled exactly once at import.
 """
 
 # =============================================================================
@@ -25,6 +26,101 @@ from app.prompts.local.forseti import (
     PERSONA_PROMPT,
     CHARTER_VALIDATION_PROMPT,
     CATEGORY_CLASSIFICATION_PROMPT,
+    COMBINED_VALIDATION_PROMPT,
     WORDING_CORRECTION_PROMPT,
     BATCH_VALIDATION_PROMPT,
 )
+
+from pydantic import TypeAdapter
+
+from app.prompts.template import compile_template
+
+from .models import BatchItem
+
+# Pre-split templates: rendering is one "".join, no per-call format parsing
+CHARTER_VALIDATION_TEMPLATE = compile_template(CHARTER_VALIDATION_PROMPT)
+CATEGORY_CLASSIFICATION_TEMPLATE = compile_template(CATEGORY_CLASSIFICATION_PROMPT)
+COMBINED_VALIDATION_TEMPLATE = compile_template(COMBINED_VALIDATION_PROMPT)
+WORDING_CORRECTION_TEMPLATE = compile_template(WORDING_CORRECTION_PROMPT)
+BATCH_VALIDATION_TEMPLATE = compile_template(BATCH_VALIDATION_PROMPT)
+
+_render_classification = CATEGORY_CLASSIFICATION_TEMPLATE.render
+_render_combined = COMBINED_VALIDATION_TEMPLATE.render
+
+# Batch prompt split around its single {items_json} placeholder
+_BATCH_PREFIX, _BATCH_SUFFIX = BATCH_VALIDATION_PROMPT.format(items_json="\0").split("\0")
+
+# Serializes batch items straight to JSON bytes (no intermediate dicts)
+_BATCH_ITEMS_ADAPTER = TypeAdapter(list[BatchItem])
+
+
+def current_category_line(current_category: str | None) -> str:
+    """Prompt line naming the existing category ("" when there is none)."""
+    return f"CURRENT CATEGORY: {current_category}" if current_category else ""
+
+
+def render_category_classification(
+    title: str,
+    body: str,
+    current_category: str | None = None,
+) -> str:
+    """Render CATEGORY_CLASSIFICATION_PROMPT for a contribution."""
+    return _render_classification({
+        "title": title,
+        "body": body,
+        "current_category_line": current_category_line(current_category),
+    })
+
+
+def render_combined_validation(
+    title: str,
+    body: str,
+    current_category: str | None = None,
+) -> str:
+    """Render COMBINED_VALIDATION_PROMPT for a contribution."""
+    return _render_combined({
+        "title": title,
+        "body": body,
+        "current_category_line": current_category_line(current_category),
+    })
+
+
+def render_batch_validation(items: list[BatchItem]) -> str:
+    """
+    Render BATCH_VALIDATION_PROMPT for a list of items.
+
+    Items are serialized by pydantic-core and joined with the fixed prompt
+    text in one step, so the (possibly large) items JSON is copied once.
+
+    Args:
+        items: Batch items to embed.
+
+    Returns:
+        Rendered prompt.
+    """
+    items_json = _BATCH_ITEMS_ADAPTER.dump_json(items).decode()
+    return "".join((_BATCH_PREFIX, items_json, _BATCH_SUFFIX))
+
+
+__all__ = [
+    "CATEGORIES",
+    "CATEGORY_DESCRIPTIONS",
+    "VIOLATIONS_TEXT",
+    "ENCOURAGED_TEXT",
+    "CATEGORIES_TEXT",
+    "PERSONA_PROMPT",
+    "CHARTER_VALIDATION_PROMPT",
+    "CATEGORY_CLASSIFICATION_PROMPT",
+    "COMBINED_VALIDATION_PROMPT",
+    "WORDING_CORRECTION_PROMPT",
+    "BATCH_VALIDATION_PROMPT",
+    "CHARTER_VALIDATION_TEMPLATE",
+    "CATEGORY_CLASSIFICATION_TEMPLATE",
+    "COMBINED_VALIDATION_TEMPLATE",
+    "WORDING_CORRECTION_TEMPLATE",
+    "BATCH_VALIDATION_TEMPLATE",
+    "current_category_line",
+    "render_category_classification",
+    "render_combined_validation",
+    "render_batch_validation",
+]
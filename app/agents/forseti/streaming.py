@@ -0,0 +1,109 @@
+"""
+Forseti Streaming Helpers
+
+Extracts human-readable reasoning from a JSON response while it is still
+being generated, so the UI can show progress before the result is parsed.
+"""
+
+import re
+
+# Opening of a "reasoning" string value (the key may arrive split across chunks)
+_REASONING_START = re.compile(r'"reasoning"\s*:\s*"')
+# Characters inside a string value that need no unescaping
+_PLAIN_RUN = re.compile(r'[^"\\]+')
+# Longest tail kept unscanned while waiting for the rest of the key
+_KEY_LOOKBEHIND = 24
+
+_ESCAPES = {"n": "\n", "t": "\t", "r": "", "b": "", "f": "", '"': '"', "\\": "\\", "/": "/"}
+
+
+class ReasoningExtractor:
+    """
+    Incrementally pulls the text of "reasoning" values out of partial JSON.
+
+    feed() is called with the full text received so far and returns only the
+    reasoning text not returned before; successive values are separated by a
+    blank line.
+
+    Usage:
+        extractor = ReasoningExtractor()
+        for buffer in partial_buffers:
+            delta = extractor.feed(buffer)
+    """
+
+    __slots__ = ("_pos", "_in_value", "_values")
+
+    def __init__(self):
+        self._pos = 0
+        self._in_value = False
+        self._values = 0
+
+    def feed(self, text: str) -> str:
+        """
+        Scan newly received text.
+
+        Args:
+            text: Full response text received so far.
+
+        Returns:
+            Reasoning text found since the previous call (may be empty).
+        """
+        out: list[str] = []
+        i = self._pos
+        end = len(text)
+        while i < end:
+            if not self._in_value:
+                match = _REASONING_START.search(text, i)
+                if match is None:
+                    i = max(i, end - _KEY_LOOKBEHIND)
+                    break
+                i = match.end()
+                self._in_value = True
+                if self._values:
+                    out.append("\n\n")
+                self._values += 1
+                continue
+
+            ch = text[i]
+            if ch == '"':
+                self._in_value = False
+                i += 1
+            elif ch == "\\":
+                if i + 1 >= end:
+                    break  # Escape split across chunks
+                code = text[i + 1]
+                if code == "u":
+                    if i + 6 > end:
+                        break
+                    point = _hex(text, i + 2)
+                    i += 6
+                    if 0xD800 <= point <= 0xDBFF:
+                        # High surrogate: combine with the following low half
+                        if i + 6 > end:
+                            i -= 6
+                            break
+                        low = _hex(text, i + 2) if text.startswith("\\u", i) else 0
+                        if 0xDC00 <= low <= 0xDFFF:
+                            out.append(chr(0x10000 + ((point - 0xD800) << 10) + low - 0xDC00))
+                            i += 6
+                    elif not 0xDC00 <= point <= 0xDFFF:
+                        # (lone low halves cannot be displayed and are dropped)
+                        out.append(chr(point))
+                else:
+                    out.append(_ESCAPES.get(code, code))
+                    i += 2
+            else:
+                # Copy the run of plain characters up to the next quote or escape
+                run = _PLAIN_RUN.match(text, i)
+                out.append(run.group())
+                i = run.end()
+        self._pos = i
+        return "".join(out)
+
+
+def _hex(text: str, start: int) -> int:
+    """Code point of a \\uXXXX escape body, or U+FFFD if malformed."""
+    try:
+        return int(text[start : start + 4], 16)
+    except ValueError:
+        return 0xFFFD
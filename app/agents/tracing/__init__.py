@@ -5,5 +5,6 @@ Provides tracing and observability for agent operations via Opik.
 """
 
 from .opik import AgentTracer, trace_feature, get_tracer, DummySpan
+from .queue import AsyncSpanQueue
 
-__all__ = ["AgentTracer", "trace_feature", "get_tracer", "DummySpan"]
+__all__ = ["AgentTracer", "trace_feature", "get_tracer", "DummySpan", "AsyncSpanQueue"]
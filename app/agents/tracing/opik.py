@@ -17,16 +17,57 @@ Structure:
 """
 
 import os
+import atexit
+import asyncio
 import functools
-from contextlib import contextmanager
+import logging
+import threading
+import weakref
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
 from typing import Any, Callable, TypeVar, Generator
 from dataclasses import dataclass, field
 from datetime import datetime
+from types import MappingProxyType
+
+import orjson
+
+from .queue import AsyncSpanQueue
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+logger = logging.getLogger("ocapistaine.tracing.opik")
+
+# Opik clients shared by all tracers, keyed by (api key, workspace, project)
+_client_cache: dict[tuple[str, str | None, str], Any] = {}
+
+# Feedback scores are sent in batches: when this many are buffered, or
+# FEEDBACK_FLUSH_S after the first one (inside an event loop), or at exit
+FEEDBACK_BATCH_MAX = 50
+FEEDBACK_FLUSH_S = 2.0
+
+# Enabled tracers, whose buffered feedback is flushed once at exit
+_feedback_tracers: "weakref.WeakSet[AgentTracer]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all_feedback() -> None:
+    """Send the feedback still buffered by live tracers."""
+    for tracer in list(_feedback_tracers):
+        tracer.flush_feedback()
 
-@dataclass
+
+def _to_json_native(value: Any) -> Any:
+    """Deep-convert a payload value to plain JSON types (unknown objects via str)."""
+    if isinstance(value, MappingProxyType):
+        value = dict(value)
+    try:
+        return orjson.loads(orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS))
+    except orjson.JSONEncodeError:
+        return value  # e.g. integers beyond 64 bits: let the SDK encode it
+
+
+@dataclass(slots=True)
 class TraceContext:
     """Context for a single trace."""
 
@@ -37,8 +78,19 @@ class TraceContext:
     tags: list[str] = field(default_factory=list)
 
 
+def _noop(*args, **kwargs) -> None:
+    """Accept anything, do nothing."""
+
+
 class DummySpan:
-    """Dummy span for when Opik is disabled."""
+    """
+    Dummy span for when Opik is disabled.
+
+    Stateless (no instance dict). update() and end() are real methods so the
+    common calls resolve on the class; any other span method is a no-op too.
+    """
+
+    __slots__ = ()
 
     def update(self, **kwargs) -> None:
         """No-op update."""
@@ -48,6 +100,25 @@ class DummySpan:
         """No-op end."""
         pass
 
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        # Only reached for attributes the class lacks (e.g. span.log_metadata)
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _noop
+
+
+# Shared no-op contexts for the disabled path (stateless, so safe to reuse)
+_DUMMY_SPAN = DummySpan()
+_NULL_SPAN_CONTEXT = nullcontext(_DUMMY_SPAN)
+_NULL_TRACE_CONTEXT = nullcontext(None)
+
+# (tracer, trace) open in the current context. A context variable rather than
+# tracer state: each asyncio task sees its own trace, so concurrent
+# validations on a shared tracer never attach spans to each other's traces.
+_current_trace_var: ContextVar[tuple["AgentTracer", Any] | None] = ContextVar(
+    "opik_current_trace", default=None
+)
+
 
 class AgentTracer:
     """
@@ -84,8 +155,15 @@ class AgentTracer:
         self._client = None
         self._project = None
         self._current_experiment = None
-        self._current_trace = None
         self._opik_module = None
+        self._queue = AsyncSpanQueue(send=self._send_trace)
+        # Dataset handles by name, so repeated inserts skip the lookup call
+        self._datasets: dict[str, Any] = {}
+        # Pending feedback scores (with their trace "id"), sent in one call per batch
+        self._feedback_buf: list[dict] = []
+        self._feedback_lock = threading.Lock()
+        self._feedback_timer: asyncio.TimerHandle | None = None
+        self._feedback_loop: asyncio.AbstractEventLoop | None = None
 
         try:
             import opik
@@ -97,16 +175,23 @@ class AgentTracer:
             ws = workspace or os.getenv("OPIK_WORKSPACE")
             proj = project or os.getenv("OPIK_PROJECT", "ocapistaine")
 
-            # Configure Opik with workspace
-            opik.configure(api_key=key, workspace=ws)
+            # One client per (credentials, workspace, project) for the whole
+            # process: rebuilt tracers reuse its HTTP session and batch worker
+            cache_key = (key, ws, proj)
+            client = _client_cache.get(cache_key)
+            if client is None:
+                # Configure Opik with workspace
+                opik.configure(api_key=key, workspace=ws)
+                client = _client_cache[cache_key] = opik.Opik(project_name=proj)
 
-            self._client = opik.Opik(project_name=proj)
+            self._client = client
             self._project = proj
             self._opik_module = opik
             self.enabled = True
+            _feedback_tracers.add(self)
 
-        except Exception as e:
-            print(f"OPIK: Failed to initialize: {e}")
+        except Exception:
+            logger.warning("OPIK: Failed to initialize", exc_info=True)
 
     @property
     def project(self) -> str | None:
@@ -134,8 +219,9 @@ class AgentTracer:
             return None
 
         try:
-            # Create timestamped experiment name if not unique
-            exp_name = f"{name}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+            # Create timestamped experiment name if not unique (one clock read)
+            now = datetime.now()
+            exp_name = f"{name}-{now:%Y%m%d-%H%M%S}"
 
             # Opik experiments are created via the evaluate() function
             # For manual experiments, we track via metadata
@@ -143,11 +229,11 @@ class AgentTracer:
                 "name": exp_name,
                 "description": description,
                 "metadata": metadata or {},
-                "started_at": datetime.now().isoformat(),
+                "started_at": now.isoformat(),
             }
             return exp_name
-        except Exception as e:
-            print(f"OPIK: Failed to start experiment: {e}")
+        except Exception:
+            logger.warning("OPIK: Failed to start experiment", exc_info=True)
             return None
 
     def end_experiment(self) -> None:
@@ -173,37 +259,69 @@ class AgentTracer:
             tags: Optional list of tags.
 
         Returns:
-            Trace ID if successful, None otherwise
+            Trace ID if sent synchronously, None if queued (inside a running
+            event loop) or on failure.
         """
         if not self.enabled or not self._client:
             return None
 
-        try:
-            # Add experiment info to metadata if active
-            meta = metadata or {}
-            if self._current_experiment:
-                meta["experiment"] = self._current_experiment["name"]
+        # Add experiment info to metadata if active (without touching the caller's dict)
+        meta = metadata or {}
+        if self._current_experiment:
+            meta = {**meta, "experiment": self._current_experiment["name"]}
+
+        payload = {
+            "name": name,
+            "input": input,
+            "output": output,
+            "metadata": meta,
+            "tags": tags or [],
+        }
+
+        # Inside an event loop the export happens in the background; the
+        # worker gets read-only views of the dicts instead of deep copies
+        queued = {
+            key: MappingProxyType(value) if isinstance(value, dict) else value
+            for key, value in payload.items()
+        }
+        if self._queue.enqueue(queued):
+            return None
 
-            trace = self._client.trace(
-                name=name,
-                input=input,
-                output=output,
-                metadata=meta,
-                tags=tags or [],
-            )
+        try:
+            trace = self._send_trace(payload)
             return trace.id if hasattr(trace, 'id') else None
-        except Exception as e:
-            print(f"OPIK: Failed to trace: {e}")
+        except Exception:
+            logger.warning("OPIK: Failed to trace", exc_info=True)
             return None
 
-    @contextmanager
+    def _send_trace(self, payload: dict) -> Any:
+        """Export one trace payload to Opik (blocking)."""
+        # The SDK only accepts Python objects, so hand it plain JSON-native
+        # dicts: one orjson round trip (in C) unwraps read-only views from the
+        # queue, snapshots nested data and turns dataclasses/tuples into
+        # dicts/lists, leaving the SDK's own encoder nothing to convert
+        return self._client.trace(**{
+            key: _to_json_native(value) if isinstance(value, (dict, MappingProxyType)) else value
+            for key, value in payload.items()
+        })
+
+    async def shutdown(self, timeout: float = 10) -> None:
+        """
+        Flush queued traces and buffered feedback before the event loop stops.
+
+        Args:
+            timeout: Max seconds to wait for pending traces.
+        """
+        await self._queue.shutdown(timeout=timeout)
+        await asyncio.to_thread(self.flush_feedback)
+
     def start_trace(
         self,
         name: str,
         input: dict | None = None,
         metadata: dict | None = None,
         tags: list[str] | None = None,
-    ) -> Generator[Any, None, None]:
+    ) -> AbstractContextManager[Any]:
         """
         Start a trace context for grouping spans.
 
@@ -219,13 +337,41 @@ class AgentTracer:
             metadata: Optional metadata
             tags: Optional tags
 
-        Yields:
-            Trace object (or None if disabled)
+        Returns:
+            Context manager yielding the trace object (or None if disabled)
         """
         if not self.enabled or not self._client:
-            yield None
+            return _NULL_TRACE_CONTEXT
+        return self._trace_context(name, input, metadata, tags)
+
+    @contextmanager
+    def _trace_context(
+        self,
+        name: str,
+        input: dict | None,
+        metadata: dict | None,
+        tags: list[str] | None,
+    ) -> Generator[Any, None, None]:
+        """Open an Opik trace and make it current for span()."""
+        # Preferred: the SDK context manager sends the trace once, complete,
+        # when the block exits (no separate create + update requests)
+        start_as_current_trace = getattr(self._opik_module, "start_as_current_trace", None)
+        if start_as_current_trace is not None:
+            with start_as_current_trace(
+                name=name,
+                input=input or {},
+                metadata=metadata or {},
+                tags=tags or [],
+                project_name=self._project,
+            ) as trace:
+                token = _current_trace_var.set((self, trace))
+                try:
+                    yield trace
+                finally:
+                    _current_trace_var.reset(token)
             return
 
+        token = None
         try:
             trace = self._client.trace(
                 name=name,
@@ -233,22 +379,34 @@ class AgentTracer:
                 metadata=metadata or {},
                 tags=tags or [],
             )
-            self._current_trace = trace
+            token = _current_trace_var.set((self, trace))
             yield trace
-        except Exception as e:
-            print(f"OPIK: Failed to start trace: {e}")
+        except Exception:
+            logger.warning("OPIK: Failed to start trace", exc_info=True)
             yield None
         finally:
-            self._current_trace = None
+            if token is not None:
+                _current_trace_var.reset(token)
+
+    @property
+    def _current_trace(self) -> Any:
+        """Trace opened by this tracer in the current context (task), or None."""
+        current = _current_trace_var.get()
+        if current is None or current[0] is not self:
+            return None
+        return current[1]
+
+    @_current_trace.setter
+    def _current_trace(self, trace: Any) -> None:
+        _current_trace_var.set(None if trace is None else (self, trace))
 
-    @contextmanager
     def span(
         self,
         name: str,
         input: dict | None = None,
         metadata: dict | None = None,
         span_type: str = "general",
-    ) -> Generator[Any, None, None]:
+    ) -> AbstractContextManager[Any]:
         """
         Create a span within the current trace.
 
@@ -264,11 +422,34 @@ class AgentTracer:
             metadata: Optional metadata
             span_type: Type of span ("general", "llm", "tool")
 
-        Yields:
-            Span object with update() method (or DummySpan if disabled)
+        Returns:
+            Context manager yielding a span object with update()
+            (the shared DummySpan if disabled)
         """
         if not self.enabled or not self._current_trace:
-            yield DummySpan()
+            return _NULL_SPAN_CONTEXT
+        return self._span_context(name, input, metadata, span_type)
+
+    @contextmanager
+    def _span_context(
+        self,
+        name: str,
+        input: dict | None,
+        metadata: dict | None,
+        span_type: str,
+    ) -> Generator[Any, None, None]:
+        """Open an Opik span on the current trace."""
+        # Preferred: finalized in one operation on exit (output set via update())
+        start_as_current_span = getattr(self._opik_module, "start_as_current_span", None)
+        if start_as_current_span is not None:
+            with start_as_current_span(
+                name=name,
+                input=input or {},
+                metadata=metadata or {},
+                type=span_type,
+                project_name=self._project,
+            ) as span:
+                yield span
             return
 
         try:
@@ -279,9 +460,9 @@ class AgentTracer:
                 type=span_type,
             )
             yield span
-        except Exception as e:
-            print(f"OPIK: Failed to create span: {e}")
-            yield DummySpan()
+        except Exception:
+            logger.warning("OPIK: Failed to create span", exc_info=True)
+            yield _DUMMY_SPAN
 
     def trace_validation(
         self,
@@ -302,6 +483,9 @@ class AgentTracer:
         Returns:
             Trace ID if successful, None otherwise
         """
+        if not self.enabled or not self._client:
+            return None
+
         return self.trace(
             name="charter_validation",
             input={
@@ -346,6 +530,9 @@ class AgentTracer:
         Returns:
             Trace ID if successful, None otherwise
         """
+        if not self.enabled or not self._client:
+            return None
+
         meta = metadata or {}
         meta["agent"] = agent_name
         meta["feature"] = feature_name
@@ -382,13 +569,9 @@ class AgentTracer:
             return None
 
         try:
-            dataset = self._client.get_or_create_dataset(
-                name=name,
-                description=description or f"Dataset for {name}",
-            )
-            return dataset
-        except Exception as e:
-            print(f"OPIK: Failed to create dataset: {e}")
+            return self._get_dataset(name, description)
+        except Exception:
+            logger.warning("OPIK: Failed to create dataset", exc_info=True)
             return None
 
     def add_to_dataset(
@@ -410,13 +593,37 @@ class AgentTracer:
             return False
 
         try:
-            dataset = self._client.get_or_create_dataset(name=dataset_name)
-            dataset.insert(items)
+            self._get_dataset(dataset_name).insert(items)
             return True
-        except Exception as e:
-            print(f"OPIK: Failed to add to dataset: {e}")
+        except Exception:
+            # The handle may be stale (e.g. dataset deleted): look it up again next time
+            self.invalidate_dataset(dataset_name)
+            logger.warning("OPIK: Failed to add to dataset", exc_info=True)
             return False
 
+    def _get_dataset(self, name: str, description: str | None = None) -> Any:
+        """Get a dataset handle, fetching (or creating) it on first use."""
+        dataset = self._datasets.get(name)
+        if dataset is None:
+            dataset = self._client.get_or_create_dataset(
+                name=name,
+                description=description or f"Dataset for {name}",
+            )
+            self._datasets[name] = dataset
+        return dataset
+
+    def invalidate_dataset(self, name: str | None = None) -> None:
+        """
+        Forget cached dataset handles.
+
+        Args:
+            name: Dataset to forget (all datasets if None).
+        """
+        if name is None:
+            self._datasets.clear()
+        else:
+            self._datasets.pop(name, None)
+
     def log_feedback(
         self,
         trace_id: str,
@@ -427,6 +634,10 @@ class AgentTracer:
         """
         Log feedback/score for a trace (for optimization studio).
 
+        Outside an event loop the score is sent right away. Inside one,
+        scores are buffered and sent in batches (see FEEDBACK_BATCH_MAX);
+        call flush_feedback() to send them sooner.
+
         Args:
             trace_id: ID of the trace to score
             score: Score value (0.0 to 1.0)
@@ -434,24 +645,69 @@ class AgentTracer:
             comment: Optional comment
 
         Returns:
-            True if successful, False otherwise
+            True if the score was sent (or, inside an event loop, queued),
+            False if tracing is disabled or the send failed
         """
         if not self.enabled or not self._client:
             return False
 
-        try:
-            score_data = {"name": feedback_type, "value": score}
-            if comment:
-                score_data["reason"] = comment
+        score_data = {"id": trace_id, "name": feedback_type, "value": score}
+        if comment:
+            score_data["reason"] = comment
 
-            self._client.log_traces_feedback(
-                trace_ids=[trace_id],
-                scores=[score_data],
+        with self._feedback_lock:
+            self._feedback_buf.append(score_data)
+            full = len(self._feedback_buf) >= FEEDBACK_BATCH_MAX
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self.flush_feedback()  # No loop to flush later on
+
+        if full:
+            loop.run_in_executor(None, self.flush_feedback)
+        else:
+            self._schedule_feedback_flush(loop)
+        return True
+
+    def _schedule_feedback_flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Flush buffered feedback FEEDBACK_FLUSH_S from now on loop."""
+        with self._feedback_lock:
+            if self._feedback_timer is not None:
+                if self._feedback_loop is loop:
+                    return
+                # Scheduled on an earlier loop, which may be closed and
+                # would never fire: reschedule on this one
+                if not self._feedback_loop.is_closed():
+                    self._feedback_loop.call_soon_threadsafe(self._feedback_timer.cancel)
+            self._feedback_timer = loop.call_later(
+                FEEDBACK_FLUSH_S,
+                lambda: loop.run_in_executor(None, self.flush_feedback),
             )
+            self._feedback_loop = loop
+
+    def flush_feedback(self) -> bool:
+        """
+        Send all buffered feedback scores in one call.
+
+        Returns:
+            True if the buffer was empty or sent, False on failure
+        """
+        with self._feedback_lock:
+            batch, self._feedback_buf = self._feedback_buf, []
+            timer, loop = self._feedback_timer, self._feedback_loop
+            self._feedback_timer = self._feedback_loop = None
+        if timer is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(timer.cancel)
+        if not batch:
             return True
-        except Exception as e:
-            print(f"OPIK: Failed to log feedback: {e}")
+
+        try:
+            self._client.log_traces_feedback_scores(scores=batch)
+        except Exception:
+            logger.warning("OPIK: Failed to log feedback", exc_info=True)
             return False
+        return True
 
 
 # Global tracer instance (lazy initialized)
@@ -478,13 +734,53 @@ def get_tracer(
     return _tracer
 
 
+# Feature kwargs never recorded in traces
+_TRACE_EXCLUDED_KWARGS = frozenset(("provider", "system_message"))
+
+
+def _serialize_to_dict(result: Any) -> dict:
+    return result.to_dict()
+
+
+def _serialize_model(result: Any) -> dict:
+    return result.model_dump()
+
+
+def _serialize_dict(result: dict) -> dict:
+    return result
+
+
+def _serialize_str(result: Any) -> dict:
+    return {"result": str(result)}
+
+
+# Trace output serializer per result type, shared by all decorated features
+_serializer_cache: dict[type, Callable[[Any], dict]] = {}
+
+
+def _get_serializer(result_type: type) -> Callable[[Any], dict]:
+    """Get how results of a given type are turned into trace output."""
+    serialize = _serializer_cache.get(result_type)
+    if serialize is None:
+        if hasattr(result_type, "to_dict"):
+            serialize = _serialize_to_dict
+        elif hasattr(result_type, "model_dump"):
+            serialize = _serialize_model
+        elif issubclass(result_type, dict):
+            serialize = _serialize_dict
+        else:
+            serialize = _serialize_str
+        _serializer_cache[result_type] = serialize
+    return serialize
+
+
 def trace_feature(feature_name: str, agent_name: str = "forseti") -> Callable[[F], F]:
     """
     Decorator to trace a feature execution.
 
     Usage:
         @trace_feature("charter_validation", agent_name="forseti")
-        async def execute(self, provider, system_prompt, **kwargs):
+        async def execute(self, provider, system_message, **kwargs):
             ...
 
     Args:
@@ -496,29 +792,23 @@ def trace_feature(feature_name: str, agent_name: str = "forseti") -> Callable[[F
     """
 
     def decorator(func: F) -> F:
+        excluded = _TRACE_EXCLUDED_KWARGS
+
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
+            # Looked up per call: get_tracer(force_new=True) may replace it
             tracer = get_tracer()
+            if not tracer.enabled:
+                return await func(*args, **kwargs)
 
-            # Capture input (filter out provider and system_prompt)
-            input_data = {
-                k: v
-                for k, v in kwargs.items()
-                if k not in ("provider", "system_prompt")
-            }
+            # Capture input (filter out provider and system_message)
+            input_data = {k: v for k, v in kwargs.items() if k not in excluded}
 
             try:
                 result = await func(*args, **kwargs)
 
                 # Capture output
-                if hasattr(result, "to_dict"):
-                    output_data = result.to_dict()
-                elif hasattr(result, "model_dump"):
-                    output_data = result.model_dump()
-                elif isinstance(result, dict):
-                    output_data = result
-                else:
-                    output_data = {"result": str(result)}
+                output_data = _get_serializer(type(result))(result)
 
                 tracer.trace_feature(
                     feature_name=feature_name,
@@ -0,0 +1,180 @@
+"""
+Background Trace Queue
+
+Moves trace export off the request path: callers enqueue a payload (a
+non-blocking put) and a single background task sends them in batches.
+
+Configuration:
+    OPIK_QUEUE_MAXSIZE: Pending payloads before new ones are dropped (default 4000)
+    OPIK_QUEUE_BATCH_MAX: Payloads sent per batch (default 50)
+    OPIK_QUEUE_FLUSH_S: Max seconds a payload waits for its batch to fill (default 4)
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Callable
+
+QUEUE_MAXSIZE = int(os.getenv("OPIK_QUEUE_MAXSIZE", "4000"))
+BATCH_MAX = int(os.getenv("OPIK_QUEUE_BATCH_MAX", "50"))
+FLUSH_INTERVAL_S = float(os.getenv("OPIK_QUEUE_FLUSH_S", "4"))
+
+# Per-payload retries (mirrors the Opik SDK: 4 attempts, 0.4s doubling to 20s)
+SEND_ATTEMPTS = 4
+BACKOFF_INITIAL_S = 0.4
+BACKOFF_MAX_S = 20.0
+
+logger = logging.getLogger("ocapistaine.tracing.queue")
+
+
+class AsyncSpanQueue:
+    """
+    Bounded asyncio queue drained by one background sender task.
+
+    Bound to the event loop it is first used on; outside a running loop
+    enqueue() returns False and the caller should send synchronously.
+
+    Usage:
+        queue = AsyncSpanQueue(send=lambda payload: client.trace(**payload))
+        queue.enqueue({"name": "...", "input": {...}})
+        await queue.shutdown()
+    """
+
+    def __init__(
+        self,
+        send: Callable[[dict], Any],
+        maxsize: int = QUEUE_MAXSIZE,
+        batch_max: int = BATCH_MAX,
+        flush_interval: float = FLUSH_INTERVAL_S,
+    ):
+        """
+        Initialize the queue.
+
+        Args:
+            send: Blocking function exporting one payload (run in a worker thread).
+            maxsize: Pending payloads before new ones are dropped.
+            batch_max: Payloads collected per batch.
+            flush_interval: Max seconds to wait for a batch to fill.
+        """
+        self._send = send
+        self._maxsize = maxsize
+        self._batch_max = batch_max
+        self._flush_interval = flush_interval
+        self._queue: asyncio.Queue | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._worker: asyncio.Task | None = None
+        self.dropped = 0
+
+    def enqueue(self, payload: dict) -> bool:
+        """
+        Queue a payload for background export.
+
+        Args:
+            payload: Keyword arguments for send.
+
+        Returns:
+            True if the payload was queued (or dropped because the queue is
+            full), False if there is no running event loop.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+
+        if self._loop is not loop:
+            # First use, or the previous loop ended (e.g. repeated asyncio.run)
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self._maxsize)
+            self._worker = None
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._drain())
+
+        try:
+            self._queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning("OPIK: Trace queue full, dropped trace (%d total)", self.dropped)
+        return True
+
+    async def _drain(self) -> None:
+        """Collect payloads into batches and send them until cancelled."""
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        batch: list[dict] = []  # Collected but not yet handed to send
+        try:
+            while True:
+                batch.append(await queue.get())
+                deadline = loop.time() + self._flush_interval
+                while len(batch) < self._batch_max:
+                    try:
+                        batch.append(queue.get_nowait())
+                        continue
+                    except asyncio.QueueEmpty:
+                        pass
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), remaining))
+                    except TimeoutError:
+                        break
+
+                sending, batch = batch, []
+                try:
+                    # One failing payload must not stop the worker
+                    await asyncio.gather(
+                        *(self._send_with_retry(payload) for payload in sending),
+                        return_exceptions=True,
+                    )
+                finally:
+                    for _ in sending:
+                        queue.task_done()
+        except asyncio.CancelledError:
+            # Loop shutting down: export what is left without waiting
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            for payload in batch:
+                try:
+                    self._send(payload)
+                except Exception:
+                    logger.warning("OPIK: Failed to trace", exc_info=True)
+                finally:
+                    queue.task_done()
+            raise
+
+    async def _send_with_retry(self, payload: dict) -> None:
+        """Send one payload in a worker thread, retrying with backoff."""
+        delay = BACKOFF_INITIAL_S
+        for attempt in range(1, SEND_ATTEMPTS + 1):
+            try:
+                await asyncio.to_thread(self._send, payload)
+                return
+            except Exception:
+                if attempt == SEND_ATTEMPTS:
+                    logger.warning(
+                        "OPIK: Failed to trace after %d attempts", attempt, exc_info=True
+                    )
+                    raise
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, BACKOFF_MAX_S)
+
+    async def shutdown(self, timeout: float = 10) -> None:
+        """
+        Wait for queued payloads to be sent, then stop the worker.
+
+        Args:
+            timeout: Max seconds to wait for the queue to drain.
+        """
+        if self._queue is None or self._loop is not asyncio.get_running_loop():
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except TimeoutError:
+            logger.warning("OPIK: %d traces still pending at shutdown", self._queue.qsize())
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
@@ -4,7 +4,10 @@ Validation API Routes
 REST endpoints for charter validation using Forseti 461 agent.
 """
 
-from fastapi import APIRouter, HTTPException
+from functools import lru_cache
+
+import orjson
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel, Field
 
 from app.agents.forseti import (
@@ -13,10 +16,37 @@ from app.agents.forseti import (
     BatchResult,
     CATEGORIES,
 )
+from app.prompts.constants import CATEGORY_PROMPT_DESCRIPTIONS
 
 
 router = APIRouter(prefix="/validate", tags=["validation"])
 
+# /categories payload never changes: built and serialized once at import
+_CATEGORIES_RESPONSE = orjson.dumps({
+    "categories": CATEGORIES,
+    "descriptions": {
+        category: description[:1].upper() + description[1:]
+        for category, description in CATEGORY_PROMPT_DESCRIPTIONS.items()
+    },
+})
+
+
+@lru_cache(maxsize=8)
+def _get_agent(provider_name: str | None) -> ForsetiAgent:
+    """
+    Get the shared agent for a provider (built once, reused across requests).
+
+    Args:
+        provider_name: Optional provider name (None for the default provider).
+
+    Returns:
+        ForsetiAgent for that provider.
+
+    Raises:
+        ValueError: If the provider is unknown (not cached, so it can be retried).
+    """
+    return ForsetiAgent(provider_name=provider_name)
+
 
 # =============================================================================
 # Request/Response Models
@@ -116,7 +146,7 @@ async def validate_contribution(request: ValidateRequest) -> ValidateResponse:
     Returns validation result with assigned category.
     """
     try:
-        agent = ForsetiAgent(provider_name=request.provider)
+        agent = _get_agent(request.provider)
         result = await agent.validate(
             title=request.title,
             body=request.body,
@@ -147,7 +177,7 @@ async def validate_charter_only(
     Faster than full validation when category is not needed.
     """
     try:
-        agent = ForsetiAgent()
+        agent = _get_agent(None)
         result = await agent.validate_charter(
             title=request.title,
             body=request.body,
@@ -172,7 +202,7 @@ async def classify_category(request: ClassifyRequest) -> ClassifyResponse:
     jeunesse, alimentation-bien-etre-soins
     """
     try:
-        agent = ForsetiAgent()
+        agent = _get_agent(None)
         result = await agent.classify_category(
             title=request.title,
             body=request.body,
@@ -188,11 +218,13 @@ async def classify_category(request: ClassifyRequest) -> ClassifyResponse:
 
 
 @router.post("/batch", response_model=BatchValidateResponse)
-async def validate_batch(request: BatchValidateRequest) -> BatchValidateResponse:
+async def validate_batch(request: BatchValidateRequest) -> Response:
     """
     Validate multiple contributions in a single request.
 
     More efficient than individual calls for bulk processing.
+    The response (documented by BatchValidateResponse) is serialized in one
+    orjson pass over the result dataclasses, without re-validation.
     """
     if not request.items:
         raise HTTPException(status_code=400, detail="No items provided")
@@ -204,37 +236,27 @@ async def validate_batch(request: BatchValidateRequest) -> BatchValidateResponse
         )
 
     try:
-        agent = ForsetiAgent(provider_name=request.provider)
+        agent = _get_agent(request.provider)
         results = await agent.validate_batch(request.items)
 
         valid_count = sum(1 for r in results if r.is_valid)
 
-        return BatchValidateResponse(
-            results=results,
-            total=len(results),
-            valid_count=valid_count,
-            invalid_count=len(results) - valid_count,
-        )
+        payload = orjson.dumps({
+            "results": results,
+            "total": len(results),
+            "valid_count": valid_count,
+            "invalid_count": len(results) - valid_count,
+        })
+        return Response(content=payload, media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Batch validation error: {e}")
 
 
 @router.get("/categories")
-async def list_categories() -> dict:
+async def list_categories() -> Response:
     """
     List all available categories.
 
-    Returns the 7 categories with descriptions.
+    Returns the 7 categories with descriptions (constant, serialized once).
     """
-    return {
-        "categories": CATEGORIES,
-        "descriptions": {
-            "economie": "Business, port, tourism, local economy",
-            "logement": "Housing, real estate, urban planning",
-            "culture": "Heritage, events, arts, traditions",
-            "ecologie": "Environment, sustainability, nature",
-            "associations": "Community organizations, clubs",
-            "jeunesse": "Youth, schools, education, children",
-            "alimentation-bien-etre-soins": "Food, health, wellness, medical",
-        },
-    }
+    return Response(content=_CATEGORIES_RESPONSE, media_type="application/json")
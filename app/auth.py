@@ -10,10 +10,22 @@ import os
 import streamlit as st
 import hashlib
 import hmac
+from typing import Callable
 
 # Discord invite URL from environment
 DISCORD_INVITE_URL = os.getenv("DISCORD_INVITE_URL", "https://discord.gg/locki")
 
+# Login form markup, built once (the form renders on every rerun before login)
+_LOGIN_CSS = (
+    "<style>"
+    ".login-container{max-width:400px;margin:100px auto;padding:40px;"
+    "border-radius:10px;box-shadow:0 4px 6px rgba(0,0,0,0.1);}"
+    "</style>"
+)
+_DISCORD_HINT = (
+    f"🐇 Need the password? Join our [Discord]({DISCORD_INVITE_URL}) to request access."
+)
+
 
 def check_password() -> bool:
     """
@@ -41,32 +53,66 @@ def check_password() -> bool:
     return False
 
 
-def _auth_enabled() -> bool:
-    """Check if authentication is enabled via secrets."""
+def _blake2b_digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=32).digest()
+
+
+def _sha256_digest(data: bytes) -> bytes:
+    return hashlib.sha256(data).digest()
+
+
+# Stored password prefixes and their hash functions ("sha256:" kept for
+# secrets written before hash_password switched to BLAKE2b)
+_HASH_SCHEMES = {
+    "b2b:": _blake2b_digest,
+    "sha256:": _sha256_digest,
+}
+
+
+@st.cache_resource
+def _get_auth_config() -> tuple[bool, bytes, Callable[[bytes], bytes]]:
+    """
+    Read the auth settings from secrets once per process.
+
+    Streamlit reruns the script on every widget event; caching avoids a
+    secrets lookup per rerun. Call _get_auth_config.clear() after changing
+    secrets.toml.
+
+    Returns:
+        (enabled, stored_digest, digest) - auth is enabled if a password is
+        set; stored_digest is the raw 32-byte hash of the password, decoded
+        from a "b2b:"/"sha256:" value or computed here from a plain-text one,
+        and digest is the hash function to apply to login attempts.
+    """
     try:
-        # Auth is enabled if password is set in secrets
-        return bool(st.secrets.get("auth", {}).get("password"))
+        stored_password = st.secrets.get("auth", {}).get("password", "") or ""
     except Exception:
         # No secrets file or auth section
-        return False
+        stored_password = ""
+
+    for prefix, digest in _HASH_SCHEMES.items():
+        if stored_password.startswith(prefix):
+            try:
+                return True, bytes.fromhex(stored_password[len(prefix):]), digest
+            except ValueError:
+                # Malformed hash: keep auth on, but no password can match
+                return True, b"", digest
+
+    return (
+        bool(stored_password),
+        _blake2b_digest(stored_password.encode()),
+        _blake2b_digest,
+    )
+
+
+def _auth_enabled() -> bool:
+    """Check if authentication is enabled via secrets."""
+    return _get_auth_config()[0]
 
 
 def _show_login_form():
     """Display the login form."""
-    st.markdown(
-        """
-        <style>
-        .login-container {
-            max-width: 400px;
-            margin: 100px auto;
-            padding: 40px;
-            border-radius: 10px;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_LOGIN_CSS, unsafe_allow_html=True)
 
     col1, col2, col3 = st.columns([1, 2, 1])
 
@@ -89,25 +135,21 @@ def _show_login_form():
 
         st.markdown("---")
         st.markdown(
-            f"🐇 Need the password? Join our [Discord]({DISCORD_INVITE_URL}) to request access.",
+            _DISCORD_HINT,
             help="Contact the team on Discord to get the password",
         )
 
 
 def _verify_password(password: str) -> bool:
-    """Verify the entered password against the stored hash."""
+    """
+    Verify the entered password against the stored hash.
+
+    Plain-text and hashed stored passwords are all compared as 32-byte
+    digests, so the comparison time does not depend on the password length.
+    """
     try:
-        stored_password = st.secrets.get("auth", {}).get("password", "")
-
-        # Support both plain text and hashed passwords
-        if stored_password.startswith("sha256:"):
-            # Hashed password
-            stored_hash = stored_password[7:]
-            input_hash = hashlib.sha256(password.encode()).hexdigest()
-            return hmac.compare_digest(stored_hash, input_hash)
-        else:
-            # Plain text password (for simplicity)
-            return hmac.compare_digest(password, stored_password)
+        _, stored_digest, digest = _get_auth_config()
+        return hmac.compare_digest(stored_digest, digest(password.encode()))
     except Exception:
         return False
 
@@ -125,4 +167,4 @@ def hash_password(password: str) -> str:
     Usage:
         python -c "from app.auth import hash_password; print(hash_password('your-password'))"
     """
-    return f"sha256:{hashlib.sha256(password.encode()).hexdigest()}"
+    return f"b2b:{_blake2b_digest(password.encode()).hex()}"
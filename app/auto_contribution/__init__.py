@@ -13,16 +13,19 @@ The business logic is in app/processors/workflows/workflow_autocontribution.py
 This module provides the Streamlit UI views.
 """
 
+import importlib
+
 from .views import autocontribution_view
 
-# Re-export workflow components for convenience
-from app.processors.workflows.workflow_autocontribution import (
-    AutoContributionWorkflow,
-    AutoContributionConfig,
-    AutoContributionResult,
-    DraftContribution,
-    CATEGORY_DESCRIPTIONS,
-)
+# Workflow components re-exported for convenience, loaded on first access
+# (PEP 562) so importing the view does not pull in the whole workflow
+_EXPORTS = {
+    "AutoContributionWorkflow": "app.processors.workflows.workflow_autocontribution",
+    "AutoContributionConfig": "app.processors.workflows.workflow_autocontribution",
+    "AutoContributionResult": "app.processors.workflows.workflow_autocontribution",
+    "DraftContribution": "app.processors.workflows.workflow_autocontribution",
+    "CATEGORY_DESCRIPTIONS": "app.prompts.constants",
+}
 
 __all__ = [
     # UI View
@@ -34,3 +37,16 @@ __all__ = [
     "DraftContribution",
     "CATEGORY_DESCRIPTIONS",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -11,20 +11,73 @@ Step 4: Edit Contribution -> User edits constat_factuel & idees_ameliorations
 Step 5: Save              -> Validate with Forseti 461 and store to Redis
 """
 
+from types import MappingProxyType
+
 import streamlit as st
 
 from app.i18n import _, get_language
-from app.agents.forseti import CATEGORIES
+from app.prompts.constants import CATEGORIES, CATEGORY_DESCRIPTIONS
 from app.sidebar import get_selected_provider, get_model_id
 
-# Import workflow functions
-from app.processors.workflows.workflow_autocontribution import (
-    step_1_load_sources,
-    load_source_content,
-    step_3_generate_draft,
-    step_5_validate_and_save,
-    CATEGORY_DESCRIPTIONS,
-)
+# Workflow functions are imported where used: the workflow module pulls in
+# the LLM providers, Forseti and Opik, which tabs other than this one never need
+
+
+# Document index cache lifetime (the Audierne docs rarely change)
+SOURCES_CACHE_TTL = 24 * 60 * 60
+
+# Step indicator markup (filled with the translated step name)
+_STEP_DONE = "✅ **%s**"
+_STEP_CURRENT = "🔵 **%s**"
+_STEP_PENDING = "⚪ %s"
+
+# Localized category descriptions, flattened to one lookup per render.
+# Missing translations are left out so each caller picks its own fallback.
+_CATEGORY_DESC = {
+    (cat, lang): CATEGORY_DESCRIPTIONS[cat][lang]
+    for cat in CATEGORIES
+    for lang in ("en", "fr")
+    if lang in CATEGORY_DESCRIPTIONS.get(cat, {})
+}
+
+# Selectbox position of each category
+_CATEGORY_INDEX = {cat: i for i, cat in enumerate(CATEGORIES)}
+
+
+# =============================================================================
+# CACHED DATA
+# =============================================================================
+
+@st.cache_data(ttl=SOURCES_CACHE_TTL, show_spinner=False)
+def _cached_load_sources() -> list[dict[str, str]]:
+    """Document list for step 1, shared across reruns and sessions."""
+    from app.processors.workflows.workflow_autocontribution import step_1_load_sources
+
+    return step_1_load_sources()
+
+
+@st.cache_resource(ttl=SOURCES_CACHE_TTL, show_spinner=False)
+def _cached_doc_options() -> tuple[tuple[str, ...], MappingProxyType]:
+    """
+    Step 1 selectbox data, built once from the cached document list.
+
+    A resource (shared, not copied per call) rather than cache_data, which
+    would unpickle a fresh dict on every rerun; read-only so sessions
+    cannot mutate the shared mapping.
+
+    Returns:
+        (document paths, path -> display label)
+    """
+    labels = {d["path"]: f"{d['title']} ({d['filename']})" for d in _cached_load_sources()}
+    return tuple(labels), MappingProxyType(labels)
+
+
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def _cached_load_source_content(path: str) -> str:
+    """Content of one source document, cached per path (bounded)."""
+    from app.processors.workflows.workflow_autocontribution import load_source_content
+
+    return load_source_content(path)
 
 
 # =============================================================================
@@ -33,27 +86,30 @@ from app.processors.workflows.workflow_autocontribution import (
 
 def _init_state():
     """Initialize session state for auto-contribution tab."""
-    defaults = {
-        "autocontrib_step": 1,
-        "autocontrib_source_type": "audierne_docs",
-        "autocontrib_source_content": "",
-        "autocontrib_source_title": "",
-        "autocontrib_category": CATEGORIES[0],
-        "autocontrib_draft_constat": "",
-        "autocontrib_draft_idees": "",
-        "autocontrib_saved_id": None,
-        "autocontrib_validation_result": None,
-    }
-    for key, value in defaults.items():
-        if key not in st.session_state:
-            st.session_state[key] = value
+    state = st.session_state
+    state.setdefault("autocontrib_step", 1)
+    state.setdefault("autocontrib_source_type", "audierne_docs")
+    state.setdefault("autocontrib_source_content", "")
+    state.setdefault("autocontrib_source_title", "")
+    state.setdefault("autocontrib_category", CATEGORIES[0])
+    state.setdefault("autocontrib_draft_constat", "")
+    state.setdefault("autocontrib_draft_idees", "")
+    state.setdefault("autocontrib_saved_id", None)
+    state.setdefault("autocontrib_validation_result", None)
+    # The step 4 text areas own the draft keys, and Streamlit drops a widget's
+    # state after a run that does not render it; re-assigning keeps the drafts
+    # while the user is on the other steps
+    state.autocontrib_draft_constat = state.autocontrib_draft_constat
+    state.autocontrib_draft_idees = state.autocontrib_draft_idees
+    # Builds the source previews if this session has none yet
+    _set_source_content(st.session_state.autocontrib_source_content)
 
 
 def _reset_state():
     """Reset all state for new contribution."""
     st.session_state.autocontrib_step = 1
     st.session_state.autocontrib_source_type = "audierne_docs"
-    st.session_state.autocontrib_source_content = ""
+    _set_source_content("")
     st.session_state.autocontrib_source_title = ""
     st.session_state.autocontrib_category = CATEGORIES[0]
     st.session_state.autocontrib_draft_constat = ""
@@ -62,6 +118,21 @@ def _reset_state():
     st.session_state.autocontrib_validation_result = None
 
 
+def _preview(content: str, limit: int) -> str:
+    """First limit characters of content, with "..." if truncated."""
+    return content[:limit] + ("..." if len(content) > limit else "")
+
+
+def _set_source_content(content: str) -> None:
+    """Store the source text and its previews (rebuilt only when the text changes)."""
+    state = st.session_state
+    if content == state.get("autocontrib_source_content") and "autocontrib_source_preview_1000" in state:
+        return
+    state.autocontrib_source_content = content
+    state.autocontrib_source_preview_1000 = _preview(content, 1000)
+    state.autocontrib_source_preview_2000 = _preview(content, 2000)
+
+
 def _get_language() -> str:
     """Get current language code."""
     lang = get_language()
@@ -89,30 +160,27 @@ def autocontribution_view(user_id: str):
         _("autocontrib_step5_short"),
     ]
 
-    # Visual step indicator
-    cols = st.columns(5)
-    for i, (col, step_name) in enumerate(zip(cols, steps), 1):
-        with col:
-            if i < step:
-                st.markdown(f"✅ **{step_name}**")
-            elif i == step:
-                st.markdown(f"🔵 **{step_name}**")
-            else:
-                st.markdown(f"⚪ {step_name}")
+    # Visual step indicator: done steps, then the current one, then pending ones
+    lines = [_STEP_DONE % name for name in steps[: step - 1]]
+    lines.append(_STEP_CURRENT % steps[step - 1])
+    lines.extend(_STEP_PENDING % name for name in steps[step:])
+    for col, line in zip(st.columns(5), lines):
+        col.markdown(line)
 
     st.markdown("---")
 
-    # Render current step
+    # Render current step (language resolved once per rerun)
+    lang = _get_language()
     if step == 1:
         _render_step_1_source()
     elif step == 2:
-        _render_step_2_category()
+        _render_step_2_category(lang)
     elif step == 3:
-        _render_step_3_inspiration()
+        _render_step_3_inspiration(lang)
     elif step == 4:
-        _render_step_4_edit()
+        _render_step_4_edit(lang)
     elif step == 5:
-        _render_step_5_confirmation()
+        _render_step_5_confirmation(lang)
 
 
 # =============================================================================
@@ -137,25 +205,24 @@ def _render_step_1_source():
     st.session_state.autocontrib_source_type = source_type
 
     if source_type == "audierne_docs":
-        # Use workflow function to load sources
-        docs = step_1_load_sources()
-        if docs:
-            doc_options = {d["path"]: f"{d['title']} ({d['filename']})" for d in docs}
+        # Use workflow function to load sources (cached across reruns)
+        doc_paths, doc_options = _cached_doc_options()
+        if doc_paths:
             selected_doc = st.selectbox(
                 _("autocontrib_select_doc"),
-                options=list(doc_options.keys()),
-                format_func=lambda x: doc_options[x],
+                options=doc_paths,
+                format_func=doc_options.__getitem__,
                 key="autocontrib_selected_doc",
             )
 
             if selected_doc:
-                content = load_source_content(selected_doc)
-                st.session_state.autocontrib_source_content = content
+                content = _cached_load_source_content(selected_doc)
+                _set_source_content(content)
                 st.session_state.autocontrib_source_title = doc_options[selected_doc]
 
                 # Preview
                 with st.expander(_("autocontrib_source_preview"), expanded=False):
-                    st.markdown(content[:2000] + ("..." if len(content) > 2000 else ""))
+                    st.markdown(st.session_state.autocontrib_source_preview_2000)
         else:
             st.warning(_("autocontrib_no_docs"))
 
@@ -174,7 +241,7 @@ def _render_step_1_source():
             key="autocontrib_paste_content",
             placeholder=_("autocontrib_source_paste_placeholder"),
         )
-        st.session_state.autocontrib_source_content = content
+        _set_source_content(content)
 
     # Navigation
     st.markdown("---")
@@ -195,18 +262,16 @@ def _render_step_1_source():
         st.caption(_("autocontrib_validation_empty_source"))
 
 
-def _render_step_2_category():
+def _render_step_2_category(lang: str):
     """Step 2: Choose category."""
     st.markdown(f"### {_('autocontrib_step2_title')}")
 
-    lang = _get_language()
-
     # Category selector with descriptions
     category = st.selectbox(
         _("autocontrib_select_category"),
         options=CATEGORIES,
-        format_func=lambda x: f"{x.capitalize()} - {CATEGORY_DESCRIPTIONS.get(x, {}).get(lang, '')}",
-        index=CATEGORIES.index(st.session_state.autocontrib_category),
+        format_func=lambda x: f"{x.capitalize()} - {_CATEGORY_DESC.get((x, lang), '')}",
+        index=_CATEGORY_INDEX[st.session_state.autocontrib_category],
         key="autocontrib_category_select",
     )
     st.session_state.autocontrib_category = category
@@ -216,10 +281,7 @@ def _render_step_2_category():
     # Show source preview
     with st.expander(_("autocontrib_source_preview"), expanded=False):
         st.markdown(f"**{st.session_state.autocontrib_source_title}**")
-        st.markdown(
-            st.session_state.autocontrib_source_content[:1000]
-            + ("..." if len(st.session_state.autocontrib_source_content) > 1000 else "")
-        )
+        st.markdown(st.session_state.autocontrib_source_preview_1000)
 
     # Navigation
     st.markdown("---")
@@ -238,23 +300,19 @@ def _render_step_2_category():
             st.rerun()
 
 
-def _render_step_3_inspiration():
+def _render_step_3_inspiration(lang: str):
     """Step 3: Get AI-generated inspiration/draft."""
     st.markdown(f"### {_('autocontrib_step3_title')}")
 
-    lang = _get_language()
     category = st.session_state.autocontrib_category
-    category_desc = CATEGORY_DESCRIPTIONS.get(category, {}).get(lang, category)
+    category_desc = _CATEGORY_DESC.get((category, lang), category)
 
     st.markdown(f"**{_('autocontrib_category')}:** {category.capitalize()} - {category_desc}")
 
     # Show source preview
     with st.expander(_("autocontrib_source_preview"), expanded=False):
         st.markdown(f"**{st.session_state.autocontrib_source_title}**")
-        st.markdown(
-            st.session_state.autocontrib_source_content[:1000]
-            + ("..." if len(st.session_state.autocontrib_source_content) > 1000 else "")
-        )
+        st.markdown(st.session_state.autocontrib_source_preview_1000)
 
     # Generate button
     col1, col2 = st.columns([2, 1])
@@ -279,6 +337,8 @@ def _render_step_3_inspiration():
             provider = get_selected_provider()
             model = get_model_id()
 
+            from app.processors.workflows.workflow_autocontribution import step_3_generate_draft
+
             # Use workflow function
             draft = step_3_generate_draft(
                 source_text=st.session_state.autocontrib_source_content,
@@ -327,37 +387,30 @@ def _render_step_3_inspiration():
             st.rerun()
 
 
-def _render_step_4_edit():
+def _render_step_4_edit(lang: str):
     """Step 4: Edit the contribution."""
     st.markdown(f"### {_('autocontrib_step4_title')}")
 
-    lang = _get_language()
     category = st.session_state.autocontrib_category
-    category_desc = CATEGORY_DESCRIPTIONS.get(category, {}).get(lang, category)
+    category_desc = _CATEGORY_DESC.get((category, lang), category)
 
     st.markdown(f"**{_('autocontrib_category')}:** {category.capitalize()} - {category_desc}")
 
-    # Editable text areas
+    # Editable text areas (their keys are the draft state)
     constat = st.text_area(
         _("autocontrib_constat_factuel"),
-        value=st.session_state.autocontrib_draft_constat,
         height=150,
         help=_("autocontrib_constat_help"),
-        key="autocontrib_edit_constat",
+        key="autocontrib_draft_constat",
     )
 
     idees = st.text_area(
         _("autocontrib_idees_ameliorations"),
-        value=st.session_state.autocontrib_draft_idees,
         height=150,
         help=_("autocontrib_idees_help"),
-        key="autocontrib_edit_idees",
+        key="autocontrib_draft_idees",
     )
 
-    # Update session state
-    st.session_state.autocontrib_draft_constat = constat
-    st.session_state.autocontrib_draft_idees = idees
-
     # Validation
     is_valid = bool(constat.strip() and idees.strip())
     if not is_valid:
@@ -383,6 +436,8 @@ def _render_step_4_edit():
                 provider = get_selected_provider()
                 model = get_model_id()
 
+                from app.processors.workflows.workflow_autocontribution import step_5_validate_and_save
+
                 # Use workflow function
                 result = step_5_validate_and_save(
                     constat_factuel=st.session_state.autocontrib_draft_constat,
@@ -405,7 +460,7 @@ def _render_step_4_edit():
                 st.rerun()
 
 
-def _render_step_5_confirmation():
+def _render_step_5_confirmation(lang: str):
     """Step 5: Confirmation after save."""
     st.markdown(f"### {_('autocontrib_step5_title')}")
 
@@ -449,9 +504,8 @@ def _render_step_5_confirmation():
     st.markdown("---")
 
     # Show what was saved
-    lang = _get_language()
     category = st.session_state.autocontrib_category
-    category_desc = CATEGORY_DESCRIPTIONS.get(category, {}).get(lang, category)
+    category_desc = _CATEGORY_DESC.get((category, lang), category)
 
     st.markdown(f"**{_('autocontrib_category')}:** {category.capitalize()} - {category_desc}")
 
@@ -6,38 +6,61 @@ Single Redis connection for all caching needs.
 Handles sessions, chat history, and document cache.
 """
 
+import hashlib
+import logging
 import os
+import socket
+import time
 import redis
-from typing import Optional
+import streamlit as st
 from contextlib import contextmanager
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = logging.getLogger("ocapistaine.data.redis_client")
 
-# Global connection pool
-_redis_pool: Optional[redis.ConnectionPool] = None
+# Secret for the keyed hash of user ids in keys (BLAKE2b keys are at most 64 bytes)
+_KEY_SECRET = os.getenv("REDIS_KEY_SECRET", "").encode()
+if not _KEY_SECRET:
+    # Unkeyed tags can be reversed by hashing candidate user ids
+    logger.warning("REDIS_KEY_SECRET is not set: user tags in Redis keys are unkeyed")
 
+# Pool size: every widget event may touch Redis, across all user sessions
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONN", "64"))
+
+# Probe idle connections so NAT/load balancers don't silently drop them
+# (the TCP_KEEP* constants are Linux-specific; elsewhere use OS defaults)
+_KEEPALIVE_OPTIONS = {
+    getattr(socket, name): value
+    for name, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    if hasattr(socket, name)
+}
 
-def get_redis_pool() -> redis.ConnectionPool:
-    """
-    Get or create Redis connection pool.
 
-    Uses REDIS_PORT/ REDIS_DB from environment or defaults to localhost.
+@st.cache_resource
+def get_redis_pool() -> redis.ConnectionPool:
     """
-    global _redis_pool
+    Get the Redis connection pool (one per server process).
 
-    if _redis_pool is None:
-        redis_db = os.getenv("REDIS_DB", "5")
-        redis_port = os.getenv("REDIS_PORT", "6379")
-        redis_url = f"redis://localhost:{redis_port}/{redis_db}"
-        _redis_pool = redis.ConnectionPool.from_url(
-            redis_url,
-            decode_responses=True,
-            max_connections=10,
-        )
+    Cached as a Streamlit resource so every session shares the pool and it
+    survives script reruns; outside Streamlit (FastAPI, scripts) the cache
+    still holds a single pool for the process.
 
-    return _redis_pool
+    Uses REDIS_PORT/ REDIS_DB from environment or defaults to localhost;
+    REDIS_MAX_CONN caps the pool size (default 64).
+    """
+    redis_db = os.getenv("REDIS_DB", "5")
+    redis_port = os.getenv("REDIS_PORT", "6379")
+    redis_url = f"redis://localhost:{redis_port}/{redis_db}"
+    return redis.ConnectionPool.from_url(
+        redis_url,
+        decode_responses=True,
+        max_connections=REDIS_MAX_CONNECTIONS,
+        socket_keepalive=True,
+        socket_keepalive_options=_KEEPALIVE_OPTIONS,
+        health_check_interval=30,
+    )
 
 
 def get_redis_connection() -> redis.Redis:
@@ -67,23 +90,65 @@ def redis_connection():
         pass  # Connection returns to pool automatically
 
 
+@contextmanager
+def redis_pipeline(transaction: bool = False):
+    """
+    Context manager for a Redis pipeline, executed on exit.
+
+    Queued commands travel in one round trip; nothing is sent if the block
+    raises.
+
+    Usage:
+        with redis_pipeline() as pipe:
+            pipe.set("key", "value")
+            pipe.expire("key", 60)
+    """
+    pipe = get_redis_connection().pipeline(transaction=transaction)
+    try:
+        yield pipe
+        pipe.execute()
+    finally:
+        pipe.reset()
+
+
 # Key prefixes for organization
 class RedisKeys:
-    """Redis key patterns."""
+    """
+    Redis key builders (the single source of truth for key formats).
+
+    User ids are replaced by a fixed-size keyed tag (see user_tag), so keys
+    stay short whatever the id length and carry no raw user identifiers.
 
-    SESSION = "session:{user_id}"
-    CHAT = "chat:{user_id}:{thread_id}"
-    DOCUMENT = "document:{doc_id}"
-    RATE_LIMIT = "rate_limit:{user_id}"
-    CRAWL_STATUS = "crawl:{source}"
+    Migration: keys written before tagging (session:{user_id},
+    chat:{user_id}) are no longer read; they expire with their TTL
+    (SessionManager.TTL_SESSION / TTL_CHAT). Changing REDIS_KEY_SECRET
+    orphans the tagged keys the same way.
+    """
+
+    @staticmethod
+    def user_tag(user_id: str) -> str:
+        """16-hex-char keyed BLAKE2b tag standing in for a user id in keys."""
+        return hashlib.blake2b(
+            user_id.encode("utf-8"), key=_KEY_SECRET, digest_size=8
+        ).hexdigest()
 
     @staticmethod
     def session(user_id: str) -> str:
-        return f"session:{user_id}"
+        return f"session:{RedisKeys.user_tag(user_id)}"
 
     @staticmethod
-    def chat(user_id: str, thread_id: str) -> str:
-        return f"chat:{user_id}:{thread_id}"
+    def chat_history(user_id: str, thread_id: str) -> str:
+        return f"chat:{RedisKeys.user_tag(user_id)}:{thread_id}"
+
+    @staticmethod
+    def chat_seq(user_id: str, thread_id: str) -> str:
+        """Count of messages ever appended to a thread (changes on every append)."""
+        return f"chat:{RedisKeys.user_tag(user_id)}:{thread_id}:seq"
+
+    @staticmethod
+    def chat_pattern(user_id: str) -> str:
+        """SCAN pattern matching all chat keys of a user (every thread)."""
+        return f"chat:{RedisKeys.user_tag(user_id)}:*"
 
     @staticmethod
     def document(doc_id: str) -> str:
@@ -91,7 +156,32 @@ class RedisKeys:
 
     @staticmethod
     def rate_limit(user_id: str) -> str:
-        return f"rate_limit:{user_id}"
+        return f"rate_limit:{RedisKeys.user_tag(user_id)}"
+
+    @staticmethod
+    def crawl_status(source: str) -> str:
+        return f"crawl:{source}"
+
+    @staticmethod
+    def issues(state: str, labels: str, per_page: int) -> str:
+        return f"gh:issues:{state}:{labels}:{per_page}"
+
+    @staticmethod
+    def forseti_validation(content_hash: str) -> str:
+        return f"forseti:{content_hash}"
+
+    @classmethod
+    def keys_for_user(cls, user_id: str) -> tuple[str, str]:
+        """
+        All fixed per-user keys, for batched MGET/DEL through a pipeline.
+
+        Chat keys are per thread; find them with SCAN over chat_pattern.
+
+        Returns:
+            (session key, rate limit key)
+        """
+        tag = cls.user_tag(user_id)
+        return (f"session:{tag}", f"rate_limit:{tag}")
 
 
 # TTL constants (in seconds)
@@ -102,17 +192,36 @@ class TTL:
     CHAT = 604800  # 7 days
     DOCUMENT = 3600  # 1 hour
     RATE_LIMIT = 60  # 1 minute
+    FORSETI_VALIDATION = 86400  # 24 hours
+
+
+# Seconds a health check result is reused (dashboards and middleware poll it)
+HEALTH_CHECK_TTL_S = 2.0
+
+# (monotonic time of the last PING, its result)
+_last_health_check: tuple[float, bool] = (float("-inf"), False)
 
 
 def health_check() -> bool:
     """
     Check Redis connection health.
 
+    The PING result is reused for HEALTH_CHECK_TTL_S seconds, so frequent
+    polling costs at most one round trip per window.
+
     Returns:
         bool: True if Redis is reachable
     """
+    global _last_health_check
+
+    checked_at, ok = _last_health_check
+    now = time.monotonic()
+    if now - checked_at < HEALTH_CHECK_TTL_S:
+        return ok
+
     try:
-        r = get_redis_connection()
-        return r.ping()
+        ok = bool(get_redis_connection().ping())
     except redis.ConnectionError:
-        return False
+        ok = False
+    _last_health_check = (now, ok)
+    return ok
@@ -0,0 +1,123 @@
+# swr_cache.py
+"""
+Stale-While-Revalidate Cache
+
+In-process cache for slow fetches whose data changes at human cadence.
+Entries older than soft_ttl are still served immediately while a background
+thread refreshes them; only entries older than hard_ttl (or missing) are
+fetched inline.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger("ocapistaine.data.swr_cache")
+
+
+class StaleWhileRevalidateCache(Generic[T]):
+    """
+    Cache keyed by the fetch arguments, refreshed in the background.
+
+    Thread-safe; at most one refresh per key runs at a time. invalidate()
+    and clear() bump a generation, so a fetch started before them cannot
+    store its (possibly stale) result afterwards.
+
+    Usage:
+        cache = StaleWhileRevalidateCache(fetch_issues, soft_ttl=300, hard_ttl=3600)
+        issues = cache.get("open", "")
+        cache.invalidate("open", "")  # Next get fetches inline
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[..., T],
+        soft_ttl: float,
+        hard_ttl: float,
+        cacheable: Callable[[T], bool] | None = None,
+        max_workers: int = 2,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            fetch: Function producing the value for a set of arguments.
+            soft_ttl: Seconds after which a hit triggers a background refresh.
+            hard_ttl: Seconds after which an entry is no longer served.
+            cacheable: Optional predicate; values failing it (e.g. error
+                results) are returned but not stored, and a failed refresh
+                keeps the previous value.
+            max_workers: Background refresh threads.
+        """
+        self._fetch = fetch
+        self._soft_ttl = soft_ttl
+        self._hard_ttl = hard_ttl
+        self._cacheable = cacheable
+        self._entries: dict[Hashable, tuple[T, float]] = {}
+        self._refreshing: set[Hashable] = set()
+        # Bumped by invalidate (per key) and clear (all keys)
+        self._generations: dict[Hashable, int] = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix="swr-refresh")
+
+    def get(self, *args: Hashable) -> T:
+        """
+        Get the value for these fetch arguments.
+
+        Returns:
+            The cached value (possibly stale, with a refresh scheduled) or a
+            freshly fetched one.
+        """
+        now = time.monotonic()
+        with self._lock:
+            generation = self._generation(args)
+            entry = self._entries.get(args)
+            if entry is not None:
+                value, fetched_at = entry
+                age = now - fetched_at
+                if age < self._hard_ttl:
+                    if age >= self._soft_ttl and args not in self._refreshing:
+                        self._refreshing.add(args)
+                        self._executor.submit(self._refresh, args, generation)
+                    return value
+
+        return self._store(args, self._fetch(*args), generation)
+
+    def invalidate(self, *args: Hashable) -> None:
+        """Drop the entry for these fetch arguments."""
+        with self._lock:
+            self._entries.pop(args, None)
+            self._generations[args] = self._generations.get(args, 0) + 1
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._generations.clear()
+            self._epoch += 1
+
+    def _generation(self, args: tuple) -> tuple[int, int]:
+        # Called with the lock held
+        return self._epoch, self._generations.get(args, 0)
+
+    def _store(self, args: tuple, value: T, generation: tuple[int, int]) -> T:
+        if self._cacheable is None or self._cacheable(value):
+            with self._lock:
+                # Fetched before an invalidate/clear: return it, don't keep it
+                if self._generation(args) == generation:
+                    self._entries[args] = (value, time.monotonic())
+        return value
+
+    def _refresh(self, args: tuple, generation: tuple[int, int]) -> None:
+        try:
+            self._store(args, self._fetch(*args), generation)
+        except Exception:
+            logger.warning("Background refresh failed for %r", args, exc_info=True)
+        finally:
+            with self._lock:
+                self._refreshing.discard(args)
@@ -7,10 +7,19 @@ User identification via single UUID (cookie-based).
 """
 
 import asyncio
+import hashlib
+import threading
 import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable
 
+import orjson
+import redis
 import requests
 import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 # MUST be first Streamlit command
 st.set_page_config(
@@ -26,12 +35,14 @@ if not check_password():
 
 from app.sidebar import sidebar_setup, get_user_id, get_selected_provider, get_model_id
 from app.agents.forseti import ForsetiAgent
+from app.agents.forseti.agent import BATCH_MAX_CONCURRENCY
 from app.providers import get_provider
-from app.i18n import _
+from app.i18n import LANGUAGES, _, get_language
 from app.services import PresentationLogger, ServiceLogger, AgentLogger
 from app.mockup.batch_view import batch_validation_view
 from app.auto_contribution import autocontribution_view
-from data.redis_client import get_redis_connection
+from app.data.swr_cache import StaleWhileRevalidateCache
+from app.data.redis_client import RedisKeys, TTL, get_redis_connection, redis_pipeline
 
 # TODO: Import services when implemented
 # from app.services.chat_service import ChatService
@@ -43,6 +54,77 @@ _svc_logger = ServiceLogger("chat")
 _agent_logger = AgentLogger("forseti")
 
 
+# Max seconds to wait for one Forseti validation
+FORSETI_TIMEOUT_S = 120
+
+
+@st.cache_resource
+def _loop() -> asyncio.AbstractEventLoop:
+    """
+    Event loop for agent calls, running in a daemon thread for the server's lifetime.
+
+    One long-lived loop instead of asyncio.run per click: provider SDK async
+    clients keep their connection pools (a closed loop would discard them,
+    and clients bound to it would fail on the next call).
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="forseti-loop", daemon=True).start()
+    return loop
+
+
+def _run(coro, timeout: float = FORSETI_TIMEOUT_S):
+    """
+    Run a coroutine on the shared loop and wait for its result.
+
+    Raises:
+        TimeoutError: If it does not finish within timeout (it is cancelled).
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, _loop())
+    try:
+        return future.result(timeout)
+    except TimeoutError:
+        future.cancel()
+        raise
+
+
+def _iter_on_loop(agen, timeout: float = FORSETI_TIMEOUT_S):
+    """
+    Iterate an async generator on the shared loop from the script thread.
+
+    Each item is produced on the loop (see _run) and handed back as soon as
+    it is ready, so callers can render partial output.
+
+    Raises:
+        TimeoutError: If the whole iteration takes longer than timeout.
+    """
+    deadline = time.monotonic() + timeout
+    try:
+        while True:
+            try:
+                yield _run(agen.__anext__(), max(deadline - time.monotonic(), 0))
+            except StopAsyncIteration:
+                return
+    finally:
+        try:
+            _run(agen.aclose())
+        except RuntimeError:
+            pass  # Still unwinding a cancelled step; it closes itself
+
+
+@st.cache_resource
+def _shared_forseti_agent(provider_name: str | None, model_id: str | None) -> ForsetiAgent:
+    """
+    Forseti agent per provider/model, shared by all sessions.
+
+    Its provider SDK clients (and their connection pools) are created once
+    and used on the shared loop (see _loop). None, None gives the default agent.
+    """
+    if provider_name is None:
+        return ForsetiAgent()
+    provider = get_provider(provider_name, model=model_id, cache=False)
+    return ForsetiAgent(provider=provider)
+
+
 def get_forseti_agent():
     """Get or create Forseti agent instance based on sidebar selection."""
     provider_name = get_selected_provider()
@@ -54,8 +136,7 @@ def get_forseti_agent():
     # Check if we have a cached agent for this config
     if cache_key not in st.session_state:
         try:
-            provider = get_provider(provider_name, model=model_id, cache=False)
-            st.session_state[cache_key] = ForsetiAgent(provider=provider)
+            st.session_state[cache_key] = _shared_forseti_agent(provider_name, model_id)
             _agent_logger.info(
                 "AGENT_INIT",
                 provider=provider_name,
@@ -70,7 +151,7 @@ def get_forseti_agent():
                 error=str(e),
             )
             # Fallback to default
-            st.session_state[cache_key] = ForsetiAgent()
+            st.session_state[cache_key] = _shared_forseti_agent(None, None)
 
     return st.session_state[cache_key]
 
@@ -162,23 +243,118 @@ CATEGORY_LABELS = [
     "conforme charte",
 ]
 
+# Category color mapping for issue cards
+CATEGORY_COLORS = MappingProxyType({
+    "economie": "🔵",
+    "logement": "🟠",
+    "culture": "🟣",
+    "ecologie": "🟢",
+    "associations": "🟡",
+    "jeunesse": "🔴",
+    "alimentation-bien-etre-soins": "🩷",
+})
+
+
+@st.cache_resource
+def _http() -> requests.Session:
+    """
+    HTTP session for webhook calls, shared across reruns and sessions.
+
+    Keep-alive reuses the TLS connection to the webhook host instead of a
+    new handshake per fetch. The issues webhook is read-only, so retrying
+    its POSTs is safe.
+    """
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=2, backoff_factor=0.2, allowed_methods=frozenset({"POST"})
+            ),
+        ),
+    )
+    return session
+
+
+# Issue list freshness: served from cache for ISSUES_SOFT_TTL_S, then served
+# stale while a background refresh runs, until ISSUES_HARD_TTL_S
+ISSUES_SOFT_TTL_S = 300
+ISSUES_HARD_TTL_S = 3600
+# Issues per webhook call; a label is queried server-side when a page is full
+ISSUES_PER_PAGE = 50
+
+
+@st.cache_resource
+def _issues_cache() -> StaleWhileRevalidateCache:
+    """Issue list cache shared across reruns and sessions (failed fetches are not kept)."""
+    return StaleWhileRevalidateCache(
+        _fetch_issues,
+        soft_ttl=ISSUES_SOFT_TTL_S,
+        hard_ttl=ISSUES_HARD_TTL_S,
+        cacheable=lambda result: bool(result.get("success")),
+    )
+
+
+def _fetch_issues(state: str = "open", labels: str = "", per_page: int = ISSUES_PER_PAGE) -> dict:
+    """
+    Fetch issues, preferring the Redis copy shared by all app replicas.
+
+    Only one replica per ISSUES_SOFT_TTL_S window calls the webhook; the
+    others read its result. Falls back to the webhook if Redis is down.
+    """
+    key = RedisKeys.issues(state, labels, per_page)
+    try:
+        cached = get_redis_connection().get(key)
+    except redis.RedisError:
+        cached = None
+    if cached:
+        return orjson.loads(cached)
+
+    result = _fetch_issues_from_webhook(state, labels, per_page)
+    if result.get("success"):
+        try:
+            get_redis_connection().setex(key, ISSUES_SOFT_TTL_S, orjson.dumps(result))
+        except redis.RedisError:
+            pass
+    return result
+
+
+def _refresh_issues(state: str, labels: str = "", per_page: int = ISSUES_PER_PAGE) -> None:
+    """Drop the cached issue lists (local and shared) so the next read refetches them."""
+    cache = _issues_cache()
+    cache.invalidate(state)
+    keys = [RedisKeys.issues(state, "", per_page)]
+    if labels:
+        cache.invalidate(state, labels)
+        keys.append(RedisKeys.issues(state, labels, per_page))
+    try:
+        get_redis_connection().delete(*keys)
+    except redis.RedisError:
+        pass
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
-def _fetch_issues(state: str = "open", labels: str = "", per_page: int = 50) -> dict:
+
+def _is_truncated(data: dict) -> bool:
+    """Whether an issue list may be missing issues beyond the first page."""
+    issues = data.get("issues", ())
+    return len(issues) >= ISSUES_PER_PAGE or data.get("count", 0) > len(issues)
+
+
+def _fetch_issues_from_webhook(state: str, labels: str, per_page: int) -> dict:
     """Fetch issues from N8N workflow webhook."""
     start_time = time.time()
     try:
         payload = {"state": state, "per_page": per_page}
         if labels:  # Only add labels filter if specified
             payload["labels"] = labels
-        response = requests.post(
+        response = _http().post(
             N8N_ISSUES_WEBHOOK,
             json=payload,
-            headers={"Content-Type": "application/json"},
-            timeout=30,
+            timeout=(3.05, 30),  # (connect, read)
         )
         response.raise_for_status()
-        result = response.json()
+        result = orjson.loads(response.content)
 
         latency_ms = (time.time() - start_time) * 1000
         _ui_logger.log_webhook(
@@ -195,7 +371,7 @@ def _fetch_issues(state: str = "open", labels: str = "", per_page: int = 50) ->
         )
 
         return result
-    except requests.RequestException as e:
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
         latency_ms = (time.time() - start_time) * 1000
         _ui_logger.log_webhook(
             source="n8n",
@@ -207,9 +383,32 @@ def _fetch_issues(state: str = "open", labels: str = "", per_page: int = 50) ->
 
 
 def _validate_with_forseti(
-    title: str, body: str, category: str | None, user_id: str, issue_id: int
+    title: str,
+    body: str,
+    category: str | None,
+    user_id: str,
+    issue_id: int,
+    use_cache: bool = True,
+    on_text: Callable[[str], None] | None = None,
 ) -> dict:
-    """Validate a contribution with Forseti agent."""
+    """
+    Validate a contribution with Forseti agent.
+
+    Results are cached in Redis by content (see _validation_cache_key), so
+    re-checking an unchanged issue skips the LLM call.
+
+    Args:
+        use_cache: If False, always call the LLM and skip the Redis cache.
+        on_text: Optional callback receiving reasoning text chunks while the
+            LLM responds (the agent is streamed instead of awaited).
+    """
+    if use_cache:
+        cache_key = _validation_cache_key(title, body, category)
+        cached = _get_cached_validations([cache_key])[0]
+        if cached is not None:
+            _agent_logger.info("VALIDATION_CACHE_HIT", issue_id=issue_id)
+            return cached
+
     start_time = time.time()
 
     _agent_logger.log_agent_start(
@@ -219,7 +418,15 @@ def _validate_with_forseti(
 
     try:
         agent = get_forseti_agent()
-        result = asyncio.run(agent.validate(title=title, body=body, category=category))
+        if on_text is None:
+            result = _run(agent.validate(title=title, body=body, category=category))
+        else:
+            # Last item is the FullValidationResult, the rest reasoning text
+            for result in _iter_on_loop(
+                agent.validate_stream(title=title, body=body, category=category)
+            ):
+                if isinstance(result, str):
+                    on_text(result)
 
         latency_ms = (time.time() - start_time) * 1000
 
@@ -238,16 +445,10 @@ def _validate_with_forseti(
             output_summary=f"valid={result.is_valid}, confidence={result.confidence:.2f}",
         )
 
-        return {
-            "success": True,
-            "is_valid": result.is_valid,
-            "category": result.category,
-            "original_category": result.original_category,
-            "violations": result.violations,
-            "encouraged_aspects": result.encouraged_aspects,
-            "reasoning": result.reasoning,
-            "confidence": result.confidence,
-        }
+        validation = _validation_to_dict(result)
+        if use_cache:
+            _cache_validations({cache_key: validation})
+        return validation
     except Exception as e:
         latency_ms = (time.time() - start_time) * 1000
 
@@ -261,6 +462,165 @@ def _validate_with_forseti(
         return {"success": False, "error": str(e)}
 
 
+def _validation_cache_key(title: str, body: str, category: str | None) -> str:
+    """
+    Redis key for a validation result, derived from the validated content.
+
+    Edited issues hash to a new key, so stale results are never served; the
+    selected provider and model are part of the hash as they change the result.
+    """
+    content = "\0".join(
+        (get_selected_provider(), get_model_id() or "", title, body, category or "")
+    )
+    digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+    return RedisKeys.forseti_validation(digest)
+
+
+def _get_cached_validations(keys: list[str]) -> list[dict | None]:
+    """Cached validation results for keys (one MGET; all None if Redis is down)."""
+    try:
+        values = get_redis_connection().mget(keys)
+    except redis.RedisError:
+        return [None] * len(keys)
+    return [orjson.loads(value) if value else None for value in values]
+
+
+# Reasoning prefixes of the fail-open results Forseti returns when a provider
+# call fails; those are not verdicts and must not be cached.
+_FALLBACK_REASONING = ("Validation error:", "Classification error:", "Batch error:")
+
+
+def _is_verdict(result: dict) -> bool:
+    """Whether a validation result is a real verdict rather than a fallback."""
+    reasoning = result.get("reasoning") or ""
+    return result.get("success", False) and not any(
+        marker in reasoning for marker in _FALLBACK_REASONING
+    )
+
+
+def _cache_validations(results: dict[str, dict]) -> None:
+    """Store real verdicts by cache key, in one round trip.
+
+    Fail-open fallbacks (see _FALLBACK_REASONING) are skipped so a transient
+    provider error is retried on the next run instead of served for a day.
+    """
+    results = {key: result for key, result in results.items() if _is_verdict(result)}
+    if not results:
+        return
+    try:
+        with redis_pipeline() as pipe:
+            for key, result in results.items():
+                pipe.setex(key, TTL.FORSETI_VALIDATION, orjson.dumps(result))
+    except redis.RedisError as e:
+        _agent_logger.warning("VALIDATION_CACHE_WRITE_FAILED", error=str(e))
+
+
+def _validation_to_dict(result) -> dict:
+    """Convert a FullValidationResult to the dict shown by _display_forseti_result."""
+    return {
+        "success": True,
+        "is_valid": result.is_valid,
+        "category": result.category,
+        "original_category": result.original_category,
+        "violations": result.violations,
+        "encouraged_aspects": result.encouraged_aspects,
+        "reasoning": result.reasoning,
+        "confidence": result.confidence,
+    }
+
+
+async def _gather_validate(agent: ForsetiAgent, issues: list[dict]) -> list:
+    """
+    Validate issues concurrently, at most BATCH_MAX_CONCURRENCY at a time.
+
+    Returns:
+        One FullValidationResult or exception per issue, in order.
+    """
+    semaphore = asyncio.Semaphore(BATCH_MAX_CONCURRENCY)
+
+    async def _validate_one(issue: dict):
+        async with semaphore:
+            return await agent.validate(
+                title=issue.get("title", ""),
+                body=issue.get("body", ""),
+                category=issue.get("category"),
+            )
+
+    return await asyncio.gather(
+        *(_validate_one(issue) for issue in issues), return_exceptions=True
+    )
+
+
+def _validate_issues_with_forseti(issues: list[dict]) -> dict:
+    """
+    Validate several contributions with Forseti concurrently.
+
+    Args:
+        issues: Issues as returned by the webhook.
+
+    Returns:
+        Dict mapping issue id to a result dict (see _validate_with_forseti).
+    """
+    results = {}
+    cache_keys = [
+        _validation_cache_key(issue.get("title", ""), issue.get("body", ""), issue.get("category"))
+        for issue in issues
+    ]
+
+    # Only issues without a cached result go to the LLM
+    pending = []
+    for issue, key, cached in zip(issues, cache_keys, _get_cached_validations(cache_keys)):
+        if cached is not None:
+            results[issue.get("id")] = cached
+        else:
+            pending.append((issue, key))
+    if not pending:
+        return results
+
+    start_time = time.time()
+
+    _agent_logger.log_agent_start(
+        task="validate_contributions",
+        input_data=f"{len(pending)} issues",
+    )
+
+    # One timeout per wave of concurrent validations
+    pending_issues = [issue for issue, _key in pending]
+    waves = -(-len(pending_issues) // BATCH_MAX_CONCURRENCY)
+    try:
+        agent = get_forseti_agent()
+        outcomes = _run(
+            _gather_validate(agent, pending_issues), timeout=FORSETI_TIMEOUT_S * waves
+        )
+    except Exception as e:
+        outcomes = [e] * len(pending_issues)
+
+    to_cache = {}
+    succeeded = 0
+    for (issue, key), outcome in zip(pending, outcomes):
+        if isinstance(outcome, BaseException):
+            results[issue.get("id")] = {"success": False, "error": str(outcome)}
+            continue
+        _agent_logger.log_validation(
+            validator="forseti_charter",
+            is_valid=outcome.is_valid,
+            violations=outcome.violations,
+            confidence=outcome.confidence,
+        )
+        results[issue.get("id")] = to_cache[key] = _validation_to_dict(outcome)
+        succeeded += 1
+    _cache_validations(to_cache)
+
+    _agent_logger.log_agent_complete(
+        task="validate_contributions",
+        success=succeeded == len(pending),
+        latency_ms=(time.time() - start_time) * 1000,
+        output_summary=f"{succeeded}/{len(pending)} validated",
+    )
+
+    return results
+
+
 def _display_forseti_result(result: dict):
     """Display Forseti validation result."""
     st.markdown("---")
@@ -345,13 +705,17 @@ def contributions_view(user_id: str):
                 action="refresh_contributions",
                 user_id=user_id,
             )
-            st.cache_data.clear()
+            _refresh_issues(state_filter, label_filter)
 
     st.markdown("---")
 
-    # Fetch issues
+    # Fetch all issues for the state once; the category filter is applied
+    # locally so switching categories never calls the webhook, unless the
+    # list was cut at ISSUES_PER_PAGE and the label is queried server-side
     with st.spinner(_("contributions_loading")):
-        data = _fetch_issues(state=state_filter, labels=label_filter)
+        data = _issues_cache().get(state_filter)
+        if label_filter and data.get("success") and _is_truncated(data):
+            data = _issues_cache().get(state_filter, label_filter)
 
     if not data.get("success"):
         st.error(
@@ -360,7 +724,11 @@ def contributions_view(user_id: str):
         return
 
     issues = data.get("issues", [])
-    count = data.get("count", 0)
+    if label_filter:
+        issues = [issue for issue in issues if label_filter in issue.get("labels", ())]
+        count = len(issues)
+    else:
+        count = data.get("count", 0)
 
     # Stats
     st.metric(_("contributions_found"), count)
@@ -369,84 +737,162 @@ def contributions_view(user_id: str):
         st.info(_("contributions_none_found"))
         return
 
-    # Category color mapping
-    category_colors = {
-        "economie": "🔵",
-        "logement": "🟠",
-        "culture": "🟣",
-        "ecologie": "🟢",
-        "associations": "🟡",
-        "jeunesse": "🔴",
-        "alimentation-bien-etre-soins": "🩷",
-    }
+    # Validate every listed issue at once (LLM calls run concurrently)
+    if st.button(f"🔍 {_('contributions_verify_all')}"):
+        _ui_logger.log_user_action(
+            action="validate_charter_all",
+            user_id=user_id,
+            details=f"count={len(issues)}",
+        )
+        with st.spinner(_("forseti_analyzing")):
+            for issue_id, result in _validate_issues_with_forseti(issues).items():
+                st.session_state[f"forseti_result_{issue_id}"] = result
 
-    # Display issues
+    # Display issues (each card is a fragment: its buttons rerun only that card)
     for issue in issues:
-        issue_id = issue.get("id")
-        category = issue.get("category")
-        category_icon = category_colors.get(category, "⚪")
-        has_charte = issue.get("has_conforme_charte", False)
-        charte_badge = "✅" if has_charte else ""
-
-        with st.expander(
-            f"{category_icon} {issue.get('title', 'Sans titre')} {charte_badge}",
-            expanded=False,
-        ):
-            # Metadata row
-            meta_col1, meta_col2, meta_col3 = st.columns(3)
-            with meta_col1:
-                st.caption(
-                    f"**#{issue_id}** {_('contributions_by')} {issue.get('user', 'inconnu')}"
+        _issue_card(issue, user_id)
+
+
+@st.fragment
+def _issue_card(issue: dict, user_id: str):
+    """One issue expander with its charter check."""
+    issue_id = issue.get("id")
+    category = issue.get("category")
+    category_icon = CATEGORY_COLORS.get(category, "⚪")
+    has_charte = issue.get("has_conforme_charte", False)
+    charte_badge = "✅" if has_charte else ""
+
+    with st.expander(
+        f"{category_icon} {issue.get('title', 'Sans titre')} {charte_badge}",
+        expanded=False,
+    ):
+        # Metadata line (one element instead of a row of columns)
+        meta = [f"**#{issue_id}** {_('contributions_by')} {issue.get('user', 'inconnu')}"]
+        if category:
+            meta.append(f"📁 {category.capitalize()}")
+        if has_charte:
+            meta.append(f"✅ {_('contributions_charter_compliant')}")
+        st.caption(" · ".join(meta))
+
+        # Labels
+        labels = issue.get("labels", [])
+        if labels:
+            st.markdown(" ".join(f"`{label}`" for label in labels))
+
+        # Body
+        title = issue.get("title", "")
+        body = issue.get("body", "")
+        if body:
+            st.markdown(body[:500] + ("..." if len(body) > 500 else ""))
+
+        # Actions row
+        action_col1, action_col2 = st.columns([1, 3])
+
+        with action_col1:
+            # Forseti validation button
+            if st.button(
+                f"🔍 {_('contributions_verify_charter')}",
+                key=f"validate_{issue_id}",
+            ):
+                _ui_logger.log_user_action(
+                    action="validate_charter",
+                    user_id=user_id,
+                    details=f"issue_id={issue_id}",
                 )
-            with meta_col2:
-                if category:
-                    st.caption(f"📁 {category.capitalize()}")
-            with meta_col3:
-                if has_charte:
-                    st.caption(f"✅ {_('contributions_charter_compliant')}")
-
-            # Labels
-            labels = issue.get("labels", [])
-            if labels:
-                st.markdown(" ".join([f"`{label}`" for label in labels]))
-
-            # Body
-            title = issue.get("title", "")
-            body = issue.get("body", "")
-            if body:
-                st.markdown(body[:500] + ("..." if len(body) > 500 else ""))
-
-            # Actions row
-            action_col1, action_col2 = st.columns([1, 3])
-
-            with action_col1:
-                # Forseti validation button
-                if st.button(
-                    f"🔍 {_('contributions_verify_charter')}",
-                    key=f"validate_{issue_id}",
-                ):
-                    _ui_logger.log_user_action(
-                        action="validate_charter",
-                        user_id=user_id,
-                        details=f"issue_id={issue_id}",
+                with st.spinner(_("forseti_analyzing")):
+                    # Show the reasoning as it is generated, then the full result below
+                    preview = st.empty()
+                    streamed: list[str] = []
+
+                    def show(chunk: str) -> None:
+                        streamed.append(chunk)
+                        preview.caption("".join(streamed))
+
+                    result = _validate_with_forseti(
+                        title, body, category, user_id, issue_id, on_text=show
                     )
-                    with st.spinner(_("forseti_analyzing")):
-                        result = _validate_with_forseti(
-                            title, body, category, user_id, issue_id
-                        )
-                        st.session_state[f"forseti_result_{issue_id}"] = result
+                    preview.empty()
+                    st.session_state[f"forseti_result_{issue_id}"] = result
+
+        with action_col2:
+            # Link to GitHub
+            html_url = issue.get("html_url")
+            if html_url:
+                st.markdown(f"[{_('contributions_view_github')}]({html_url})")
+
+        # Display Forseti result if available
+        result_key = f"forseti_result_{issue_id}"
+        if result_key in st.session_state:
+            result = st.session_state[result_key]
+            _display_forseti_result(result)
+
+
+# Untranslated columns of the document sources table (one row per source)
+_SOURCE_URLS = (
+    "audierne.bzh/publications-arretes/",
+    "audierne.bzh/deliberations-conseil-municipal/",
+    "audierne.bzh/documentheque/",
+    "OCR des bulletins PDF",
+)
+_SOURCE_METHODS = ("Firecrawl + OCR", "Firecrawl + OCR", "Firecrawl + OCR", "OCR")
+
 
-            with action_col2:
-                # Link to GitHub
-                html_url = issue.get("html_url")
-                if html_url:
-                    st.markdown(f"[{_('contributions_view_github')}]({html_url})")
+@lru_cache(maxsize=len(LANGUAGES))
+def _sources_table(lang: str) -> dict[str, tuple[str, ...]]:
+    """
+    Document sources table for documents_view, built once per language.
+
+    Shared between reruns and sessions: treat as read-only. (A plain dict,
+    as st.table lays out other mappings row-wise.)
+    """
+    to_crawl = f"🔴 {_('documents_status_to_crawl')}"
+    return {
+        _("documents_source"): (
+            _("documents_source_arretes"),
+            _("documents_source_deliberations"),
+            _("documents_source_commission"),
+            _("documents_source_gwaien"),
+        ),
+        _("documents_url"): _SOURCE_URLS,
+        _("sidebar_status"): (
+            to_crawl,
+            to_crawl,
+            to_crawl,
+            f"🟡 42 {_('documents_status_collected')}",
+        ),
+        _("documents_method"): _SOURCE_METHODS,
+    }
 
-            # Display Forseti result if available
-            result_key = f"forseti_result_{issue_id}"
-            if result_key in st.session_state:
-                result = st.session_state[result_key]
-                _display_forseti_result(result)
+
+@lru_cache(maxsize=len(LANGUAGES))
+def _about_markdown(lang: str) -> str:
+    """About page markdown for about_view, built once per language."""
+    return f"""
+### {_('about_resolution_title')}
+
+> *{_('about_resolution_quote')}*
+
+{_('about_description')}
+
+### {_('about_features_title')}
+
+| {_('about_feature')} | {_('about_feature_description')} | {_('about_feature_status')} |
+|----------------|-------------|--------|
+| {_('about_feature_search')} | {_('about_feature_search_desc')} | 🔴 {_('about_status_in_dev')} |
+| {_('about_feature_qa')} | {_('about_feature_qa_desc')} | 🔴 {_('about_status_in_dev')} |
+| {_('about_feature_hallucination')} | {_('about_feature_hallucination_desc')} | 🟡 {_('about_status_planned')} |
+| {_('about_feature_multichannel')} | {_('about_feature_multichannel_desc')} | 🟡 {_('about_status_planned')} |
+
+### {_('about_links_title')}
+
+- 🌐 [audierne2026.fr](https://audierne2026.fr) - {_('about_links_platform')}
+- 📚 [docs.locki.io](https://docs.locki.io) - {_('about_links_docs')}
+- 💻 [GitHub](https://github.com/locki-io/ocapistaine) - {_('about_links_source')}
+
+---
+
+*{_('about_conclusion')}*
+"""
 
 
 def documents_view(user_id: str):
@@ -478,34 +924,7 @@ def documents_view(user_id: str):
     # Document sources table
     st.markdown(f"### {_('documents_sources_title')}")
 
-    sources_data = {
-        _("documents_source"): [
-            _("documents_source_arretes"),
-            _("documents_source_deliberations"),
-            _("documents_source_commission"),
-            _("documents_source_gwaien"),
-        ],
-        _("documents_url"): [
-            "audierne.bzh/publications-arretes/",
-            "audierne.bzh/deliberations-conseil-municipal/",
-            "audierne.bzh/documentheque/",
-            "OCR des bulletins PDF",
-        ],
-        _("sidebar_status"): [
-            f"🔴 {_('documents_status_to_crawl')}",
-            f"🔴 {_('documents_status_to_crawl')}",
-            f"🔴 {_('documents_status_to_crawl')}",
-            f"🟡 42 {_('documents_status_collected')}",
-        ],
-        _("documents_method"): [
-            "Firecrawl + OCR",
-            "Firecrawl + OCR",
-            "Firecrawl + OCR",
-            "OCR",
-        ],
-    }
-
-    st.table(sources_data)
+    st.table(_sources_table(get_language()))
 
     # TODO: Add document search when implemented
     # st.text_input("🔍 Rechercher un document...", key="doc_search")
@@ -515,8 +934,9 @@ def mockup_view(user_id: str):
     """Mockup batch validation view."""
 
     # Wrapper for validate function that matches the expected signature
+    # (uncached: mockup runs exist to exercise the LLM)
     def validate_wrapper(title: str, body: str, category: str | None) -> dict:
-        return _validate_with_forseti(title, body, category, user_id, 0)
+        return _validate_with_forseti(title, body, category, user_id, 0, use_cache=False)
 
     batch_validation_view(user_id, validate_wrapper)
 
@@ -526,34 +946,7 @@ def about_view():
 
     st.subheader(f"ℹ️ {_('about_title')}")
 
-    st.markdown(
-        f"""
-### {_('about_resolution_title')}
-
-> *{_('about_resolution_quote')}*
-
-{_('about_description')}
-
-### {_('about_features_title')}
-
-| {_('about_feature')} | {_('about_feature_description')} | {_('about_feature_status')} |
-|----------------|-------------|--------|
-| {_('about_feature_search')} | {_('about_feature_search_desc')} | 🔴 {_('about_status_in_dev')} |
-| {_('about_feature_qa')} | {_('about_feature_qa_desc')} | 🔴 {_('about_status_in_dev')} |
-| {_('about_feature_hallucination')} | {_('about_feature_hallucination_desc')} | 🟡 {_('about_status_planned')} |
-| {_('about_feature_multichannel')} | {_('about_feature_multichannel_desc')} | 🟡 {_('about_status_planned')} |
-
-### {_('about_links_title')}
-
-- 🌐 [audierne2026.fr](https://audierne2026.fr) - {_('about_links_platform')}
-- 📚 [docs.locki.io](https://docs.locki.io) - {_('about_links_docs')}
-- 💻 [GitHub](https://github.com/locki-io/ocapistaine) - {_('about_links_source')}
-
----
-
-*{_('about_conclusion')}*
-    """
-    )
+    st.markdown(_about_markdown(get_language()))
 
 
 if __name__ == "__main__":
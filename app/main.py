@@ -44,6 +44,10 @@ async def lifespan(app: FastAPI):
     # Shutdown
     print("👋 OCapistaine API shutting down...")
 
+    # Flush traces still queued for Opik
+    from app.agents.tracing import get_tracer
+    await get_tracer().shutdown(timeout=10)
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -28,7 +28,7 @@ from app.mockup.generator import (
 from app.providers import get_provider, Message, get_config, GEMINI_MODELS
 
 # Import categories from Forseti (single source of truth)
-from app.agents.forseti import CATEGORIES, CATEGORY_DESCRIPTIONS
+from app.agents.forseti import CATEGORIES_SET, CATEGORY_DESCRIPTIONS
 
 # Provider type for field input
 ProviderType = Literal["gemini", "claude", "ollama"]
@@ -228,7 +228,7 @@ Réponds UNIQUEMENT avec le JSON, sans explication."""
                     keywords=theme_data.get("keywords", []),
                     context=theme_data.get("context", ""),
                 )
-                if theme.category in CATEGORIES:
+                if theme.category in CATEGORIES_SET:
                     themes.append(theme)
 
             self._logger.info("THEMES_EXTRACTED", count=len(themes))
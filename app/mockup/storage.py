@@ -15,7 +15,7 @@ from datetime import datetime, date
 from typing import Optional, List, Dict, Any
 from dataclasses import dataclass, field, asdict
 
-from app.data.redis_client import redis_connection, get_redis_connection
+from app.data.redis_client import redis_connection, redis_pipeline, get_redis_connection
 from app.services import AgentLogger
 
 _logger = AgentLogger("mockup_storage")
@@ -191,6 +191,8 @@ class MockupStorage:
         """
         Save a validation record to Redis.
 
+        The writes are pipelined into a single round trip.
+
         Args:
             record: ValidationRecord to save
 
@@ -198,19 +200,20 @@ class MockupStorage:
             True if successful
         """
         try:
-            with redis_connection() as r:
+            data = json.dumps(record.to_dict())
+            with redis_pipeline() as pipe:
                 # Main storage
                 key = MockupKeys.validation(record.id, record.date)
-                r.setex(key, MockupTTL.VALIDATION, json.dumps(record.to_dict()))
+                pipe.setex(key, MockupTTL.VALIDATION, data)
 
                 # Add to date index (sorted set by timestamp)
                 index_key = MockupKeys.date_index(record.date)
-                r.zadd(index_key, {record.id: datetime.fromisoformat(record.timestamp).timestamp()})
-                r.expire(index_key, MockupTTL.VALIDATION)
+                pipe.zadd(index_key, {record.id: datetime.fromisoformat(record.timestamp).timestamp()})
+                pipe.expire(index_key, MockupTTL.VALIDATION)
 
                 # Update latest
-                r.hset(MockupKeys.LATEST, record.id, json.dumps(record.to_dict()))
-                r.expire(MockupKeys.LATEST, MockupTTL.LATEST)
+                pipe.hset(MockupKeys.LATEST, record.id, data)
+                pipe.expire(MockupKeys.LATEST, MockupTTL.LATEST)
 
             self._logger.info(
                 "SAVE_VALIDATION",
@@ -71,7 +71,7 @@ from app.mockup.storage import get_storage, ValidationRecord
 from app.services import AgentLogger
 
 # Import from central prompts module (single source of truth)
-from app.prompts import CATEGORIES, CATEGORY_DESCRIPTIONS, get_category_description
+from app.prompts import CATEGORIES, CATEGORIES_SET, CATEGORY_DESCRIPTIONS, get_category_description
 from app.prompts.local.autocontrib import format_draft_prompt
 
 # =============================================================================
@@ -143,7 +143,7 @@ def step_2_select_category() -> List[str]:
     Returns:
         List of 7 charter category strings.
     """
-    return CATEGORIES
+    return list(CATEGORIES)
 
 
 # Note: get_category_description is imported from app.prompts
@@ -193,7 +193,7 @@ class ContributionAssistant:
         Returns:
             DraftContribution with constat_factuel and idees_ameliorations
         """
-        if category not in CATEGORIES:
+        if category not in CATEGORIES_SET:
             category = CATEGORIES[0]
 
         category_desc = get_category_description(category, language)
@@ -25,14 +25,17 @@ Available Prompts:
     forseti.persona              - System prompt for Forseti 461 agent
     forseti.charter_validation   - Validate contribution against charter
     forseti.category_classification - Classify into 7 categories
+    forseti.combined_validation  - Charter validation + classification in one call
     forseti.wording_correction   - Suggest wording improvements
     forseti.batch_validation     - Batch validate multiple contributions
     autocontrib.draft_fr         - Generate draft contribution (French)
     autocontrib.draft_en         - Generate draft contribution (English)
 
 Constants:
-    CATEGORIES                   - List of 7 charter categories
+    CATEGORIES                   - Tuple of 7 charter categories
+    CATEGORIES_SET               - Frozenset of CATEGORIES for membership checks
     CATEGORY_DESCRIPTIONS        - Bilingual category descriptions
+    CATEGORY_PROMPT_DESCRIPTIONS - Category to prompt description (derived)
     VIOLATIONS_TEXT              - Charter violation rules
     ENCOURAGED_TEXT              - Charter values
 """
@@ -45,10 +48,14 @@ from app.prompts.registry import (
     format_prompt,
 )
 
+from app.prompts.template import CompiledTemplate, compile_template
+
 from app.prompts.constants import (
     CATEGORIES,
+    CATEGORIES_SET,
     CategoryType,
     CATEGORY_DESCRIPTIONS,
+    CATEGORY_PROMPT_DESCRIPTIONS,
     VIOLATIONS_TEXT,
     ENCOURAGED_TEXT,
     CATEGORIES_TEXT,
@@ -76,10 +83,14 @@ __all__ = [
     "get_registry",
     "get_prompt",
     "format_prompt",
+    "CompiledTemplate",
+    "compile_template",
     # Constants
     "CATEGORIES",
+    "CATEGORIES_SET",
     "CategoryType",
     "CATEGORY_DESCRIPTIONS",
+    "CATEGORY_PROMPT_DESCRIPTIONS",
     "VIOLATIONS_TEXT",
     "ENCOURAGED_TEXT",
     "CATEGORIES_TEXT",
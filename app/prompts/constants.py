@@ -9,13 +9,14 @@ Single source of truth for categories and descriptions used across:
 - Opik experiments
 """
 
-from typing import Dict, List, Literal
+import sys
+from typing import Dict, Literal
 
 # =============================================================================
 # CATEGORIES (Single Source of Truth)
 # =============================================================================
 
-CATEGORIES: List[str] = [
+CATEGORIES: tuple[str, ...] = (
     "economie",
     "logement",
     "culture",
@@ -23,7 +24,10 @@ CATEGORIES: List[str] = [
     "associations",
     "jeunesse",
     "alimentation-bien-etre-soins",
-]
+)
+
+# O(1) membership checks when validating LLM-assigned categories
+CATEGORIES_SET: frozenset[str] = frozenset(CATEGORIES)
 
 CategoryType = Literal[
     "economie",
@@ -80,19 +84,20 @@ CATEGORY_DESCRIPTIONS: Dict[str, Dict[str, str]] = {
 # =============================================================================
 # CHARTER TEXTS (For Prompts)
 # =============================================================================
+# Interned so every prompt module shares one object per text block
 
-VIOLATIONS_TEXT = """NOT ACCEPTED (Charter Violations):
+VIOLATIONS_TEXT = sys.intern("""NOT ACCEPTED (Charter Violations):
 - Personal attacks or discriminatory remarks
 - Spam or advertising
 - Proposals unrelated to Audierne-Esquibien
-- False information"""
+- False information""")
 
-ENCOURAGED_TEXT = """ENCOURAGED (Charter Values):
+ENCOURAGED_TEXT = sys.intern("""ENCOURAGED (Charter Values):
 - Concrete and argued proposals
 - Constructive criticism
 - Questions and requests for clarification
 - Sharing of experiences and expertise
-- Suggestions for improvement"""
+- Suggestions for improvement""")
 
 
 # =============================================================================
@@ -106,12 +111,16 @@ def get_category_description(category: str, language: str = "fr") -> str:
 
 def get_categories_text() -> str:
     """Get formatted categories text for prompts."""
-    lines = ["CATEGORIES:"]
-    for cat in CATEGORIES:
-        desc = CATEGORY_DESCRIPTIONS.get(cat, {}).get("prompt", cat)
-        lines.append(f"- {cat}: {desc}")
-    return "\n".join(lines)
+    return CATEGORIES_TEXT
 
 
+# Prompt-facing description per category, derived once from CATEGORY_DESCRIPTIONS
+CATEGORY_PROMPT_DESCRIPTIONS: Dict[str, str] = {
+    cat: CATEGORY_DESCRIPTIONS.get(cat, {}).get("prompt", cat) for cat in CATEGORIES
+}
+
 # Pre-built for prompt injection
-CATEGORIES_TEXT = get_categories_text()
+CATEGORIES_TEXT = sys.intern(
+    "CATEGORIES:\n"
+    + "\n".join(f"- {cat}: {desc}" for cat, desc in CATEGORY_PROMPT_DESCRIPTIONS.items())
+)
@@ -6,13 +6,16 @@ These prompts are used when Opik/Vaettir MCP is unavailable.
 The canonical versions are stored in Opik Prompt Library.
 """
 
+import sys
+
 from app.prompts.constants import VIOLATIONS_TEXT, ENCOURAGED_TEXT, CATEGORIES_TEXT
 
 # =============================================================================
 # PERSONA PROMPT (System Message)
 # =============================================================================
 
-PERSONA_PROMPT = """You are Forseti 461, the impartial guardian of truth and the contribution charter for Audierne2026.
+# Interned: one shared object for the system prompt (stable prefix for provider caches)
+PERSONA_PROMPT = sys.intern("""You are Forseti 461, the impartial guardian of truth and the contribution charter for Audierne2026.
 
 ## Your Identity
 Named after the Norse god of justice Forseti, you are reborn in the spirit of Cap Sizun (the iconic local "461"). You are calm, vigilant, and unwavering in your duties.
@@ -41,7 +44,7 @@ You carefully filter every submission to the Audierne2026 participatory democrac
 - Provide clear reasoning for decisions, referencing the evaluation criteria.
 - Use French cultural context when relevant to Audierne-Esquibien.
 - **Emphasize Respect**:
-Clearly state that personal attacks, discriminatory remarks, and promotional content are unacceptable and undermine the quality of discourse. Contributors must be aware that such language or irrelevant material will lead to rejection of their submissions. Additionally, reinforce the importance of maintaining a respectful and constructive dialogue to foster a positive community. Include examples of respectful language and constructive criticism to guide contributors."""
+Clearly state that personal attacks, discriminatory remarks, and promotional content are unacceptable and undermine the quality of discourse. Contributors must be aware that such language or irrelevant material will lead to rejection of their submissions. Additionally, reinforce the importance of maintaining a respectful and constructive dialogue to foster a positive community. Include examples of respectful language and constructive criticism to guide contributors.""")
 
 
 # =============================================================================
@@ -87,6 +90,35 @@ Return a JSON object with:
 Return JSON only, no markdown fences."""
 
 
+COMBINED_VALIDATION_PROMPT = f"""You are validating a citizen contribution against the charter and classifying it into one of 7 categories.
+
+{VIOLATIONS_TEXT}
+
+{ENCOURAGED_TEXT}
+
+{CATEGORIES_TEXT}
+
+Analyze the following contribution:
+
+TITLE: {{title}}
+BODY: {{body}}
+{{current_category_line}}
+
+Return a JSON object with two keys:
+- "charter": an object with
+  - "is_valid": true if the contribution complies with the charter, false otherwise
+  - "violations": list of specific charter violations found (empty if valid)
+  - "encouraged_aspects": list of positive aspects that align with charter values
+  - "reasoning": brief explanation of your decision
+  - "confidence": float between 0.0 and 1.0 indicating your confidence
+- "category": an object with
+  - "category": exactly one of the 7 categories listed above
+  - "reasoning": brief explanation of why this category fits best
+  - "confidence": float between 0.0 and 1.0 indicating your confidence
+
+Return JSON only, no markdown fences."""
+
+
 WORDING_CORRECTION_PROMPT = """You are reviewing a citizen contribution for clarity and constructiveness.
 
 Your task is to suggest improvements that:
@@ -119,7 +151,7 @@ BATCH_VALIDATION_PROMPT = f"""You are validating multiple citizen contributions
 {CATEGORIES_TEXT}
 
 Return JSON ONLY with this exact structure:
-{{"results":[{{"id":"","is_valid":true/false,"violations":[],"encouraged_aspects":[],"category":"","reasoning":"","confidence":0.0-1.0}}]}}
+{{{{"results":[{{{{"id":"","is_valid":true/false,"violations":[],"encouraged_aspects":[],"category":"","reasoning":"","confidence":0.0-1.0}}}}]}}}}
 
 ITEMS TO VALIDATE:
 {{items_json}}"""
@@ -148,6 +180,12 @@ PROMPTS = {
         "variables": ["title", "body", "current_category_line"],
         "description": "Classify contribution into one of 7 categories",
     },
+    "forseti.combined_validation": {
+        "template": COMBINED_VALIDATION_PROMPT,
+        "type": "user",
+        "variables": ["title", "body", "current_category_line"],
+        "description": "Validate charter and classify category in a single call",
+    },
     "forseti.wording_correction": {
         "template": WORDING_CORRECTION_PROMPT,
         "type": "user",
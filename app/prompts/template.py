@@ -0,0 +1,100 @@
+# app/prompts/template.py
+"""
+Compiled Prompt Templates
+
+Splits a str.format template once into literal parts and placeholder names,
+so rendering is a single "".join instead of re-parsing the format
+mini-language on every call.
+
+Usage:
+    from app.prompts.template import compile_template
+
+    template = compile_template(CHARTER_VALIDATION_PROMPT)
+    prompt = template(title="...", body="...")
+"""
+
+from functools import lru_cache
+from string import Formatter
+
+
+class CompiledTemplate:
+    """
+    A str.format template pre-split into literals and field names.
+
+    Supports plain named fields only ({name}); escaped braces ({{ }}) are
+    resolved at compile time.
+    """
+
+    __slots__ = ("_literals", "_fields", "template")
+
+    def __init__(self, template: str):
+        """
+        Compile a template.
+
+        Args:
+            template: str.format-style template.
+
+        Raises:
+            ValueError: If the template uses positional fields, attribute
+                access, conversions or format specs.
+        """
+        literals: list[str] = []
+        fields: list[str] = []
+        pending = ""
+        for literal, field_name, format_spec, conversion in Formatter().parse(template):
+            pending += literal
+            if field_name is None:
+                continue
+            if not field_name.isidentifier() or format_spec or conversion:
+                raise ValueError(f"Unsupported template field: {{{field_name}}}")
+            literals.append(pending)
+            fields.append(field_name)
+            pending = ""
+        literals.append(pending)
+
+        self.template = template
+        self._literals = tuple(literals)
+        self._fields = tuple(fields)
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        """Placeholder names in order of appearance."""
+        return self._fields
+
+    def render(self, values: dict) -> str:
+        """
+        Render with a mapping of values (like str.format_map).
+
+        Args:
+            values: Field name to value.
+
+        Returns:
+            Rendered prompt.
+
+        Raises:
+            KeyError: If a field is missing from values.
+        """
+        literals = self._literals
+        parts = [literals[0]]
+        for i, name in enumerate(self._fields, 1):
+            parts.append(str(values[name]))
+            parts.append(literals[i])
+        return "".join(parts)
+
+    def __call__(self, **values) -> str:
+        """Render with keyword values (like str.format)."""
+        return self.render(values)
+
+
+@lru_cache(maxsize=64)
+def compile_template(template: str) -> CompiledTemplate:
+    """
+    Get the compiled form of a template (cached per template string).
+
+    Args:
+        template: str.format-style template.
+
+    Returns:
+        CompiledTemplate for the template.
+    """
+    return CompiledTemplate(template)
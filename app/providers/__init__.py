@@ -6,19 +6,27 @@ Exports all providers and provides a factory function for instantiation.
 
 from typing import Literal
 
-from .base import LLMProvider, Message, CompletionResponse
+from .base import LLMProvider, Message, CompletionResponse, ProviderError
 from .config import ProviderConfig, get_config, GEMINI_MODELS
 from .logging import get_provider_logger, ProviderLogger, get_logger
 from .gemini import GeminiProvider
 from .claude import ClaudeProvider
 from .mistral import MistralProvider
 from .ollama import OllamaProvider
+from .ratelimit import (
+    AsyncRateLimiter,
+    RateLimitedProvider,
+    get_rate_limiter,
+    call_with_retry,
+)
+from .pool import ProviderPool
 
 
 __all__ = [
     "LLMProvider",
     "Message",
     "CompletionResponse",
+    "ProviderError",
     "ProviderConfig",
     "get_config",
     "GEMINI_MODELS",
@@ -26,6 +34,11 @@ __all__ = [
     "ClaudeProvider",
     "MistralProvider",
     "OllamaProvider",
+    "AsyncRateLimiter",
+    "RateLimitedProvider",
+    "get_rate_limiter",
+    "call_with_retry",
+    "ProviderPool",
     "get_provider",
     "get_provider_logger",
     "ProviderLogger",
@@ -9,9 +9,13 @@ from dataclasses import dataclass, field
 from typing import AsyncIterator
 
 
-@dataclass
+class ProviderError(Exception):
+    """Raised when an LLM provider call fails (after any retries)."""
+
+
+@dataclass(frozen=True, slots=True)
 class Message:
-    """Represents a chat message."""
+    """Represents a chat message (immutable, so instances can be shared)."""
 
     role: str  # "system", "user", or "assistant"
     content: str
@@ -34,15 +38,31 @@ class CompletionResponse:
         }
 
 
+# Appended to the last user message by providers without a native JSON mode
+JSON_INSTRUCTION = "\n\nRespond with valid JSON only, no additional text."
+
+
+def add_json_instruction(conversation: list[dict]) -> None:
+    """Append JSON_INSTRUCTION to the last user message (in place)."""
+    for message in reversed(conversation):
+        if message["role"] == "user":
+            message["content"] += JSON_INSTRUCTION
+            return
+
+
 class LLMProvider(ABC):
     """
     Abstract base class for LLM providers.
 
     All providers must implement:
     - complete(): For single request/response completions
-    - stream(): For streaming responses (optional, raises NotImplementedError by default)
+    - stream(): For streaming responses (optional, raises NotImplementedError by default;
+      providers implementing it set supports_streaming = True)
     """
 
+    # Whether stream() is implemented (callers check before streaming)
+    supports_streaming: bool = False
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -82,6 +102,7 @@ class LLMProvider(ABC):
         messages: list[Message],
         temperature: float = 0.7,
         max_tokens: int | None = None,
+        json_mode: bool = False,
     ) -> AsyncIterator[str]:
         """
         Stream a completion for the given messages.
@@ -90,6 +111,7 @@ class LLMProvider(ABC):
             messages: List of Message objects.
             temperature: Sampling temperature.
             max_tokens: Maximum tokens in response.
+            json_mode: If True, instruct model to output valid JSON.
 
         Yields:
             String chunks as they are generated.
@@ -4,7 +4,7 @@ Anthropic Claude Provider
 Async LLM provider for Anthropic's Claude models.
 """
 
-from .base import LLMProvider, Message, CompletionResponse
+from .base import LLMProvider, Message, CompletionResponse, add_json_instruction
 from .config import get_config
 
 
@@ -15,6 +15,8 @@ class ClaudeProvider(LLMProvider):
     Supports Claude 3 family models (Haiku, Sonnet, Opus).
     """
 
+    supports_streaming = True
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -89,16 +91,8 @@ class ClaudeProvider(LLMProvider):
             conversation = [{"role": "user", "content": "Hello"}]
 
         # Add JSON instruction to last user message if json_mode
-        if json_mode and conversation:
-            last_user_idx = None
-            for i in range(len(conversation) - 1, -1, -1):
-                if conversation[i]["role"] == "user":
-                    last_user_idx = i
-                    break
-            if last_user_idx is not None:
-                conversation[last_user_idx]["content"] += (
-                    "\n\nRespond with valid JSON only, no additional text."
-                )
+        if json_mode:
+            add_json_instruction(conversation)
 
         kwargs = {
             "model": self._model_name,
@@ -130,6 +124,7 @@ class ClaudeProvider(LLMProvider):
         messages: list[Message],
         temperature: float = 0.7,
         max_tokens: int | None = None,
+        json_mode: bool = False,
     ):
         """
         Stream completion using Claude.
@@ -138,6 +133,7 @@ class ClaudeProvider(LLMProvider):
             messages: List of Message objects.
             temperature: Sampling temperature.
             max_tokens: Maximum tokens in response.
+            json_mode: If True, instruct model to output JSON.
 
         Yields:
             String chunks as they are generated.
@@ -154,6 +150,8 @@ class ClaudeProvider(LLMProvider):
 
         if not conversation:
             conversation = [{"role": "user", "content": "Hello"}]
+        if json_mode:
+            add_json_instruction(conversation)
 
         kwargs = {
             "model": self._model_name,
@@ -26,6 +26,12 @@ class ProviderConfig(BaseSettings):
     # Default provider selection
     default_provider: str = Field(default="gemini", alias="DEFAULT_PROVIDER")
 
+    # Shared rate limiting / retries (see ratelimit.py)
+    provider_rate_limit: float = Field(
+        default=5.0, alias="PROVIDER_RATE_LIMIT"
+    )  # requests per second per provider, 0 disables
+    provider_max_retries: int = Field(default=3, alias="PROVIDER_MAX_RETRIES")
+
     # Google Gemini
     google_api_key: str | None = Field(default=None, alias="GOOGLE_API_KEY")
     gemini_api_key: str | None = Field(default=None, alias="GEMINI_API_KEY")
@@ -4,7 +4,7 @@ Mistral AI Provider
 Async LLM provider for Mistral AI models.
 """
 
-from .base import LLMProvider, Message, CompletionResponse
+from .base import LLMProvider, Message, CompletionResponse, add_json_instruction
 from .config import get_config
 
 
@@ -15,6 +15,8 @@ class MistralProvider(LLMProvider):
     Supports Mistral models (tiny, small, medium, large).
     """
 
+    supports_streaming = True
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -79,16 +81,8 @@ class MistralProvider(LLMProvider):
             mistral_messages.append({"role": msg.role, "content": msg.content})
 
         # Add JSON instruction if needed
-        if json_mode and mistral_messages:
-            last_user_idx = None
-            for i in range(len(mistral_messages) - 1, -1, -1):
-                if mistral_messages[i]["role"] == "user":
-                    last_user_idx = i
-                    break
-            if last_user_idx is not None:
-                mistral_messages[last_user_idx]["content"] += (
-                    "\n\nRespond with valid JSON only, no additional text."
-                )
+        if json_mode:
+            add_json_instruction(mistral_messages)
 
         kwargs = {
             "model": self._model_name,
@@ -121,6 +115,7 @@ class MistralProvider(LLMProvider):
         messages: list[Message],
         temperature: float = 0.7,
         max_tokens: int | None = None,
+        json_mode: bool = False,
     ):
         """
         Stream completion using Mistral.
@@ -129,6 +124,7 @@ class MistralProvider(LLMProvider):
             messages: List of Message objects.
             temperature: Sampling temperature.
             max_tokens: Maximum tokens in response.
+            json_mode: If True, instruct model to output JSON.
 
         Yields:
             String chunks as they are generated.
@@ -136,6 +132,8 @@ class MistralProvider(LLMProvider):
         mistral_messages = []
         for msg in messages:
             mistral_messages.append({"role": msg.role, "content": msg.content})
+        if json_mode:
+            add_json_instruction(mistral_messages)
 
         kwargs = {
             "model": self._model_name,
@@ -4,9 +4,12 @@ Ollama Provider
 Async LLM provider for local Ollama instances.
 """
 
+import asyncio
+import json
+
 import httpx
 
-from .base import LLMProvider, Message, CompletionResponse
+from .base import LLMProvider, Message, CompletionResponse, add_json_instruction
 from .config import get_config
 
 
@@ -17,6 +20,8 @@ class OllamaProvider(LLMProvider):
     Connects to a local Ollama instance via HTTP API.
     """
 
+    supports_streaming = True
+
     def __init__(
         self,
         host: str | None = None,
@@ -35,6 +40,58 @@ class OllamaProvider(LLMProvider):
         self._host = (host or config.ollama_host).rstrip("/")
         self._model_name = model or config.ollama_model
         self._timeout = timeout
+        # Pooled client, created lazily on the event loop that first uses it
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def host(self) -> str:
+        """Get the Ollama host URL."""
+        return self._host
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        HTTP client for the running event loop, created on first use.
+
+        Reused across calls so keep-alive connections are pooled. httpx
+        pools are bound to the loop they were opened on, so a call from a
+        different loop (e.g. a later asyncio.run) closes the previous client
+        and gets a new one.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is not loop:
+            self._release_client()
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self._timeout,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            )
+            self._client_loop = loop
+        return self._client
+
+    def _release_client(self) -> None:
+        """
+        Close the current client on the loop it was opened on.
+
+        If that loop is still running (e.g. in another thread) aclose() is
+        scheduled on it. A closed loop can no longer await anything; its
+        client is dropped and its sockets close when it is garbage collected.
+        """
+        client, loop = self._client, self._client_loop
+        self._client = self._client_loop = None
+        if client is not None and loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+    async def aclose(self) -> None:
+        """Close the pooled client (call on the loop that used it, before it ends)."""
+        client = self._client
+        if client is None:
+            return
+        if self._client_loop is asyncio.get_running_loop():
+            self._client = self._client_loop = None
+            await client.aclose()
+        else:
+            self._release_client()
 
     @property
     def name(self) -> str:
@@ -69,16 +126,8 @@ class OllamaProvider(LLMProvider):
             ollama_messages.append({"role": msg.role, "content": msg.content})
 
         # Add JSON instruction if needed
-        if json_mode and ollama_messages:
-            last_user_idx = None
-            for i in range(len(ollama_messages) - 1, -1, -1):
-                if ollama_messages[i]["role"] == "user":
-                    last_user_idx = i
-                    break
-            if last_user_idx is not None:
-                ollama_messages[last_user_idx]["content"] += (
-                    "\n\nRespond with valid JSON only, no additional text."
-                )
+        if json_mode:
+            add_json_instruction(ollama_messages)
 
         payload = {
             "model": self._model_name,
@@ -93,13 +142,12 @@ class OllamaProvider(LLMProvider):
         if json_mode:
             payload["format"] = "json"
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            response = await client.post(
-                f"{self._host}/api/chat",
-                json=payload,
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await self._get_client().post(
+            f"{self._host}/api/chat",
+            json=payload,
+        )
+        response.raise_for_status()
+        data = response.json()
 
         content = data.get("message", {}).get("content", "")
         if json_mode:
@@ -120,6 +168,7 @@ class OllamaProvider(LLMProvider):
         messages: list[Message],
         temperature: float = 0.7,
         max_tokens: int | None = None,
+        json_mode: bool = False,
     ):
         """
         Stream completion using local Ollama.
@@ -128,6 +177,7 @@ class OllamaProvider(LLMProvider):
             messages: List of Message objects.
             temperature: Sampling temperature.
             max_tokens: Maximum tokens in response.
+            json_mode: If True, request JSON format.
 
         Yields:
             String chunks as they are generated.
@@ -135,6 +185,8 @@ class OllamaProvider(LLMProvider):
         ollama_messages = []
         for msg in messages:
             ollama_messages.append({"role": msg.role, "content": msg.content})
+        if json_mode:
+            add_json_instruction(ollama_messages)
 
         payload = {
             "model": self._model_name,
@@ -146,21 +198,21 @@ class OllamaProvider(LLMProvider):
         }
         if max_tokens:
             payload["options"]["num_predict"] = max_tokens
+        if json_mode:
+            payload["format"] = "json"
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            async with client.stream(
-                "POST",
-                f"{self._host}/api/chat",
-                json=payload,
-            ) as response:
-                response.raise_for_status()
-                async for line in response.aiter_lines():
-                    if line:
-                        import json
-                        chunk = json.loads(line)
-                        content = chunk.get("message", {}).get("content", "")
-                        if content:
-                            yield content
+        async with self._get_client().stream(
+            "POST",
+            f"{self._host}/api/chat",
+            json=payload,
+        ) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if line:
+                    chunk = json.loads(line)
+                    content = chunk.get("message", {}).get("content", "")
+                    if content:
+                        yield content
 
     async def health_check(self) -> bool:
         """
@@ -170,15 +222,14 @@ class OllamaProvider(LLMProvider):
             True if Ollama is healthy and model exists, False otherwise.
         """
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self._host}/api/tags")
-                response.raise_for_status()
-                data = response.json()
-                models = [m.get("name") for m in data.get("models", [])]
-                # Check if our model (or base name) is available
-                model_base = self._model_name.split(":")[0]
-                return any(
-                    model_base in m or self._model_name in m for m in models
-                )
+            response = await self._get_client().get(f"{self._host}/api/tags", timeout=5.0)
+            response.raise_for_status()
+            data = response.json()
+            models = [m.get("name") for m in data.get("models", [])]
+            # Check if our model (or base name) is available
+            model_base = self._model_name.split(":")[0]
+            return any(
+                model_base in m or self._model_name in m for m in models
+            )
         except Exception:
             return False
@@ -0,0 +1,147 @@
+"""
+Provider Pool
+
+Spreads completions across several provider endpoints (e.g. multiple
+Ollama/vLLM nodes) with per-endpoint concurrency limits and failover.
+
+Each member is wrapped in RateLimitedProvider with its own limiter, keyed by
+host when the provider has one, and a single attempt: a failing endpoint is
+skipped at once instead of retried with backoff. A request goes to the member
+with the fewest in-flight calls, waiters included (round-robin on ties); when
+a member raises ProviderError the next one is tried.
+"""
+
+import asyncio
+from typing import AsyncIterator
+
+from .base import LLMProvider, Message, CompletionResponse, ProviderError
+from .ratelimit import RateLimitedProvider, get_rate_limiter
+
+
+class _PoolMember:
+    """A provider endpoint with its concurrency gate."""
+
+    __slots__ = ("provider", "semaphore", "in_flight")
+
+    def __init__(self, provider: LLMProvider, concurrency_limit: int):
+        if not isinstance(provider, RateLimitedProvider):
+            host = getattr(provider, "host", None)
+            limiter_key = f"{provider.name}@{host}" if host else provider.name
+            # Failover replaces retries: the next member is tried at once
+            provider = RateLimitedProvider(
+                provider, limiter=get_rate_limiter(limiter_key), max_attempts=1
+            )
+        self.provider = provider
+        self.semaphore = asyncio.Semaphore(concurrency_limit)
+        self.in_flight = 0
+
+
+class ProviderPool(LLMProvider):
+    """
+    Pool of provider endpoints behaving as a single provider.
+
+    Example:
+        pool = ProviderPool([
+            OllamaProvider(host="http://gpu-1:11434"),
+            OllamaProvider(host="http://gpu-2:11434"),
+        ])
+        agent = ForsetiAgent(provider=pool)
+    """
+
+    def __init__(
+        self,
+        providers: list[LLMProvider],
+        concurrency_limit: int = 4,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            providers: Provider endpoints to balance across.
+            concurrency_limit: Maximum in-flight calls per endpoint.
+
+        Raises:
+            ValueError: If no providers are given.
+        """
+        if not providers:
+            raise ValueError("ProviderPool requires at least one provider")
+        self._members = [_PoolMember(p, concurrency_limit) for p in providers]
+        self._next = 0
+
+    @property
+    def name(self) -> str:
+        return "pool"
+
+    @property
+    def model(self) -> str:
+        return "+".join(dict.fromkeys(m.provider.model for m in self._members))
+
+    @property
+    def supports_streaming(self) -> bool:
+        # Streams go to whichever endpoint is least busy
+        return all(m.provider.supports_streaming for m in self._members)
+
+    @property
+    def providers(self) -> list[LLMProvider]:
+        """Get the pooled providers."""
+        return [m.provider for m in self._members]
+
+    def _ordered_members(self) -> list[_PoolMember]:
+        """Members by ascending in-flight count, rotating the start for ties."""
+        start = self._next
+        self._next = (self._next + 1) % len(self._members)
+        rotated = self._members[start:] + self._members[:start]
+        return sorted(rotated, key=lambda m: m.in_flight)
+
+    async def complete(
+        self,
+        messages: list[Message],
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+        json_mode: bool = False,
+    ) -> CompletionResponse:
+        """
+        Complete on the least busy endpoint, failing over on errors.
+
+        Raises:
+            ProviderError: If every endpoint fails.
+        """
+        errors: list[str] = []
+        for member in self._ordered_members():
+            # Counted before waiting on the semaphore so queued calls spread out
+            member.in_flight += 1
+            try:
+                async with member.semaphore:
+                    return await member.provider.complete(
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        json_mode=json_mode,
+                    )
+            except ProviderError as e:
+                errors.append(str(e))
+            finally:
+                member.in_flight -= 1
+        raise ProviderError(f"All pooled providers failed: {'; '.join(errors)}")
+
+    async def stream(
+        self,
+        messages: list[Message],
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+        json_mode: bool = False,
+    ) -> AsyncIterator[str]:
+        """Stream from the least busy endpoint (no failover mid-stream)."""
+        member = self._ordered_members()[0]
+        member.in_flight += 1
+        try:
+            async with member.semaphore:
+                async for chunk in member.provider.stream(
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    json_mode=json_mode,
+                ):
+                    yield chunk
+        finally:
+            member.in_flight -= 1
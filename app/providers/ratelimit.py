@@ -0,0 +1,260 @@
+"""
+Provider Rate Limiting
+
+Shared per-provider rate limiter and retry-with-backoff wrapper.
+
+All agents using the same provider share one limiter, so concurrent batch
+work stays under the provider's request rate instead of triggering 429s.
+
+Configuration (see ProviderConfig):
+    PROVIDER_RATE_LIMIT: Max requests per second per provider (default 5)
+    PROVIDER_MAX_RETRIES: Attempts for transient errors (default 3)
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import AsyncIterator, Awaitable, Callable, TypeVar
+
+from .base import LLMProvider, Message, CompletionResponse, ProviderError
+from .config import get_config
+
+T = TypeVar("T")
+
+# Substrings identifying transient provider errors
+_TRANSIENT_MARKERS = (
+    "429",
+    "rate limit",
+    "resource_exhausted",
+    "overloaded",
+    "503",
+    "timeout",
+)
+
+
+class AsyncRateLimiter:
+    """
+    Async rate limiter spacing acquisitions evenly over time.
+
+    Safe to share across event loops and threads (no asyncio primitives).
+
+    Usage:
+        limiter = AsyncRateLimiter(max_rate=5, time_period=1.0)
+        async with limiter:
+            await provider.complete(...)
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 1.0):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_rate: Requests allowed per time_period (<= 0 disables limiting).
+            time_period: Period in seconds.
+        """
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._interval = time_period / max_rate if max_rate > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until the next request slot is available."""
+        if not self._interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        wait = slot - now
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    Check whether an error is worth retrying.
+
+    Args:
+        error: Exception raised by a provider call.
+
+    Returns:
+        True for timeouts, connection errors, rate limits and 5xx overloads.
+    """
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    status = getattr(error, "status_code", None)
+    if isinstance(status, int) and (status == 429 or status >= 500):
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in _TRANSIENT_MARKERS)
+
+
+async def call_with_retry(
+    func: Callable[[], Awaitable[T]],
+    max_attempts: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+) -> T:
+    """
+    Await func(), retrying transient errors with exponential backoff.
+
+    Uses full jitter: sleeps a random time in [0, min(max_delay, base_delay * 2^attempt)].
+
+    Args:
+        func: Zero-arg callable returning the awaitable to run.
+        max_attempts: Total attempts before giving up.
+        base_delay: Initial backoff in seconds.
+        max_delay: Backoff ceiling in seconds.
+
+    Returns:
+        Result of func().
+
+    Raises:
+        The last exception if attempts are exhausted or the error is not transient.
+    """
+    for attempt in range(max_attempts):
+        try:
+            return await func()
+        except Exception as e:
+            if attempt >= max_attempts - 1 or not is_transient_error(e):
+                raise
+            await asyncio.sleep(random.uniform(0, min(max_delay, base_delay * 2**attempt)))
+    raise RuntimeError("call_with_retry requires max_attempts >= 1")
+
+
+# Shared limiters, one per provider name
+_limiters: dict[str, AsyncRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider_name: str) -> AsyncRateLimiter:
+    """
+    Get or create the shared limiter for a provider.
+
+    Args:
+        provider_name: Provider identifier ("gemini", "claude", ...).
+
+    Returns:
+        AsyncRateLimiter shared by all callers of this provider.
+    """
+    with _limiters_lock:
+        if provider_name not in _limiters:
+            _limiters[provider_name] = AsyncRateLimiter(
+                max_rate=get_config().provider_rate_limit,
+            )
+        return _limiters[provider_name]
+
+
+class RateLimitedProvider(LLMProvider):
+    """
+    Provider wrapper applying the shared rate limiter and retries.
+
+    Example:
+        provider = RateLimitedProvider(get_provider("claude"))
+        response = await provider.complete(messages)
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        limiter: AsyncRateLimiter | None = None,
+        max_attempts: int | None = None,
+    ):
+        """
+        Wrap a provider.
+
+        Args:
+            provider: Provider to wrap.
+            limiter: Optional limiter (defaults to the shared one for the provider).
+            max_attempts: Optional retry attempts (defaults to PROVIDER_MAX_RETRIES).
+        """
+        self._wrapped = provider
+        self._limiter = limiter or get_rate_limiter(provider.name)
+        self._max_attempts = max_attempts or get_config().provider_max_retries
+
+    @property
+    def name(self) -> str:
+        return self._wrapped.name
+
+    @property
+    def model(self) -> str:
+        return self._wrapped.model
+
+    @property
+    def supports_streaming(self) -> bool:
+        return self._wrapped.supports_streaming
+
+    @property
+    def wrapped(self) -> LLMProvider:
+        """Get the underlying provider."""
+        return self._wrapped
+
+    async def complete(
+        self,
+        messages: list[Message],
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+        json_mode: bool = False,
+    ) -> CompletionResponse:
+        """
+        Rate-limited completion with retry on transient errors.
+
+        Raises:
+            ProviderError: If the call still fails after retries.
+        """
+
+        async def _attempt() -> CompletionResponse:
+            async with self._limiter:
+                return await self._wrapped.complete(
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    json_mode=json_mode,
+                )
+
+        try:
+            return await call_with_retry(_attempt, max_attempts=self._max_attempts)
+        except ProviderError:
+            raise
+        except Exception as e:
+            raise ProviderError(f"{self.name} completion failed: {e}") from e
+
+    async def stream(
+        self,
+        messages: list[Message],
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+        json_mode: bool = False,
+    ) -> AsyncIterator[str]:
+        """
+        Rate-limited streaming (not retried once chunks are emitted).
+
+        Raises:
+            NotImplementedError: If the wrapped provider cannot stream.
+            ProviderError: If the stream fails.
+        """
+        if not self._wrapped.supports_streaming:
+            # Checked before acquiring, so a fallback call is not limited twice
+            raise NotImplementedError(f"{self.name} does not support streaming")
+        await self._limiter.acquire()
+        try:
+            async for chunk in self._wrapped.stream(
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                json_mode=json_mode,
+            ):
+                yield chunk
+        except (NotImplementedError, ProviderError):
+            raise
+        except Exception as e:
+            raise ProviderError(f"{self.name} stream failed: {e}") from e
@@ -6,6 +6,7 @@ Single user identification via UUID (cookie-based).
 Minimal session state - Redis handles persistence.
 """
 
+import json
 import os
 import uuid
 import streamlit as st
@@ -15,8 +16,7 @@ from app.providers.config import GEMINI_MODELS
 from app.i18n import _, language_selector, get_language
 from app.services import PresentationLogger
 
-# TODO: Replace with actual Redis client when implemented
-# from app.data.redis_client import get_redis_connection
+from app.data.redis_client import RedisKeys
 
 # Sidebar logger
 _logger = PresentationLogger("sidebar")
@@ -354,25 +354,27 @@ class SessionManager:
     """
     Manages user sessions in Redis.
 
-    Redis Keys:
-        session:{user_id} -> Hash with session data
-        chat:{user_id}:{thread_id} -> List of chat messages
+    Redis Keys (built by RedisKeys, user ids replaced by their tag):
+        session:{tag} -> Hash with session data
+        chat:{tag}:{thread_id} -> List of chat messages
+        chat:{tag}:{thread_id}:seq -> Count of messages ever appended
     """
 
     TTL_SESSION = 86400  # 24 hours
     TTL_CHAT = 604800  # 7 days
+    CHAT_MAX_MESSAGES = 200  # Older messages are trimmed
 
     @staticmethod
     def save_session(r, user_id: str, data: dict) -> None:
         """Save session data to Redis."""
-        key = f"session:{user_id}"
+        key = RedisKeys.session(user_id)
         r.hset(key, mapping=data)
         r.expire(key, SessionManager.TTL_SESSION)
 
     @staticmethod
     def load_session(r, user_id: str) -> Optional[dict]:
         """Load session data from Redis."""
-        key = f"session:{user_id}"
+        key = RedisKeys.session(user_id)
         data = r.hgetall(key)
         return data if data else None
 
@@ -381,18 +383,45 @@ class SessionManager:
         r, user_id: str, thread_id: str, role: str, content: str
     ) -> None:
         """Append a message to chat history."""
-        import json
+        SessionManager.save_chat_messages(
+            r, user_id, thread_id, [{"role": role, "content": content}]
+        )
 
-        key = f"chat:{user_id}:{thread_id}"
-        message = json.dumps({"role": role, "content": content})
-        r.rpush(key, message)
-        r.expire(key, SessionManager.TTL_CHAT)
+    @staticmethod
+    def save_chat_messages(r, user_id: str, thread_id: str, messages: list[dict]) -> None:
+        """
+        Append messages (e.g. a user/assistant turn) to chat history.
+
+        Push, trim to the last CHAT_MAX_MESSAGES, append counter bump and
+        expiry refresh go in one pipelined round trip.
+        """
+        if not messages:
+            return
+        key = RedisKeys.chat_history(user_id, thread_id)
+        seq_key = RedisKeys.chat_seq(user_id, thread_id)
+        pipe = r.pipeline(transaction=False)
+        pipe.rpush(key, *(json.dumps(message) for message in messages))
+        pipe.ltrim(key, -SessionManager.CHAT_MAX_MESSAGES, -1)
+        pipe.expire(key, SessionManager.TTL_CHAT)
+        pipe.incrby(seq_key, len(messages))
+        pipe.expire(seq_key, SessionManager.TTL_CHAT)
+        pipe.execute()
 
     @staticmethod
     def load_chat_history(r, user_id: str, thread_id: str) -> list:
-        """Load chat history from Redis."""
-        import json
+        """
+        Load chat history from Redis (oldest first).
+
+        Reruns only read the append counter; the list itself is fetched again
+        once new messages were saved (or after the cache TTL).
+        """
+        seq = r.get(RedisKeys.chat_seq(user_id, thread_id))
+        return _cached_chat_history(r, user_id, thread_id, seq)
+
 
-        key = f"chat:{user_id}:{thread_id}"
-        messages = r.lrange(key, 0, -1)
-        return [json.loads(msg) for msg in messages] if messages else []
+@st.cache_data(ttl=60, max_entries=256, show_spinner=False)
+def _cached_chat_history(_r, user_id: str, thread_id: str, seq) -> list:
+    """Chat history as of an append count (seq only keys the cache)."""
+    key = RedisKeys.chat_history(user_id, thread_id)
+    messages = _r.lrange(key, -SessionManager.CHAT_MAX_MESSAGES, -1)
+    return [json.loads(msg) for msg in messages]
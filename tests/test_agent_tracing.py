@@ -0,0 +1,252 @@
+# tests/test_agent_tracing.py
+"""
+Unit tests for background trace export.
+"""
+
+import asyncio
+
+from app.agents.tracing import AgentTracer, DummySpan
+from app.agents.tracing.queue import AsyncSpanQueue
+
+
+class TestAsyncSpanQueue:
+    """Test the background trace queue."""
+
+    def test_enqueue_outside_loop_is_refused(self):
+        """Test that callers without an event loop are told to send inline."""
+        queue = AsyncSpanQueue(send=lambda payload: None)
+
+        assert queue.enqueue({"name": "t"}) is False
+
+    def test_shutdown_drains_in_batches(self):
+        """Test that queued payloads are all sent before shutdown returns."""
+        sent = []
+        queue = AsyncSpanQueue(send=sent.append, batch_max=2, flush_interval=0.01)
+
+        async def run():
+            for i in range(5):
+                assert queue.enqueue({"name": str(i)})
+            await queue.shutdown(timeout=1)
+
+        asyncio.run(run())
+
+        assert sorted(p["name"] for p in sent) == ["0", "1", "2", "3", "4"]
+
+    def test_full_queue_drops(self):
+        """Test that enqueue never blocks when the queue is full."""
+        queue = AsyncSpanQueue(send=lambda payload: None, maxsize=1)
+
+        async def run():
+            queue.enqueue({"name": "a"})
+            queue.enqueue({"name": "b"})
+            await queue.shutdown(timeout=1)
+
+        asyncio.run(run())
+
+        assert queue.dropped == 1
+
+
+class TestDisabledTracer:
+    """Test the no-op path when Opik is not configured."""
+
+    def test_span_reuses_shared_dummy(self, monkeypatch):
+        """Test that disabled spans and traces allocate no new context."""
+        monkeypatch.delenv("OPIK_API_KEY", raising=False)
+        tracer = AgentTracer()
+
+        with tracer.start_trace("validate") as trace:
+            with tracer.span("step") as span:
+                span.update(output={})
+
+        assert trace is None
+        assert isinstance(span, DummySpan)
+        assert tracer.span("a") is tracer.span("b")
+        assert span.add_tags(["x"]) is None
+
+
+class TestTraceExport:
+    """Test AgentTracer.trace() hand-off to the background queue."""
+
+    def test_queued_trace_sent_as_plain_dicts(self, monkeypatch):
+        """Test that traces recorded in a loop reach the client after shutdown."""
+        monkeypatch.delenv("OPIK_API_KEY", raising=False)
+        sent = []
+
+        class FakeClient:
+            def trace(self, **kwargs):
+                sent.append(kwargs)
+
+        tracer = AgentTracer()
+        tracer.enabled, tracer._client = True, FakeClient()
+        metadata = {"agent": "forseti"}
+
+        async def run():
+            assert tracer.trace("t", input={"a": 1}, output={}, metadata=metadata) is None
+            await tracer.shutdown(timeout=1)
+
+        asyncio.run(run())
+
+        assert sent[0]["input"] == {"a": 1}
+        assert type(sent[0]["metadata"]) is dict
+
+    def test_payload_converted_to_json_types(self, monkeypatch):
+        """Test that tuples and dataclasses reach the SDK as lists and dicts."""
+        from app.agents.forseti.models import BatchResult
+
+        monkeypatch.delenv("OPIK_API_KEY", raising=False)
+        sent = []
+
+        class FakeClient:
+            def trace(self, **kwargs):
+                sent.append(kwargs)
+
+        tracer = AgentTracer()
+        tracer.enabled, tracer._client = True, FakeClient()
+
+        tracer.trace("t", input={"ids": ("a", "b")}, output={"result": BatchResult(id="a")})
+
+        assert sent[0]["input"] == {"ids": ["a", "b"]}
+        assert sent[0]["output"]["result"]["violations"] == []
+
+    def test_dataset_handle_reused(self, monkeypatch):
+        """Test that repeated inserts look the dataset up only once."""
+        monkeypatch.delenv("OPIK_API_KEY", raising=False)
+        lookups = []
+
+        class FakeDataset:
+            def insert(self, items):
+                pass
+
+        class FakeClient:
+            def get_or_create_dataset(self, name, description=None):
+                lookups.append(name)
+                return FakeDataset()
+
+        tracer = AgentTracer()
+        tracer.enabled, tracer._client = True, FakeClient()
+
+        assert tracer.add_to_dataset("charter", [{"input": {}}])
+        assert tracer.add_to_dataset("charter", [{"input": {}}])
+        assert lookups == ["charter"]
+
+    def test_feedback_sent_in_one_batch(self, monkeypatch):
+        """Test that feedback logged inside a loop goes out in a single call."""
+        monkeypatch.delenv("OPIK_API_KEY", raising=False)
+        calls = []
+
+        class FakeClient:
+            def log_traces_feedback_scores(self, scores):
+                calls.append([score["id"] for score in scores])
+
+        tracer = AgentTracer()
+        tracer.enabled, tracer._client = True, FakeClient()
+
+        async def run():
+            for i in range(3):
+                assert tracer.log_feedback(f"t{i}", score=1.0)
+            assert calls == []
+            assert tracer.flush_feedback()
+
+        asyncio.run(run())
+
+        assert calls == [["t0", "t1", "t2"]]
+
+    def test_feedback_sent_at_once_without_loop(self, monkeypatch):
+        """Test that sync callers get the outcome of the send."""
+        monkeypatch.delenv("OPIK_API_KEY", raising=False)
+
+        class FailingClient:
+            def log_traces_feedback_scores(self, scores):
+                raise ConnectionError("offline")
+
+        tracer = AgentTracer()
+        tracer.enabled, tracer._client = True, FailingClient()
+
+        assert tracer.log_feedback("t0", score=1.0) is False
+
+    def test_feedback_timer_rescheduled_on_new_loop(self, monkeypatch):
+        """Test that feedback buffered on a closed loop is flushed by the next one."""
+        from app.agents.tracing import opik as opik_module
+
+        monkeypatch.delenv("OPIK_API_KEY", raising=False)
+        monkeypatch.setattr(opik_module, "FEEDBACK_FLUSH_S", 0.01)
+        calls = []
+
+        class FakeClient:
+            def log_traces_feedback_scores(self, scores):
+                calls.append([score["id"] for score in scores])
+
+        tracer = AgentTracer()
+        tracer.enabled, tracer._client = True, FakeClient()
+
+        async def log(trace_id, wait):
+            tracer.log_feedback(trace_id, score=1.0)
+            await asyncio.sleep(wait)
+
+        asyncio.run(log("t0", 0))  # Loop closes before its timer fires
+        asyncio.run(log("t1", 0.05))
+
+        assert calls == [["t0", "t1"]]
+
+    def test_spans_use_sdk_context_managers(self, monkeypatch):
+        """Test that traces and spans go through start_as_current_* when available."""
+        from contextlib import contextmanager
+        from types import SimpleNamespace
+
+        monkeypatch.delenv("OPIK_API_KEY", raising=False)
+        opened = []
+
+        @contextmanager
+        def start(name, **kwargs):
+            opened.append(name)
+            yield SimpleNamespace(update=lambda **kw: None)
+
+        tracer = AgentTracer()
+        tracer.enabled, tracer._client = True, object()
+        tracer._opik_module = SimpleNamespace(start_as_current_trace=start, start_as_current_span=start)
+
+        with tracer.start_trace("validate"):
+            with tracer.span("charter_check") as span:
+                span.update(output={})
+
+        assert opened == ["validate", "charter_check"]
+        assert tracer._current_trace is None
+
+    def test_concurrent_traces_keep_their_spans(self, monkeypatch):
+        """Test that overlapping traces on one tracer do not share the current trace."""
+        monkeypatch.delenv("OPIK_API_KEY", raising=False)
+
+        class FakeTrace:
+            def __init__(self, name):
+                self.name, self.spans = name, []
+
+            def span(self, name, **kwargs):
+                self.spans.append(name)
+                return self
+
+        traces = []
+
+        class FakeClient:
+            def trace(self, name, **kwargs):
+                traces.append(FakeTrace(name))
+                return traces[-1]
+
+        tracer = AgentTracer()
+        tracer.enabled, tracer._client = True, FakeClient()
+
+        async def validate(name, delay):
+            with tracer.start_trace(name):
+                await asyncio.sleep(delay)
+                with tracer.span(f"{name}_step"):
+                    pass
+
+        async def run():
+            await asyncio.gather(validate("fast", 0.0), validate("slow", 0.02))
+
+        asyncio.run(run())
+
+        assert {t.name: t.spans for t in traces} == {
+            "fast": ["fast_step"],
+            "slow": ["slow_step"],
+        }
+        assert tracer._current_trace is None
@@ -0,0 +1,599 @@
+# tests/test_forseti_agent.py
+"""
+Unit tests for the Forseti 461 agent (no network, fake provider).
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from app.providers import LLMProvider, CompletionResponse, Message
+from app.agents.forseti import ForsetiAgent, BatchItem
+from app.agents.forseti.models import BatchResponse, FullValidationResult
+from app.agents.tracing import AgentTracer
+from app.agents.forseti.features import get_program_cache
+from app.providers import ratelimit
+from app.agents.forseti.cache import (
+    SemanticCache,
+    get_response_cache,
+    get_semantic_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def _no_rate_limit(monkeypatch):
+    monkeypatch.setitem(ratelimit._limiters, "fake", ratelimit.AsyncRateLimiter(max_rate=0))
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    get_response_cache().clear()
+    get_semantic_cache().clear()
+    get_program_cache().clear()
+    yield
+    get_response_cache().clear()
+    get_semantic_cache().clear()
+    get_program_cache().clear()
+
+
+class FakeProvider(LLMProvider):
+    """Provider returning canned JSON depending on the prompt."""
+
+    def __init__(self, delay: float = 0.0):
+        self.calls = []
+        self._delay = delay
+
+    @property
+    def name(self) -> str:
+        return "fake"
+
+    @property
+    def model(self) -> str:
+        return "fake-model"
+
+    async def complete(self, messages, temperature=0.7, max_tokens=None, json_mode=False):
+        prompt = messages[-1].content
+        self.calls.append(prompt)
+        await asyncio.sleep(self._delay)
+        category = {"category": "culture", "reasoning": "events", "confidence": 0.8}
+        charter = {
+            "is_valid": True,
+            "violations": [],
+            "encouraged_aspects": ["Constructive criticism"],
+            "reasoning": "ok",
+            "confidence": 0.9,
+        }
+        if "ITEMS TO VALIDATE:" in prompt:
+            items = json.loads(prompt.split("ITEMS TO VALIDATE:", 1)[1])
+            data = {"results": [{**charter, "id": i["id"], "category": "culture"} for i in items]}
+        elif '"charter"' in prompt:
+            data = {"charter": charter, "category": category}
+        elif "classifying" in prompt:
+            data = category
+        else:
+            data = charter
+        return CompletionResponse(content=json.dumps(data), model=self.model)
+
+
+def _disabled_tracer() -> AgentTracer:
+    tracer = AgentTracer.__new__(AgentTracer)
+    tracer.enabled = False
+    tracer._client = None
+    tracer._current_trace = None
+    return tracer
+
+
+class TestValidate:
+    """Test ForsetiAgent.validate()."""
+
+    def test_validate_combines_charter_and_category(self):
+        """Test that both features run and results are merged."""
+        provider = FakeProvider()
+        agent = ForsetiAgent(provider=provider, tracer=_disabled_tracer())
+
+        result = asyncio.run(agent.validate(title="Fête", body="Un festival au port"))
+
+        assert result.is_valid is True
+        assert result.category == "culture"
+        assert result.confidence == 0.8
+
+    def test_validate_uses_single_llm_call(self):
+        """Test that charter and classification are fused into one call."""
+        provider = FakeProvider()
+        agent = ForsetiAgent(provider=provider, tracer=_disabled_tracer())
+
+        asyncio.run(agent.validate(title="t", body="b", category="logement"))
+
+        assert len(provider.calls) == 1
+        assert "CURRENT CATEGORY: logement" in provider.calls[0]
+
+    def test_standalone_features_still_available(self):
+        """Test that charter-only and classify-only calls still work."""
+        provider = FakeProvider()
+        agent = ForsetiAgent(provider=provider, tracer=_disabled_tracer())
+
+        charter = asyncio.run(agent.validate_charter(title="t", body="b"))
+        classification = asyncio.run(agent.classify_category(title="t", body="b"))
+
+        assert charter.is_valid is True
+        assert classification.category == "culture"
+
+    def test_validate_stream_yields_reasoning_then_result(self):
+        """Test that reasoning text is streamed before the final result."""
+
+        provider = StreamingProvider({
+            "charter": {"is_valid": True, "reasoning": "ok", "confidence": 0.9},
+            "category": {"category": "culture", "reasoning": "events", "confidence": 0.8},
+        })
+        agent = ForsetiAgent(provider=provider, tracer=_disabled_tracer())
+
+        async def collect():
+            return [item async for item in agent.validate_stream(title="t", body="b")]
+
+        items = asyncio.run(collect())
+
+        assert provider.json_modes == [True]
+        assert "".join(items[:-1]) == "ok\n\nevents"
+        assert isinstance(items[-1], FullValidationResult)
+        assert items[-1].category == "culture"
+
+    def test_validate_stream_without_provider_streaming(self):
+        """Test that providers without stream() yield only the result."""
+        agent = ForsetiAgent(provider=FakeProvider(), tracer=_disabled_tracer())
+
+        async def collect():
+            return [item async for item in agent.validate_stream(title="t", body="b")]
+
+        items = asyncio.run(collect())
+
+        assert len(items) == 1
+        assert items[0].is_valid is True
+
+
+class TestResponseCache:
+    """Test the content-hash response cache."""
+
+    def test_identical_request_served_from_cache(self):
+        """Test that a repeated validation does not call the provider again."""
+        provider = FakeProvider()
+        agent = ForsetiAgent(provider=provider, tracer=_disabled_tracer())
+
+        first = asyncio.run(agent.validate(title="t", body="b"))
+        second = asyncio.run(agent.validate(title="t", body="b"))
+
+        assert len(provider.calls) == 1
+        assert first == second
+
+    def test_different_body_misses_cache(self):
+        """Test that any change in the contribution triggers a new call."""
+        provider = FakeProvider()
+        agent = ForsetiAgent(provider=provider, tracer=_disabled_tracer())
+
+        asyncio.run(agent.validate(title="Parking", body="Manque de places au port"))
+        asyncio.run(agent.validate(title="École", body="Rénover la cantine"))
+
+        assert len(provider.calls) == 2
+
+    def test_deterministic_feature_runs_at_zero_temperature(self):
+        """Test that deterministic features force temperature 0 and replay from cache."""
+        from app.agents.forseti.features import CharterValidationFeature
+
+        temperatures = []
+
+        class RecordingProvider(FakeProvider):
+            async def complete(self, messages, temperature=0.7, **kwargs):
+                temperatures.append(temperature)
+                return await super().complete(messages, temperature, **kwargs)
+
+        provider = RecordingProvider()
+        feature = CharterValidationFeature()
+        system = Message(role="system", content="sys")
+        for _ in range(2):
+            asyncio.run(feature._get_json_response(provider, system, "user", temperature=0.3))
+
+        assert temperatures == [0.0]
+
+    def test_cache_opt_out(self):
+        """Test that cache_responses = False always calls the provider."""
+        from app.agents.forseti.features import CharterValidationFeature
+
+        class ExperimentalFeature(CharterValidationFeature):
+            __slots__ = ()
+            cache_responses = False
+
+        provider = FakeProvider()
+        feature = ExperimentalFeature()
+        for _ in range(2):
+            asyncio.run(feature._get_json_response(provider, Message(role="system", content="sys"), "user"))
+
+        assert len(provider.calls) == 2
+
+
+class TestVerdictReuse:
+    """Test that validation verdicts are not shared between different texts."""
+
+    def test_edited_contribution_is_revalidated(self):
+        """Test that an appended sentence triggers a new LLM call."""
+        provider = FakeProvider()
+        agent = ForsetiAgent(provider=provider, tracer=_disabled_tracer())
+        body = (
+            "Un festival de musique sur le port cet été, avec des concerts gratuits "
+            "pour les habitants et les visiteurs, organisé avec les associations "
+            "locales et les commerçants du quartier."
+        )
+
+        asyncio.run(agent.validate(title="Fête", body=body))
+        asyncio.run(
+            agent.validate(
+                title="Fête", body=body + " Le maire est un incompétent et un voleur."
+            )
+        )
+
+        assert len(provider.calls) == 2
+
+    def test_current_category_is_part_of_the_key(self):
+        """Test that the same text with another current category is revalidated."""
+        provider = FakeProvider()
+        agent = ForsetiAgent(provider=provider, tracer=_disabled_tracer())
+        body = "Un festival de musique sur le port cet été, avec des concerts gratuits."
+
+        asyncio.run(agent.validate(title="Fête", body=body, category="culture"))
+        asyncio.run(agent.validate(title="Fête", body=body, category="culture"))
+        asyncio.run(agent.validate(title="Fête", body=body, category="economie"))
+
+        assert len(provider.calls) == 2
+
+
+class TestSemanticCache:
+    """Test normalized-text lookups."""
+
+    def test_same_normalized_text_hits(self):
+        """Test that only the same text up to case and whitespace hits."""
+        cache = SemanticCache()
+        cache.store("charter", "Je propose de rénover le port.", {"ok": 1}, 0.9)
+
+        assert cache.lookup("charter", "je propose  de rénover le port.") == {"ok": 1}
+        assert cache.lookup("charter", "Je refuse de rénover le port.") is None
+        assert (
+            cache.lookup(
+                "charter",
+                "Je propose de rénover le port. Le maire est un incompétent et un voleur.",
+            )
+            is None
+        )
+        assert cache.lookup("category", "Je propose de rénover le port.") is None
+
+    def test_low_confidence_not_stored(self):
+        """Test that uncertain results are never reused."""
+        cache = SemanticCache(min_confidence=0.8)
+        cache.store("charter", "texte", {"ok": 1}, 0.5)
+
+        assert cache.lookup("charter", "texte") is None
+
+    def test_evicts_least_recently_used(self):
+        """Test that only the most recent entries are kept."""
+        cache = SemanticCache(max_size=1)
+        cache.store("charter", "premier texte assez long", {"n": 1}, 0.9)
+        cache.store("charter", "second message différent", {"n": 2}, 0.9)
+
+        assert cache.lookup("charter", "premier texte assez long") is None
+
+
+class TestValidateBatch:
+    """Test ForsetiAgent.validate_batch()."""
+
+    def test_duplicates_folded_and_expanded(self):
+        """Test that duplicates are sent once but every item gets a result."""
+        provider = FakeProvider()
+        agent = ForsetiAgent(provider=provider, tracer=_disabled_tracer())
+        items = [
+            BatchItem(id="a", title="Parking", body="Le port manque de places en été"),
+            BatchItem(id="b", title="École", body="Rénover la cantine scolaire"),
+            BatchItem(id="c", title="parking", body="Le port  manque de places en été"),
+        ]
+
+        results = asyncio.run(agent.validate_batch(items))
+
+        sent = json.loads(provider.calls[0].split("ITEMS TO VALIDATE:", 1)[1])
+        assert [i["id"] for i in sent] == ["a", "b"]
+        assert [r.id for r in results] == ["a", "b", "c"]
+
+    def test_near_duplicates_validated_separately(self):
+        """Test that an edited variant is not folded onto the original."""
+        provider = FakeProvider()
+        agent = ForsetiAgent(provider=provider, tracer=_disabled_tracer())
+        body = "Le port manque de places de stationnement en été, il faut agrandir le parking."
+        items = [
+            BatchItem(id="a", title="Parking", body=body),
+            BatchItem(id="b", title="Parking", body=body + " Le maire est un voleur."),
+        ]
+
+        asyncio.run(agent.validate_batch(items))
+
+        sent = json.loads(provider.calls[0].split("ITEMS TO VALIDATE:", 1)[1])
+        assert [i["id"] for i in sent] == ["a", "b"]
+
+    def test_large_batch_split_into_sub_batches(self):
+        """Test that sub-batches are sent separately and results keep input order."""
+        provider = FakeProvider()
+        agent = ForsetiAgent(provider=provider, tracer=_disabled_tracer())
+        topics = ["port", "école", "cantine", "musée", "plage", "forêt", "marché",
+                  "vélo", "bus", "piscine", "théâtre", "phare"]
+        items = [
+            BatchItem(id=str(i), title=topic, body=f"Proposition numéro {i} sur {topic} " * 3)
+            for i, topic in enumerate(topics)
+        ]
+
+        results = asyncio.run(agent.validate_batch(items))
+
+        assert len(provider.calls) == 2
+        assert [r.id for r in results] == [item.id for item in items]
+
+    def test_checkpoint_skips_done_items(self, tmp_path):
+        """Test that a resumed run only re-sends unfinished items."""
+        checkpoint = tmp_path / "batch.jsonl"
+        items = [
+            BatchItem(id="a", title="Parking", body="Le port manque de places en été"),
+            BatchItem(id="b", title="École", body="Rénover la cantine scolaire"),
+        ]
+
+        first = FakeProvider()
+        agent = ForsetiAgent(provider=first, tracer=_disabled_tracer())
+        asyncio.run(agent.validate_batch(items[:1], output_jsonl=checkpoint))
+
+        second = FakeProvider()
+        agent = ForsetiAgent(provider=second, tracer=_disabled_tracer())
+        results = asyncio.run(agent.validate_batch(items, output_jsonl=checkpoint))
+
+        sent = json.loads(second.calls[0].split("ITEMS TO VALIDATE:", 1)[1])
+        assert [i["id"] for i in sent] == ["b"]
+        assert [r.id for r in results] == ["a", "b"]
+        assert len(checkpoint.read_text().splitlines()) == 2
+
+    def test_items_skipped_by_llm_get_fallback(self):
+        """Test that an item missing from the LLM output still gets a result."""
+
+        class SkippingProvider(FakeProvider):
+            async def complete(self, messages, **kwargs):
+                response = await super().complete(messages, **kwargs)
+                data = json.loads(response.content)
+                data["results"] = data["results"][:1]
+                return CompletionResponse(content=json.dumps(data), model=self.model)
+
+        agent = ForsetiAgent(provider=SkippingProvider(), tracer=_disabled_tracer())
+        items = [
+            BatchItem(id="a", title="Parking", body="Le port manque de places en été"),
+            BatchItem(id="b", title="École", body="Rénover la cantine scolaire"),
+        ]
+
+        results = asyncio.run(agent.validate_batch(items))
+
+        assert [r.id for r in results] == ["a", "b"]
+        assert results[1].reasoning.startswith("Batch error")
+
+    def test_out_of_range_confidence_clamped(self):
+        """Test that LLM batch confidences are clamped rather than rejected."""
+        response = BatchResponse.model_validate_json(
+            '{"results":[{"id":"a","confidence":1.7},{"id":"b","confidence":-0.2}]}'
+        )
+
+        assert [r.confidence for r in response.results] == [1.0, 0.0]
+
+
+class TestExecuteAll:
+    """Test BaseAgent.execute_all()."""
+
+    def test_all_features_run_concurrently(self):
+        """Test that registered features overlap and results are keyed by name."""
+        provider = FakeProvider(delay=0.2)
+        agent = ForsetiAgent(provider=provider, tracer=_disabled_tracer())
+
+        loop = asyncio.new_event_loop()
+        try:
+            start = loop.time()
+            results = loop.run_until_complete(agent.execute_all(title="t", body="b"))
+            elapsed = loop.time() - start
+        finally:
+            loop.close()
+
+        assert set(results) == set(agent.features)
+        assert elapsed < 0.5
+
+
+class TestProgramCache:
+    """Test rule programs that bypass the LLM."""
+
+    def test_admitted_rule_skips_llm(self):
+        """Test that a contribution matched by an admitted rule needs no provider call."""
+        import re
+        from app.agents.forseti.features import ProgramRule, get_program_cache
+
+        rule = ProgramRule(
+            name="casino_spam",
+            pattern=re.compile(
+                r"bonus de bienvenue.*casino|casino.*bonus de bienvenue", re.IGNORECASE
+            ),
+            is_valid=False,
+            violation="Spam or advertising",
+        )
+        assert get_program_cache().admit(
+            rule,
+            [
+                ("Bonus", "Casino : bonus de bienvenue de 500 €", False),
+                ("Jeunes", "Prévenir l'addiction des jeunes au casino en ligne", True),
+            ],
+        )
+        provider = FakeProvider()
+        agent = ForsetiAgent(provider=provider, tracer=_disabled_tracer())
+
+        result = asyncio.run(
+            agent.validate_charter(title="Offre", body="Casino : bonus de bienvenue offert")
+        )
+
+        assert result.is_valid is False
+        assert provider.calls == []
+
+    def test_no_builtin_rule_rejects_civic_post(self):
+        """Test that a civic post about online gambling goes to the LLM."""
+        provider = FakeProvider()
+        agent = ForsetiAgent(provider=provider, tracer=_disabled_tracer())
+
+        result = asyncio.run(
+            agent.validate_charter(
+                title="Addiction des jeunes",
+                body="Prévenir l'addiction des jeunes au casino en ligne avec le collège.",
+            )
+        )
+
+        assert result.is_valid is True
+        assert len(provider.calls) == 1
+
+    def test_civic_post_with_link_phrase_goes_to_llm(self):
+        """Test that "cliquez ici" in a legitimate post is not ruled as spam."""
+        provider = FakeProvider()
+        agent = ForsetiAgent(provider=provider, tracer=_disabled_tracer())
+
+        result = asyncio.run(
+            agent.validate_charter(
+                title="Horaires de la médiathèque",
+                body="Pour proposer des horaires élargis, cliquez ici et votez.",
+            )
+        )
+
+        assert result.is_valid is True
+        assert len(provider.calls) == 1
+
+    def test_rule_admitted_only_when_precise(self):
+        """Test that exemplar validation gates rule admission."""
+        import re
+        from app.agents.forseti.features import ProgramCache, ProgramRule
+
+        cache = ProgramCache(min_precision=0.9)
+        rule = ProgramRule(
+            name="port",
+            pattern=re.compile("port"),
+            is_valid=False,
+            violation="Spam or advertising",
+        )
+
+        assert not cache.admit(rule, [("Port", "port de pêche", True)])
+        assert cache.run("Port", "port de pêche") is None
+
+
+class FailingProvider(FakeProvider):
+    """Provider raising a fixed exception on every call."""
+
+    def __init__(self, error: BaseException):
+        super().__init__()
+        self._error = error
+
+    async def complete(self, messages, temperature=0.7, max_tokens=None, json_mode=False):
+        raise self._error
+
+
+class TestFeatureErrors:
+    """Test which feature errors fail open and which propagate."""
+
+    def test_provider_error_fails_open(self):
+        """Test that a failing provider yields a fail-open charter result."""
+        agent = ForsetiAgent(
+            provider=FailingProvider(ValueError("bad request")),
+            tracer=_disabled_tracer(),
+        )
+
+        result = asyncio.run(agent.validate_charter(title="Parking", body="Plus de places"))
+
+        assert result.is_valid is True
+        assert "Validation error" in result.reasoning
+
+    def test_cancellation_propagates(self):
+        """Test that CancelledError is not swallowed by the feature."""
+        agent = ForsetiAgent(
+            provider=FailingProvider(asyncio.CancelledError()),
+            tracer=_disabled_tracer(),
+        )
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(agent.validate_charter(title="Parking", body="Plus de places"))
+
+
+class StreamingProvider(FakeProvider):
+    """Provider streaming a fixed JSON answer in small chunks."""
+
+    supports_streaming = True
+
+    def __init__(self, answer: dict):
+        super().__init__()
+        self._answer = json.dumps(answer)
+        self.chunks_sent = 0
+        self.json_modes = []
+
+    async def stream(self, messages, temperature=0.7, max_tokens=None, json_mode=False):
+        self.calls.append(messages[-1].content)
+        self.json_modes.append(json_mode)
+        for i in range(0, len(self._answer), 8):
+            self.chunks_sent += 1
+            yield self._answer[i : i + 8]
+
+
+class TestCharterEarlyAbort:
+    """Test streaming early-abort in charter validation."""
+
+    def test_stream_stops_at_known_violation(self):
+        """Test that generation stops once a recognized violation is decided."""
+        provider = StreamingProvider({
+            "is_valid": False,
+            "violations": ["False information"],
+            "encouraged_aspects": [],
+            "reasoning": "x" * 400,
+            "confidence": 0.95,
+        })
+        agent = ForsetiAgent(provider=provider, tracer=_disabled_tracer())
+
+        result = asyncio.run(agent.validate_charter(title="Rumeur", body="Le maire a vendu le port"))
+
+        assert result.is_valid is False
+        assert result.violations == ("False information",)
+        assert provider.chunks_sent < len(provider._answer) // 8
+
+    def test_valid_answer_streams_to_end(self):
+        """Test that a valid answer is fully parsed."""
+        provider = StreamingProvider({
+            "is_valid": True,
+            "violations": [],
+            "encouraged_aspects": ["Constructive criticism"],
+            "reasoning": "ok",
+            "confidence": 0.9,
+        })
+        agent = ForsetiAgent(provider=provider, tracer=_disabled_tracer())
+
+        result = asyncio.run(agent.validate_charter(title="Parking", body="Plus de places"))
+
+        assert result.is_valid is True
+        assert result.confidence == 0.9
+
+
+class TestCoalescing:
+    """Test micro-batching of concurrent validate() calls."""
+
+    def test_concurrent_calls_share_one_batch(self):
+        """Test that concurrent coalesced validations issue a single LLM call."""
+        provider = FakeProvider()
+        agent = ForsetiAgent(provider=provider, tracer=_disabled_tracer())
+        texts = [
+            ("Parking", "Manque de places au port"),
+            ("École", "Rénover la cantine"),
+            ("Plage", "Ajouter des poubelles"),
+        ]
+
+        async def run():
+            return await asyncio.gather(
+                *(agent.validate(title=t, body=b, coalesce=True) for t, b in texts)
+            )
+
+        results = asyncio.run(run())
+
+        assert len(provider.calls) == 1
+        assert "ITEMS TO VALIDATE:" in provider.calls[0]
+        assert [r.category for r in results] == ["culture"] * 3
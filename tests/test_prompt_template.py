@@ -0,0 +1,84 @@
+# tests/test_prompt_template.py
+"""
+Unit tests for compiled prompt templates.
+"""
+
+import pytest
+
+from app.prompts.template import CompiledTemplate
+from app.agents.forseti import prompts
+
+
+class TestCompiledTemplate:
+    """Test that compiled templates render like str.format."""
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "CHARTER_VALIDATION",
+            "CATEGORY_CLASSIFICATION",
+            "COMBINED_VALIDATION",
+            "WORDING_CORRECTION",
+            "BATCH_VALIDATION",
+        ],
+    )
+    def test_matches_str_format(self, name):
+        """Test that each Forseti template renders identically to .format()."""
+        template = getattr(prompts, f"{name}_PROMPT")
+        compiled = getattr(prompts, f"{name}_TEMPLATE")
+        values = {field: f"<{field}>" for field in compiled.fields}
+
+        assert compiled.render(values) == template.format(**values)
+
+    def test_escaped_braces_and_missing_field(self):
+        """Test brace escapes and missing values."""
+        compiled = CompiledTemplate('{{"id": "{id}"}}')
+
+        assert compiled(id="7") == '{"id": "7"}'
+        with pytest.raises(KeyError):
+            compiled()
+
+    def test_rejects_format_specs(self):
+        """Test that unsupported fields are rejected at compile time."""
+        with pytest.raises(ValueError):
+            CompiledTemplate("{confidence:.2f}")
+
+
+class TestPromptSchemas:
+    """Test that prompt output examples stay in sync with the models."""
+
+    def test_batch_prompt_lists_batch_result_fields(self):
+        """Test that the batch prompt's JSON example has exactly BatchResult's fields."""
+        import json
+        import re
+
+        from app.agents.forseti.models import BATCH_RESULT_FIELDS, BATCH_RESULT_SCHEMA_JSON
+
+        example = prompts.BATCH_VALIDATION_TEMPLATE(items_json="")
+        item_example = re.search(r'"results":\[\{(.*?)\}\]', example).group(1)
+        keys = tuple(re.findall(r'"(\w+)":', item_example))
+
+        assert keys == BATCH_RESULT_FIELDS
+        assert set(json.loads(BATCH_RESULT_SCHEMA_JSON)["properties"]) == set(keys)
+
+    def test_forseti_prompts_are_reexported_not_redefined(self):
+        """Test that the agent prompts module re-exports the canonical objects."""
+        from app.prompts import constants
+        from app.prompts.local import forseti as canonical
+
+        for name in prompts.__all__:
+            if name.endswith("_PROMPT"):
+                assert getattr(prompts, name) is getattr(canonical, name)
+            elif name.endswith("_TEXT") or name in ("CATEGORIES", "CATEGORY_DESCRIPTIONS"):
+                assert getattr(prompts, name) is getattr(constants, name)
+
+    def test_render_batch_validation_matches_template(self):
+        """Test that the direct batch renderer equals the template rendering."""
+        from app.agents.forseti.models import BatchItem
+
+        items = [BatchItem(id="1", title="Port", body="Réparer le quai {vite}")]
+        items_json = prompts._BATCH_ITEMS_ADAPTER.dump_json(items).decode()
+
+        assert prompts.render_batch_validation(items) == prompts.BATCH_VALIDATION_TEMPLATE(
+            items_json=items_json
+        )
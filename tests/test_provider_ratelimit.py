@@ -0,0 +1,209 @@
+# tests/test_provider_ratelimit.py
+"""
+Unit tests for the shared provider rate limiter and retry policy.
+"""
+
+import asyncio
+
+import pytest
+
+from app.providers.ratelimit import AsyncRateLimiter, call_with_retry, is_transient_error
+
+
+class TestCallWithRetry:
+    """Test retry/backoff behaviour."""
+
+    def test_transient_error_retried(self):
+        """Test that a 429 is retried until success."""
+        attempts = []
+
+        async def flaky():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise RuntimeError("HTTP 429 Too Many Requests")
+            return "ok"
+
+        result = asyncio.run(call_with_retry(flaky, max_attempts=3, base_delay=0.001))
+
+        assert result == "ok"
+        assert len(attempts) == 3
+
+    def test_permanent_error_not_retried(self):
+        """Test that auth errors are raised immediately."""
+        attempts = []
+
+        async def broken():
+            attempts.append(1)
+            raise ValueError("401 invalid API key")
+
+        with pytest.raises(ValueError):
+            asyncio.run(call_with_retry(broken, max_attempts=3, base_delay=0.001))
+
+        assert len(attempts) == 1
+
+    def test_is_transient_error(self):
+        """Test transient error classification."""
+        assert is_transient_error(TimeoutError())
+        assert is_transient_error(RuntimeError("RESOURCE_EXHAUSTED"))
+        assert not is_transient_error(KeyError("category"))
+
+
+class TestAsyncRateLimiter:
+    """Test request spacing."""
+
+    def test_acquisitions_are_spaced(self):
+        """Test that N acquisitions take about (N-1) intervals."""
+        limiter = AsyncRateLimiter(max_rate=20, time_period=1.0)
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            for _ in range(5):
+                async with limiter:
+                    pass
+            return loop.time() - start
+
+        elapsed = asyncio.run(run())
+
+        assert elapsed >= 0.18
+
+    def test_stream_without_support_does_not_acquire(self):
+        """Test that a non-streaming provider is rejected before taking a slot."""
+        from app.providers import CompletionResponse, LLMProvider, RateLimitedProvider
+
+        class NoStream(LLMProvider):
+            name = "nostream"
+            model = "m"
+
+            async def complete(self, messages, temperature=0.7, max_tokens=None, json_mode=False):
+                return CompletionResponse(content="{}", model="m")
+
+        acquired = []
+
+        class CountingLimiter(AsyncRateLimiter):
+            async def acquire(self):
+                acquired.append(1)
+
+        provider = RateLimitedProvider(NoStream(), limiter=CountingLimiter(max_rate=0))
+
+        async def run():
+            async for _ in provider.stream([]):
+                pass
+
+        with pytest.raises(NotImplementedError):
+            asyncio.run(run())
+        assert provider.supports_streaming is False
+        assert acquired == []
+
+
+class TestProviderPool:
+    """Test pooled provider balancing and failover."""
+
+    def _pool(self, *providers):
+        from app.providers import ProviderPool, RateLimitedProvider
+
+        return ProviderPool(
+            [RateLimitedProvider(p, limiter=AsyncRateLimiter(max_rate=0), max_attempts=1) for p in providers]
+        )
+
+    def test_failover_to_next_endpoint(self):
+        """Test that a failing endpoint falls through to a healthy one."""
+        from app.providers import CompletionResponse, LLMProvider
+
+        class Endpoint(LLMProvider):
+            def __init__(self, label, fail=False):
+                self.label, self.fail = label, fail
+
+            @property
+            def name(self):
+                return self.label
+
+            @property
+            def model(self):
+                return "m"
+
+            async def complete(self, messages, temperature=0.7, max_tokens=None, json_mode=False):
+                if self.fail:
+                    raise ValueError("401 unauthorized")
+                return CompletionResponse(content=self.label, model="m")
+
+        pool = self._pool(Endpoint("down", fail=True), Endpoint("up"))
+
+        contents = [asyncio.run(pool.complete([])).content for _ in range(2)]
+
+        assert contents == ["up", "up"]
+
+    def test_members_limited_per_host_without_retries(self):
+        """Test that each Ollama host gets its own limiter and a single attempt."""
+        from app.providers import OllamaProvider, ProviderPool
+
+        pool = ProviderPool(
+            [
+                OllamaProvider(host="http://gpu-1:11434"),
+                OllamaProvider(host="http://gpu-2:11434"),
+            ]
+        )
+        first, second = pool.providers
+
+        assert first._limiter is not second._limiter
+        assert first._max_attempts == second._max_attempts == 1
+
+    def test_waiters_count_as_in_flight(self):
+        """Test that calls queued on an endpoint's semaphore count as in flight."""
+        from app.providers import CompletionResponse, LLMProvider, ProviderPool
+
+        seen = []
+
+        class Endpoint(LLMProvider):
+            @property
+            def name(self):
+                return "slow"
+
+            @property
+            def model(self):
+                return "m"
+
+            async def complete(self, messages, temperature=0.7, max_tokens=None, json_mode=False):
+                await asyncio.sleep(0.01)
+                seen.append(pool._members[0].in_flight)
+                return CompletionResponse(content="ok", model="m")
+
+        pool = ProviderPool([Endpoint()], concurrency_limit=1)
+
+        async def run():
+            await asyncio.gather(pool.complete([]), pool.complete([]))
+
+        asyncio.run(run())
+
+        assert seen == [2, 1]
+
+
+class TestOllamaClient:
+    """Test the pooled Ollama HTTP client lifecycle."""
+
+    def test_client_closed_when_loop_changes(self):
+        """Test that moving to another loop closes the previous client on its loop."""
+        import threading
+
+        from app.providers.ollama import OllamaProvider
+
+        provider = OllamaProvider(host="http://localhost:11434", model="m")
+        other = asyncio.new_event_loop()
+        thread = threading.Thread(target=other.run_forever, daemon=True)
+        thread.start()
+        try:
+
+            async def get_client():
+                return provider._get_client()
+
+            first = asyncio.run_coroutine_threadsafe(get_client(), other).result(5)
+            second = asyncio.run(get_client())
+
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), other).result(5)
+            assert first is not second
+            assert first.is_closed
+            assert not second.is_closed
+        finally:
+            other.call_soon_threadsafe(other.stop)
+            thread.join(5)
+            other.close()
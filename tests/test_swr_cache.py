@@ -0,0 +1,96 @@
+# tests/test_swr_cache.py
+"""
+Unit tests for the stale-while-revalidate cache.
+"""
+
+import threading
+import time
+
+from app.data.swr_cache import StaleWhileRevalidateCache
+
+
+class TestStaleWhileRevalidateCache:
+    """Test serving and refreshing cached values."""
+
+    def test_fresh_hit_does_not_refetch(self):
+        """Test that a hit within soft_ttl returns the cached value."""
+        calls = []
+        cache = StaleWhileRevalidateCache(
+            lambda key: calls.append(key) or len(calls), soft_ttl=60, hard_ttl=600
+        )
+
+        assert cache.get("a") == 1
+        assert cache.get("a") == 1
+        assert calls == ["a"]
+
+    def test_stale_hit_served_then_refreshed(self):
+        """Test that a stale hit returns the old value and refreshes in the background."""
+        calls = []
+        cache = StaleWhileRevalidateCache(
+            lambda key: calls.append(key) or len(calls), soft_ttl=0.05, hard_ttl=600
+        )
+        cache.get("a")
+        time.sleep(0.06)
+
+        assert cache.get("a") == 1
+
+        deadline = time.monotonic() + 2
+        while cache.get("a") != 2 and time.monotonic() < deadline:
+            time.sleep(0.005)
+        assert cache.get("a") == 2
+        assert calls == ["a", "a"]
+
+    def test_uncacheable_result_not_stored(self):
+        """Test that results failing the predicate are refetched next time."""
+        calls = []
+        cache = StaleWhileRevalidateCache(
+            lambda key: calls.append(key) or {"success": False},
+            soft_ttl=60,
+            hard_ttl=600,
+            cacheable=lambda result: result["success"],
+        )
+
+        cache.get("a")
+        cache.get("a")
+
+        assert len(calls) == 2
+
+    def test_invalidate_forces_inline_fetch(self):
+        """Test that invalidating one key refetches only that key."""
+        calls = []
+        cache = StaleWhileRevalidateCache(
+            lambda key: calls.append(key) or key, soft_ttl=60, hard_ttl=600
+        )
+        cache.get("a")
+        cache.get("b")
+
+        cache.invalidate("a")
+        cache.get("a")
+        cache.get("b")
+
+        assert calls == ["a", "b", "a"]
+
+    def test_refresh_started_before_invalidate_is_dropped(self):
+        """Test that a refresh in flight during invalidate does not store its result."""
+        calls = []
+        release = threading.Event()
+
+        def fetch(key):
+            calls.append(key)
+            if len(calls) == 2:
+                release.wait(2)  # The background refresh
+            return len(calls)
+
+        cache = StaleWhileRevalidateCache(fetch, soft_ttl=0.01, hard_ttl=600)
+        cache.get("a")
+        time.sleep(0.02)
+        assert cache.get("a") == 1  # Schedules the refresh
+
+        cache.invalidate("a")
+        release.set()
+        deadline = time.monotonic() + 2
+        while cache._refreshing and time.monotonic() < deadline:
+            time.sleep(0.005)
+
+        assert cache.get("a") == 3
+        assert len(calls) == 3